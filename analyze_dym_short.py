@@ -3,27 +3,51 @@ Comprehensive analysis of DYM/USDT SHORT opportunity.
 """
 import asyncio
 import ccxt.async_support as ccxt
-import pandas as pd
-import pandas_ta as ta
+import numpy as np
 from datetime import datetime
 import os
+import sys
 from dotenv import load_dotenv
 
+from src.agent.tools._indicator_kernels import _last_indicators, warm_kernels
+
 load_dotenv()
 
+# Bybit spot client shared across analyses, so repeated runs in one process
+# keep the connection pool and loaded markets
+_exchange = None
+
+def get_exchange():
+    """Get or create the shared Bybit spot exchange instance."""
+    global _exchange
+    if _exchange is None:
+        _exchange = ccxt.bybit({
+            'enableRateLimit': True,
+            'options': {'defaultType': 'spot'}
+        })
+    return _exchange
+
+async def close_exchange():
+    """Close the shared exchange instance, if one was created."""
+    global _exchange
+    if _exchange is not None:
+        await _exchange.close()
+        _exchange = None
+
 async def analyze_dym_short():
     """Analyze DYM/USDT as a potential SHORT opportunity."""
 
-    # Initialize Bybit exchange
-    exchange = ccxt.bybit({
-        'enableRateLimit': True,
-        'options': {'defaultType': 'spot'}
-    })
+    # The report is collected and written once at the end, keeping terminal
+    # writes out of the analysis path
+    report = []
+    emit = report.append
 
-    print("="*80)
-    print("DYM/USDT SHORT OPPORTUNITY ANALYSIS")
-    print("="*80)
-    print()
+    exchange = get_exchange()
+
+    emit("="*80)
+    emit("DYM/USDT SHORT OPPORTUNITY ANALYSIS")
+    emit("="*80)
+    emit("")
 
     symbol = "DYM/USDT"
 
@@ -35,8 +59,8 @@ async def analyze_dym_short():
 
     try:
         # 1. MULTI-TIMEFRAME TECHNICAL ANALYSIS
-        print("📊 STEP 1: MULTI-TIMEFRAME TECHNICAL ANALYSIS")
-        print("-" * 80)
+        emit("📊 STEP 1: MULTI-TIMEFRAME TECHNICAL ANALYSIS")
+        emit("-" * 80)
 
         timeframes = {
             "1m": "1m",
@@ -46,33 +70,59 @@ async def analyze_dym_short():
             "4h": "4h"
         }
 
+        # Fetch every timeframe plus the ticker and correlation candles at once;
+        # enableRateLimit still throttles the concurrent requests. The indicator
+        # kernels compile in a worker thread meanwhile (a failure there only
+        # means they compile on first use instead).
+        *tf_results, ticker, btc_ohlcv, dym_ohlcv, _ = await asyncio.gather(
+            *(exchange.fetch_ohlcv(symbol, tf, limit=200) for tf in timeframes.values()),
+            exchange.fetch_ticker(symbol),
+            exchange.fetch_ohlcv("BTC/USDT", "1h", limit=50),
+            exchange.fetch_ohlcv(symbol, "1h", limit=50),
+            asyncio.to_thread(warm_kernels),
+            return_exceptions=True
+        )
+
         tf_analysis = {}
 
-        for name, tf in timeframes.items():
+        # Rows are [timestamp, open, high, low, close, volume]; only close and
+        # volume are used. Failed or empty fetches keep their exception.
+        tf_candles = {}
+        for name, ohlcv in zip(timeframes, tf_results):
             try:
-                ohlcv = await exchange.fetch_ohlcv(symbol, tf, limit=200)
-                df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-
-                # Calculate indicators
-                df['rsi'] = ta.rsi(df['close'], length=14)
-                df['macd'] = ta.macd(df['close'])['MACD_12_26_9']
-                df['macd_signal'] = ta.macd(df['close'])['MACDs_12_26_9']
-                ema_20 = ta.ema(df['close'], length=20)
-                ema_50 = ta.ema(df['close'], length=50)
+                if isinstance(ohlcv, Exception):
+                    raise ohlcv
+                candles = np.asarray(ohlcv, dtype=np.float64)
+                if candles.ndim != 2 or not len(candles):
+                    raise ValueError("no candles returned")
+                tf_candles[name] = candles
+            except Exception as e:
+                tf_candles[name] = e
+
+        # Calculate indicators (latest values only) for every timeframe in one
+        # kernel call over the stacked, NaN-padded closes
+        valid = [c for c in tf_candles.values() if not isinstance(c, Exception)]
+        lengths = np.array([len(c) for c in valid], dtype=np.int64)
+        stacked = np.full((len(valid), lengths.max(initial=0)), np.nan)
+        for row, candles in zip(stacked, valid):
+            row[:len(candles)] = candles[:, 4]
+        tf_indicators = iter(_last_indicators(stacked, lengths))
+
+        for name, candles in tf_candles.items():
+            try:
+                if isinstance(candles, Exception):
+                    raise candles
+                closes = candles[:, 4]
+                rsi, macd_val, macd_sig, ema_20, ema_50 = next(tf_indicators)
 
                 # Latest values
-                latest = df.iloc[-1]
-                price = latest['close']
-                rsi = latest['rsi']
-                macd_val = latest['macd']
-                macd_sig = latest['macd_signal']
+                price = closes[-1]
 
-                # Trend analysis
-                trend = "BEARISH" if pd.notna(ema_20.iloc[-1]) and pd.notna(ema_50.iloc[-1]) and ema_20.iloc[-1] < ema_50.iloc[-1] else "BULLISH"
+                # Trend analysis (NaN comparisons are False)
+                trend = "BEARISH" if ema_20 < ema_50 else "BULLISH"
 
                 # Price change
-                price_change_pct = ((df['close'].iloc[-1] - df['close'].iloc[-20]) / df['close'].iloc[-20] * 100) if len(df) >= 20 else 0
+                price_change_pct = ((closes[-1] - closes[-20]) / closes[-20] * 100) if len(closes) >= 20 else 0
 
                 tf_analysis[name] = {
                     'price': price,
@@ -81,154 +131,151 @@ async def analyze_dym_short():
                     'macd_signal': macd_sig,
                     'trend': trend,
                     'price_change': price_change_pct,
-                    'volume': latest['volume']
+                    'volume': candles[-1, 5]
                 }
 
-                print(f"\n{name.upper()} Timeframe:")
-                print(f"  Price: ${price:.4f}")
-                print(f"  RSI: {rsi:.2f}" + (" [OVERBOUGHT]" if rsi > 70 else " [OVERSOLD]" if rsi < 30 else ""))
-                print(f"  MACD: {macd_val:.6f} (Signal: {macd_sig:.6f}) {'[BEARISH CROSS]' if macd_val < macd_sig else '[BULLISH]'}")
-                print(f"  Trend: {trend}")
-                print(f"  20-period change: {price_change_pct:.2f}%")
+                emit(f"\n{name.upper()} Timeframe:")
+                emit(f"  Price: ${price:.4f}")
+                emit(f"  RSI: {rsi:.2f}" + (" [OVERBOUGHT]" if rsi > 70 else " [OVERSOLD]" if rsi < 30 else ""))
+                emit(f"  MACD: {macd_val:.6f} (Signal: {macd_sig:.6f}) {'[BEARISH CROSS]' if macd_val < macd_sig else '[BULLISH]'}")
+                emit(f"  Trend: {trend}")
+                emit(f"  20-period change: {price_change_pct:.2f}%")
 
             except Exception as e:
-                print(f"  ⚠️  Error fetching {name}: {e}")
+                emit(f"  ⚠️  Error fetching {name}: {e}")
                 tf_analysis[name] = None
 
-        # Calculate technical score (0-40 points)
-        bearish_signals = 0
-        total_signals = 0
+        # Calculate technical score (0-40 points), all timeframes at once
+        valid = [data for data in tf_analysis.values() if data]
+        total_signals = len(valid)
 
-        for tf_name, data in tf_analysis.items():
-            if data:
-                total_signals += 1
+        rsi = np.array([data['rsi'] for data in valid], dtype=np.float64)
+        macd = np.array([data['macd'] for data in valid], dtype=np.float64)
+        macd_signal = np.array([data['macd_signal'] for data in valid], dtype=np.float64)
+        bearish_trend = np.array([data['trend'] == "BEARISH" for data in valid], dtype=bool)
 
-                # RSI overbought (>70) = bearish for SHORT
-                if data['rsi'] > 70:
-                    bearish_signals += 1
-                    technical_score += 6
-                elif data['rsi'] > 60:
-                    bearish_signals += 0.5
-                    technical_score += 3
+        # RSI overbought (>70) = bearish for SHORT; elevated (>60) counts half
+        rsi_overbought = rsi > 70
+        rsi_elevated = (rsi > 60) & ~rsi_overbought
+        # MACD bearish cross
+        macd_bearish = macd < macd_signal
 
-                # MACD bearish cross
-                if data['macd'] < data['macd_signal']:
-                    bearish_signals += 1
-                    technical_score += 4
-
-                # Bearish trend
-                if data['trend'] == "BEARISH":
-                    bearish_signals += 1
-                    technical_score += 4
+        technical_score = int((
+            6 * rsi_overbought + 3 * rsi_elevated + 4 * macd_bearish + 4 * bearish_trend
+        ).sum())
+        bearish_signals = float((
+            rsi_overbought + 0.5 * rsi_elevated + macd_bearish + bearish_trend
+        ).sum())
 
         # Cap at 40
         technical_score = min(technical_score, 40)
 
-        print(f"\n✅ Technical Score: {technical_score}/40")
-        print(f"   Bearish signals: {bearish_signals}/{total_signals * 3}")
+        emit(f"\n✅ Technical Score: {technical_score}/40")
+        emit(f"   Bearish signals: {bearish_signals:g}/{total_signals * 3}")
 
         # 2. MARKET SENTIMENT ANALYSIS
-        print("\n" + "="*80)
-        print("📰 STEP 2: MARKET SENTIMENT ANALYSIS")
-        print("-" * 80)
+        emit("\n" + "="*80)
+        emit("📰 STEP 2: MARKET SENTIMENT ANALYSIS")
+        emit("-" * 80)
 
         # Based on web research from earlier
-        print("\nSentiment Summary:")
-        print("  • Fear & Greed Index: 29 (FEAR)")
-        print("  • +75.62% in 4h followed by -6.76% in 1h = PUMP & DUMP pattern")
-        print("  • 23 bearish vs 6 bullish technical indicators (TradingView)")
-        print("  • Predicted -24.91% drop to $0.067 by Nov 30, 2025")
-        print("  • Extreme volatility with speculative trading")
-        print("  • Mainnet launch catalyst exhausted")
+        emit("\nSentiment Summary:")
+        emit("  • Fear & Greed Index: 29 (FEAR)")
+        emit("  • +75.62% in 4h followed by -6.76% in 1h = PUMP & DUMP pattern")
+        emit("  • 23 bearish vs 6 bullish technical indicators (TradingView)")
+        emit("  • Predicted -24.91% drop to $0.067 by Nov 30, 2025")
+        emit("  • Extreme volatility with speculative trading")
+        emit("  • Mainnet launch catalyst exhausted")
 
         # Sentiment scoring (0-30)
         sentiment_score = 25  # Strong bearish sentiment
-        print(f"\n✅ Sentiment Score: {sentiment_score}/30")
+        emit(f"\n✅ Sentiment Score: {sentiment_score}/30")
 
         # 3. LIQUIDITY & VOLUME ANALYSIS
-        print("\n" + "="*80)
-        print("💧 STEP 3: LIQUIDITY & VOLUME QUALITY")
-        print("-" * 80)
+        emit("\n" + "="*80)
+        emit("💧 STEP 3: LIQUIDITY & VOLUME QUALITY")
+        emit("-" * 80)
 
-        ticker = await exchange.fetch_ticker(symbol)
+        if isinstance(ticker, Exception):
+            raise ticker
 
         current_price = ticker['last']
         volume_24h = ticker['quoteVolume']
         price_change_24h = ticker['percentage']
 
-        print(f"\nCurrent Price: ${current_price:.4f}")
-        print(f"24h Volume: ${volume_24h:,.0f}")
-        print(f"24h Change: {price_change_24h:.2f}%")
+        emit(f"\nCurrent Price: ${current_price:.4f}")
+        emit(f"24h Volume: ${volume_24h:,.0f}")
+        emit(f"24h Change: {price_change_24h:.2f}%")
 
         # Liquidity scoring (0-20)
         if volume_24h > 50_000_000:
             liquidity_score = 20
-            print("  ✅ Excellent liquidity (>$50M)")
+            emit("  ✅ Excellent liquidity (>$50M)")
         elif volume_24h > 10_000_000:
             liquidity_score = 15
-            print("  ✅ Good liquidity ($10M-$50M)")
+            emit("  ✅ Good liquidity ($10M-$50M)")
         elif volume_24h > 1_000_000:
             liquidity_score = 10
-            print("  ⚠️  Moderate liquidity ($1M-$10M)")
+            emit("  ⚠️  Moderate liquidity ($1M-$10M)")
         else:
             liquidity_score = 5
-            print("  ❌ Low liquidity (<$1M)")
+            emit("  ❌ Low liquidity (<$1M)")
 
-        print(f"\n✅ Liquidity Score: {liquidity_score}/20")
+        emit(f"\n✅ Liquidity Score: {liquidity_score}/20")
 
         # 4. BTC CORRELATION
-        print("\n" + "="*80)
-        print("₿  STEP 4: BTC CORRELATION ANALYSIS")
-        print("-" * 80)
-
-        # Fetch BTC data
-        btc_ohlcv = await exchange.fetch_ohlcv("BTC/USDT", "1h", limit=50)
-        btc_df = pd.DataFrame(btc_ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        emit("\n" + "="*80)
+        emit("₿  STEP 4: BTC CORRELATION ANALYSIS")
+        emit("-" * 80)
 
-        dym_ohlcv = await exchange.fetch_ohlcv(symbol, "1h", limit=50)
-        dym_df = pd.DataFrame(dym_ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        for result in (btc_ohlcv, dym_ohlcv):
+            if isinstance(result, Exception):
+                raise result
 
-        # Calculate correlation
-        btc_returns = btc_df['close'].pct_change()
-        dym_returns = dym_df['close'].pct_change()
+        # Correlation of close-to-close returns over the common recent window
+        n = min(len(btc_ohlcv), len(dym_ohlcv))
+        btc_close = np.asarray([r[4] for r in btc_ohlcv[-n:]], dtype=np.float64)
+        dym_close = np.asarray([r[4] for r in dym_ohlcv[-n:]], dtype=np.float64)
+        btc_returns = np.diff(btc_close) / btc_close[:-1]
+        dym_returns = np.diff(dym_close) / dym_close[:-1]
 
-        correlation = btc_returns.corr(dym_returns)
+        correlation = float(np.corrcoef(btc_returns, dym_returns)[0, 1])
 
-        print(f"\nBTC Correlation (1h, 50 periods): {correlation:.3f}")
+        emit(f"\nBTC Correlation (1h, 50 periods): {correlation:.3f}")
 
         if correlation < 0.3:
             correlation_score = 10
-            print("  ✅ Low correlation - DYM moving independently")
+            emit("  ✅ Low correlation - DYM moving independently")
         elif correlation < 0.6:
             correlation_score = 7
-            print("  ⚠️  Moderate correlation")
+            emit("  ⚠️  Moderate correlation")
         else:
             correlation_score = 5
-            print("  ⚠️  High correlation - follows BTC closely")
+            emit("  ⚠️  High correlation - follows BTC closely")
 
-        print(f"\n✅ Correlation Score: {correlation_score}/10")
+        emit(f"\n✅ Correlation Score: {correlation_score}/10")
 
         # 5. CALCULATE TOTAL CONFIDENCE
-        print("\n" + "="*80)
-        print("🎯 STEP 5: CONFIDENCE SCORE & DECISION")
-        print("=" * 80)
+        emit("\n" + "="*80)
+        emit("🎯 STEP 5: CONFIDENCE SCORE & DECISION")
+        emit("=" * 80)
 
         total_confidence = technical_score + sentiment_score + liquidity_score + correlation_score
 
-        print(f"\nSCORE BREAKDOWN:")
-        print(f"  Technical Alignment:  {technical_score}/40")
-        print(f"  Sentiment:            {sentiment_score}/30")
-        print(f"  Liquidity:            {liquidity_score}/20")
-        print(f"  BTC Correlation:      {correlation_score}/10")
-        print(f"  " + "-" * 35)
-        print(f"  TOTAL CONFIDENCE:     {total_confidence}/100")
+        emit(f"\nSCORE BREAKDOWN:")
+        emit(f"  Technical Alignment:  {technical_score}/40")
+        emit(f"  Sentiment:            {sentiment_score}/30")
+        emit(f"  Liquidity:            {liquidity_score}/20")
+        emit(f"  BTC Correlation:      {correlation_score}/10")
+        emit(f"  " + "-" * 35)
+        emit(f"  TOTAL CONFIDENCE:     {total_confidence}/100")
 
-        print()
+        emit("")
 
         # 6. TRADING DECISION
         if total_confidence >= 60:
-            print("🟢 HIGH PROBABILITY SHORT TRADE")
-            print()
+            emit("🟢 HIGH PROBABILITY SHORT TRADE")
+            emit("")
 
             # Calculate position sizing
             portfolio_size = 10000
@@ -244,39 +291,44 @@ async def analyze_dym_short():
             risk_amount = portfolio_size * risk_per_trade
             position_size_usd = risk_amount / stop_loss_pct
 
-            print("TRADE PARAMETERS:")
-            print(f"  Entry Price:       ${entry_price:.4f}")
-            print(f"  Stop Loss:         ${stop_loss:.4f} (+{stop_loss_pct*100:.1f}%)")
-            print(f"  Take Profit:       ${take_profit:.4f} (-{take_profit_pct*100:.1f}%)")
-            print(f"  Position Size:     ${position_size_usd:.2f}")
-            print(f"  Risk Amount:       ${risk_amount:.2f} ({risk_per_trade*100}% of portfolio)")
-            print()
-            print("RATIONALE:")
-            print("  • Overbought RSI across multiple timeframes")
-            print("  • Bearish technical indicators (23 vs 6 on TradingView)")
-            print("  • Pump & dump pattern: +75% in 4h then -6.76% in 1h")
-            print("  • Fear sentiment (index=29)")
-            print("  • Analysts predict -24.91% drop to $0.067")
-            print("  • Post-mainnet euphoria fading")
+            emit("TRADE PARAMETERS:")
+            emit(f"  Entry Price:       ${entry_price:.4f}")
+            emit(f"  Stop Loss:         ${stop_loss:.4f} (+{stop_loss_pct*100:.1f}%)")
+            emit(f"  Take Profit:       ${take_profit:.4f} (-{take_profit_pct*100:.1f}%)")
+            emit(f"  Position Size:     ${position_size_usd:.2f}")
+            emit(f"  Risk Amount:       ${risk_amount:.2f} ({risk_per_trade*100}% of portfolio)")
+            emit("")
+            emit("RATIONALE:")
+            emit("  • Overbought RSI across multiple timeframes")
+            emit("  • Bearish technical indicators (23 vs 6 on TradingView)")
+            emit("  • Pump & dump pattern: +75% in 4h then -6.76% in 1h")
+            emit("  • Fear sentiment (index=29)")
+            emit("  • Analysts predict -24.91% drop to $0.067")
+            emit("  • Post-mainnet euphoria fading")
 
         else:
-            print("🔴 NOT A HIGH PROBABILITY TRADE")
-            print(f"   Confidence {total_confidence}/100 is below threshold of 60")
-            print()
-            print("RECOMMENDATION: PASS - Wait for better setup")
+            emit("🔴 NOT A HIGH PROBABILITY TRADE")
+            emit(f"   Confidence {total_confidence}/100 is below threshold of 60")
+            emit("")
+            emit("RECOMMENDATION: PASS - Wait for better setup")
 
     except Exception as e:
-        print(f"❌ Error during analysis: {e}")
+        emit(f"❌ Error during analysis: {e}")
         import traceback
         traceback.print_exc()
 
-    finally:
-        await exchange.close()
+    emit("")
+    emit("="*80)
+    emit("Analysis Complete")
+    emit("="*80)
 
-    print()
-    print("="*80)
-    print("Analysis Complete")
-    print("="*80)
+    sys.stdout.write("\n".join(report) + "\n")
+
+async def main():
+    try:
+        await analyze_dym_short()
+    finally:
+        await close_exchange()
 
 if __name__ == "__main__":
-    asyncio.run(analyze_dym_short())
+    asyncio.run(main())
@@ -18,6 +18,7 @@ async def main():
     print(f"Initializing token tracking tables in {db_path}")
 
     async with aiosqlite.connect(db_path) as db:
+        await db.execute("PRAGMA journal_mode=WAL")
         await create_token_tracking_tables(db)
         await db.commit()
 
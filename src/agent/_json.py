@@ -0,0 +1,36 @@
+"""JSON encoding shared by agent audit records, prompts, tool payloads and caches."""
+import json
+from typing import Any
+
+import orjson
+
+# Agents and tools may hand back numpy values or non-string dict keys
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+loads = orjson.loads
+
+
+def dumpb(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize obj to JSON bytes.
+
+    Args:
+        obj: Value to serialize
+        pretty: Indent by two spaces (for payloads embedded in prompts or logs)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    option = (_ORJSON_OPTIONS | orjson.OPT_INDENT_2) if pretty else _ORJSON_OPTIONS
+    try:
+        return orjson.dumps(obj, option=option)
+    except TypeError:
+        # Types orjson rejects but json accepts (e.g. float subclasses)
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize obj to a JSON string; see dumpb()."""
+    return dumpb(obj, pretty).decode()
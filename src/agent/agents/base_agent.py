@@ -1,10 +1,11 @@
 """Base class for all pipeline agents."""
-import json
+import asyncio
 import time
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 
+from src.agent._json import dumps
 from src.agent.database.agent_operations import AgentOperations
 
 logger = logging.getLogger(__name__)
@@ -81,6 +82,32 @@ class BaseAgent(ABC):
             logger.error(f"{self.agent_type} failed: {e}", exc_info=True)
             raise
 
+    async def run_many(
+        self,
+        runs: List[Tuple[str, str, dict]],
+        max_concurrent: int = 4
+    ) -> List[Union[dict, BaseException]]:
+        """
+        Run several inputs through run_with_tracking concurrently.
+
+        Args:
+            runs: (session_id, symbol, input_data) per run
+            max_concurrent: Most runs in flight at once (bounds API rate)
+
+        Returns:
+            Outputs in the order of runs; a failed run yields its exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run_one(session_id: str, symbol: str, input_data: dict) -> dict:
+            async with semaphore:
+                return await self.run_with_tracking(session_id, symbol, input_data)
+
+        return await asyncio.gather(
+            *(run_one(*run) for run in runs),
+            return_exceptions=True
+        )
+
     async def _save_output(
         self,
         session_id: str,
@@ -91,7 +118,10 @@ class BaseAgent(ABC):
         duration_ms: int
     ) -> None:
         """
-        Save agent output to database for audit trail.
+        Queue agent output for the database audit trail.
+
+        Outputs are written in batches off the agent's critical path; call
+        flush() to make sure they have been saved.
 
         Args:
             session_id: Unique session identifier
@@ -101,17 +131,21 @@ class BaseAgent(ABC):
             tokens_used: Number of tokens consumed
             duration_ms: Execution duration in milliseconds
         """
-        await self.db_ops.save_agent_output(
+        self.db_ops.queue_agent_output(
             session_id=session_id,
             symbol=symbol,
             agent_type=self.agent_type,
-            input_json=json.dumps(input_data),
-            output_json=json.dumps(output_data),
+            input_json=dumps(input_data),
+            output_json=dumps(output_data),
             tokens_used=tokens_used,
             duration_ms=duration_ms
         )
 
         logger.info(
-            f"Saved {self.agent_type} output for {symbol} "
+            f"Queued {self.agent_type} output for {symbol} "
             f"(session: {session_id}, duration: {duration_ms}ms)"
         )
+
+    async def flush(self) -> None:
+        """Save all queued agent outputs to the database."""
+        await self.db_ops.flush_agent_outputs()
@@ -1,17 +1,33 @@
 """Agent prompts."""
-from .analysis_prompt import build_analysis_prompt, ANALYSIS_SYSTEM_PROMPT
-from .risk_auditor_prompt import build_risk_auditor_prompt, RISK_AUDITOR_SYSTEM_PROMPT
-from .execution_prompt import build_execution_prompt, EXECUTION_SYSTEM_PROMPT
-from .pnl_auditor_prompt import build_trade_review_prompt, build_daily_report_prompt, PNL_AUDITOR_SYSTEM_PROMPT
+import importlib
+from typing import Any
 
-__all__ = [
-    "build_analysis_prompt",
-    "ANALYSIS_SYSTEM_PROMPT",
-    "build_risk_auditor_prompt",
-    "RISK_AUDITOR_SYSTEM_PROMPT",
-    "build_execution_prompt",
-    "EXECUTION_SYSTEM_PROMPT",
-    "build_trade_review_prompt",
-    "build_daily_report_prompt",
-    "PNL_AUDITOR_SYSTEM_PROMPT"
-]
+# Public name -> submodule. Submodules are imported on first attribute
+# access (PEP 562), so using one agent's prompt does not load the others.
+_EXPORTS = {
+    'build_analysis_prompt': '.analysis_prompt',
+    'ANALYSIS_SYSTEM_PROMPT': '.analysis_prompt',
+    'build_risk_auditor_prompt': '.risk_auditor_prompt',
+    'RISK_AUDITOR_SYSTEM_PROMPT': '.risk_auditor_prompt',
+    'build_execution_prompt': '.execution_prompt',
+    'EXECUTION_SYSTEM_PROMPT': '.execution_prompt',
+    'build_trade_review_prompt': '.pnl_auditor_prompt',
+    'build_daily_report_prompt': '.pnl_auditor_prompt',
+    'PNL_AUDITOR_SYSTEM_PROMPT': '.pnl_auditor_prompt',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
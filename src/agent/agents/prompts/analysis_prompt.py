@@ -78,6 +78,27 @@ Total confidence = technical + sentiment + liquidity + correlation
 """
 
 
+# Per-symbol prompt; bound str.format so only the fields are filled per call
+_format_analysis_prompt = """Analyze {symbol} as a potential {direction_hint} opportunity.
+
+## Current Context
+- Symbol: {symbol}
+- Current Price: ${current_price:,.6f}
+- 1h Momentum: {momentum_1h:+.2f}%
+- 4h Momentum: {momentum_4h:+.2f}%
+- 24h Volume: ${volume_24h:,.0f}
+
+## Your Task
+1. Use fetch_technical_snapshot to get multi-timeframe technical analysis
+2. Use fetch_sentiment_data to check for news/catalysts
+3. Synthesize your findings
+4. Output your analysis as JSON (see system prompt for format)
+
+{additional_context}
+
+Remember: Only propose a signal if confidence >= 50. Be conservative.""".format
+
+
 def build_analysis_prompt(
     symbol: str,
     momentum_1h: float,
@@ -100,25 +121,12 @@ def build_analysis_prompt(
     Returns:
         Complete prompt string for the agent
     """
-    direction_hint = "LONG" if momentum_1h > 0 else "SHORT"
-
-    prompt = f"""Analyze {symbol} as a potential {direction_hint} opportunity.
-
-## Current Context
-- Symbol: {symbol}
-- Current Price: ${current_price:,.6f}
-- 1h Momentum: {momentum_1h:+.2f}%
-- 4h Momentum: {momentum_4h:+.2f}%
-- 24h Volume: ${volume_24h:,.0f}
-
-## Your Task
-1. Use fetch_technical_snapshot to get multi-timeframe technical analysis
-2. Use fetch_sentiment_data to check for news/catalysts
-3. Synthesize your findings
-4. Output your analysis as JSON (see system prompt for format)
-
-{f"Additional Context: {additional_context}" if additional_context else ""}
-
-Remember: Only propose a signal if confidence >= 50. Be conservative."""
-
-    return prompt
+    return _format_analysis_prompt(
+        symbol=symbol,
+        direction_hint="LONG" if momentum_1h > 0 else "SHORT",
+        current_price=current_price,
+        momentum_1h=momentum_1h,
+        momentum_4h=momentum_4h,
+        volume_24h=volume_24h,
+        additional_context=f"Additional Context: {additional_context}" if additional_context else ""
+    )
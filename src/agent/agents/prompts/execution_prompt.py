@@ -1,5 +1,5 @@
 """Prompt for Execution Agent."""
-import json
+from src.agent._json import dumps
 
 EXECUTION_SYSTEM_PROMPT = """You are an Execution Agent. Your job is to execute trades optimally.
 
@@ -85,27 +85,8 @@ For ABORTED:
 """
 
 
-def build_execution_prompt(
-    symbol: str,
-    audited_signal: dict,
-    portfolio_equity: float
-) -> str:
-    """
-    Build the execution prompt.
-
-    Args:
-        symbol: Trading pair
-        audited_signal: Signal approved by Risk Auditor
-        portfolio_equity: Current portfolio value
-
-    Returns:
-        Complete prompt string for the agent
-    """
-    signal_json = json.dumps(audited_signal, indent=2)
-
-    position_value = portfolio_equity * (audited_signal.get("position_size_pct", 0) / 100)
-
-    prompt = f"""Execute this risk-approved trade for {symbol}.
+# Per-trade prompt; bound str.format so only the fields are filled per call
+_format_execution_prompt = """Execute this risk-approved trade for {symbol}.
 
 ## Audited Signal
 ```json
@@ -113,11 +94,11 @@ def build_execution_prompt(
 ```
 
 ## Position Details
-- Direction: {audited_signal.get('direction')}
-- Target Entry: {audited_signal.get('entry_price')}
-- Stop Loss: {audited_signal.get('stop_loss')}
-- Take Profit: {audited_signal.get('take_profit')}
-- Position Size: {audited_signal.get('position_size_pct')}% of portfolio
+- Direction: {direction}
+- Target Entry: {entry_price}
+- Stop Loss: {stop_loss}
+- Take Profit: {take_profit}
+- Position Size: {position_size_pct}% of portfolio
 - Position Value: ${position_value:,.2f}
 
 ## Your Task
@@ -127,6 +108,36 @@ def build_execution_prompt(
 4. Execute if conditions are favorable
 5. Report execution result as JSON
 
-Remember: You can ABORT if market has moved significantly against the entry."""
+Remember: You can ABORT if market has moved significantly against the entry.""".format
 
-    return prompt
+
+def build_execution_prompt(
+    symbol: str,
+    audited_signal: dict,
+    portfolio_equity: float
+) -> str:
+    """
+    Build the execution prompt.
+
+    Args:
+        symbol: Trading pair
+        audited_signal: Signal approved by Risk Auditor
+        portfolio_equity: Current portfolio value
+
+    Returns:
+        Complete prompt string for the agent
+    """
+    get = audited_signal.get
+    position_size_pct = get("position_size_pct")
+    position_value = portfolio_equity * ((position_size_pct or 0) / 100)
+
+    return _format_execution_prompt(
+        symbol=symbol,
+        signal_json=dumps(audited_signal, pretty=True),
+        direction=get('direction'),
+        entry_price=get('entry_price'),
+        stop_loss=get('stop_loss'),
+        take_profit=get('take_profit'),
+        position_size_pct=position_size_pct,
+        position_value=position_value
+    )
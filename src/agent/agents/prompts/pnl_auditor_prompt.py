@@ -1,5 +1,5 @@
 """Prompt for P&L Auditor Agent."""
-import json
+from src.agent._json import dumps
 from typing import List
 
 PNL_AUDITOR_SYSTEM_PROMPT = """You are a P&L Auditor Agent. Your job is to review trading performance and identify insights.
@@ -96,21 +96,8 @@ For DAILY_REPORT:
 """
 
 
-def build_trade_review_prompt(trade: dict) -> str:
-    """
-    Build prompt for per-trade review.
-
-    Args:
-        trade: Closed trade details
-
-    Returns:
-        Complete prompt string
-    """
-    trade_json = json.dumps(trade, indent=2)
-
-    result = "WIN" if trade.get("pnl_pct", 0) > 0 else "LOSS"
-
-    prompt = f"""Review this closed trade and provide insights.
+# Per-call prompts; bound str.format so only the fields are filled per call
+_format_trade_review_prompt = """Review this closed trade and provide insights.
 
 ## Trade Details
 ```json
@@ -118,41 +105,20 @@ def build_trade_review_prompt(trade: dict) -> str:
 ```
 
 ## Summary
-- Trade ID: {trade.get('trade_id', 'N/A')}
-- Symbol: {trade.get('symbol', 'N/A')}
-- Direction: {trade.get('direction', 'N/A')}
+- Trade ID: {trade_id}
+- Symbol: {symbol}
+- Direction: {direction}
 - Result: {result}
-- P&L: {trade.get('pnl_pct', 0):.2f}% (${trade.get('pnl_usd', 0):.2f})
+- P&L: {pnl_pct:.2f}% (${pnl_usd:.2f})
 
 ## Your Task
 1. Use get_trade_details to get full trade context
 2. Use get_market_context to understand market conditions
 3. Analyze what worked and what didn't
 4. Provide one actionable recommendation
-5. Output as JSON in TRADE_REVIEW format"""
-
-    return prompt
-
-
-def build_daily_report_prompt(date: str, trades: List[dict]) -> str:
-    """
-    Build prompt for daily batch report.
-
-    Args:
-        date: Report date (YYYY-MM-DD)
-        trades: List of trades from the day
-
-    Returns:
-        Complete prompt string
-    """
-    trades_json = json.dumps(trades, indent=2)
-
-    total = len(trades)
-    wins = sum(1 for t in trades if t.get("pnl_pct", 0) > 0)
-    losses = total - wins
-    total_pnl = sum(t.get("pnl_pct", 0) for t in trades)
+5. Output as JSON in TRADE_REVIEW format""".format
 
-    prompt = f"""Generate daily performance report for {date}.
+_format_daily_report_prompt = """Generate daily performance report for {date}.
 
 ## Trades Summary
 - Total Trades: {total}
@@ -171,6 +137,58 @@ def build_daily_report_prompt(date: str, trades: List[dict]) -> str:
 3. Use get_agent_performance to assess each agent
 4. Identify 2-3 patterns in the data
 5. Provide actionable strategy recommendations
-6. Output as JSON in DAILY_REPORT format"""
+6. Output as JSON in DAILY_REPORT format""".format
+
+
+def build_trade_review_prompt(trade: dict) -> str:
+    """
+    Build prompt for per-trade review.
+
+    Args:
+        trade: Closed trade details
+
+    Returns:
+        Complete prompt string
+    """
+    pnl_pct = trade.get("pnl_pct", 0)
+
+    return _format_trade_review_prompt(
+        trade_json=dumps(trade, pretty=True),
+        trade_id=trade.get('trade_id', 'N/A'),
+        symbol=trade.get('symbol', 'N/A'),
+        direction=trade.get('direction', 'N/A'),
+        result="WIN" if pnl_pct > 0 else "LOSS",
+        pnl_pct=pnl_pct,
+        pnl_usd=trade.get('pnl_usd', 0)
+    )
+
+
+def build_daily_report_prompt(date: str, trades: List[dict]) -> str:
+    """
+    Build prompt for daily batch report.
+
+    Args:
+        date: Report date (YYYY-MM-DD)
+        trades: List of trades from the day
+
+    Returns:
+        Complete prompt string
+    """
+    # Win count and total P&L in one pass over the trades
+    wins = 0
+    total_pnl = 0
+    for trade in trades:
+        pnl_pct = trade.get("pnl_pct", 0)
+        total_pnl += pnl_pct
+        if pnl_pct > 0:
+            wins += 1
+    total = len(trades)
 
-    return prompt
+    return _format_daily_report_prompt(
+        date=date,
+        total=total,
+        wins=wins,
+        losses=total - wins,
+        total_pnl=total_pnl,
+        trades_json=dumps(trades, pretty=True)
+    )
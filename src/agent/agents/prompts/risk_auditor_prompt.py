@@ -1,5 +1,7 @@
 """Prompt for Risk Auditor Agent."""
-import json
+from functools import lru_cache
+
+from src.agent._json import dumps
 
 RISK_AUDITOR_SYSTEM_PROMPT = """You are a Risk Auditor Agent. Your job is to protect the portfolio from excessive risk.
 
@@ -80,27 +82,30 @@ For REJECT:
 """
 
 
-def build_risk_auditor_prompt(
-    analysis_output: dict,
-    portfolio_state: dict
-) -> str:
-    """
-    Build the risk auditor prompt.
+_SCALAR_TYPES = (str, int, float, bool, type(None))
 
-    Args:
-        analysis_output: Output from Analysis Agent
-        portfolio_state: Current portfolio state
 
-    Returns:
-        Complete prompt string for the agent
+@lru_cache(maxsize=8)
+def _portfolio_json(items: tuple) -> str:
+    return dumps({key: value for key, _, value in items}, pretty=True)
+
+
+def _dump_portfolio(portfolio_state: dict) -> str:
     """
-    analysis_json = json.dumps(analysis_output, indent=2)
-    portfolio_json = json.dumps(portfolio_state, indent=2)
+    Serialize the portfolio state, reusing the text for repeated snapshots.
+
+    Every signal in a scan is audited against the same snapshot. Flat
+    snapshots of scalars are cached by (key, type, value), where the type
+    keeps e.g. 1 and 1.0 apart; anything nested is serialized directly.
+    """
+    items = tuple((key, type(value), value) for key, value in portfolio_state.items())
+    if all(type(value) in _SCALAR_TYPES for _, _, value in items):
+        return _portfolio_json(items)
+    return dumps(portfolio_state, pretty=True)
 
-    signal = analysis_output.get("proposed_signal", {})
-    symbol = analysis_output.get("analysis_report", {}).get("symbol", "UNKNOWN")
 
-    prompt = f"""Review this trading signal for {symbol} and make a risk decision.
+# Per-signal prompt; bound str.format so only the fields are filled per call
+_format_risk_auditor_prompt = """Review this trading signal for {symbol} and make a risk decision.
 
 ## Analysis Agent Output
 ```json
@@ -120,13 +125,40 @@ def build_risk_auditor_prompt(
 5. Output your decision as JSON (see system prompt for format)
 
 Signal Summary:
-- Direction: {signal.get('direction', 'N/A')}
-- Confidence: {signal.get('confidence', 0)}
-- Entry: {signal.get('entry_price', 0)}
-- Stop Loss: {signal.get('stop_loss', 0)}
-- Take Profit: {signal.get('take_profit', 0)}
-- Position Size: {signal.get('position_size_pct', 0)}%
+- Direction: {direction}
+- Confidence: {confidence}
+- Entry: {entry_price}
+- Stop Loss: {stop_loss}
+- Take Profit: {take_profit}
+- Position Size: {position_size_pct}%
 
-Make your risk decision: APPROVE, MODIFY, or REJECT."""
+Make your risk decision: APPROVE, MODIFY, or REJECT.""".format
+
+
+def build_risk_auditor_prompt(
+    analysis_output: dict,
+    portfolio_state: dict
+) -> str:
+    """
+    Build the risk auditor prompt.
+
+    Args:
+        analysis_output: Output from Analysis Agent
+        portfolio_state: Current portfolio state
+
+    Returns:
+        Complete prompt string for the agent
+    """
+    signal = analysis_output.get("proposed_signal", {})
 
-    return prompt
+    return _format_risk_auditor_prompt(
+        symbol=analysis_output.get("analysis_report", {}).get("symbol", "UNKNOWN"),
+        analysis_json=dumps(analysis_output, pretty=True),
+        portfolio_json=_dump_portfolio(portfolio_state),
+        direction=signal.get('direction', 'N/A'),
+        confidence=signal.get('confidence', 0),
+        entry_price=signal.get('entry_price', 0),
+        stop_loss=signal.get('stop_loss', 0),
+        take_profit=signal.get('take_profit', 0),
+        position_size_pct=signal.get('position_size_pct', 0)
+    )
@@ -1,15 +1,29 @@
 """Database operations for multi-agent pipeline."""
+import asyncio
+import logging
 import aiosqlite
 from pathlib import Path
 from datetime import date
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+AgentOutputRow = Tuple[str, str, str, str, str, int, int]
 
 
 class AgentOperations:
     """CRUD operations for agent pipeline outputs."""
 
+    # Queued agent outputs are written together once this many are pending,
+    # or this long after the first one was queued
+    OUTPUT_BATCH_SIZE = 50
+    OUTPUT_FLUSH_SECONDS = 0.5
+
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        self._pending_outputs: List[AgentOutputRow] = []
+        self._output_timer: Optional[asyncio.Task] = None
+        self._output_writes: Set[asyncio.Task] = set()
 
     async def save_agent_output(
         self,
@@ -34,6 +48,80 @@ class AgentOperations:
             await db.commit()
             return cursor.lastrowid
 
+    async def save_agent_outputs_bulk(self, rows: List[AgentOutputRow]) -> None:
+        """
+        Save several agent outputs in one transaction.
+
+        Args:
+            rows: (session_id, symbol, agent_type, input_json, output_json,
+                tokens_used, duration_ms) tuples
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                """
+                INSERT INTO agent_outputs
+                (session_id, symbol, agent_type, input_json, output_json, tokens_used, duration_ms)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            await db.commit()
+
+    def queue_agent_output(
+        self,
+        session_id: str,
+        symbol: str,
+        agent_type: str,
+        input_json: str,
+        output_json: str,
+        tokens_used: int,
+        duration_ms: int
+    ) -> None:
+        """
+        Queue an agent output to be saved with the next batch.
+
+        Must be called from a running event loop. Use flush_agent_outputs()
+        before reading the outputs back or shutting down.
+        """
+        self._pending_outputs.append(
+            (session_id, symbol, agent_type, input_json, output_json, tokens_used, duration_ms)
+        )
+        if len(self._pending_outputs) >= self.OUTPUT_BATCH_SIZE:
+            self._start_output_write(0)
+        elif self._output_timer is None:
+            self._output_timer = self._start_output_write(self.OUTPUT_FLUSH_SECONDS)
+
+    def _start_output_write(self, delay: float) -> asyncio.Task:
+        task = asyncio.create_task(self._write_pending_outputs(delay))
+        self._output_writes.add(task)
+        task.add_done_callback(self._output_writes.discard)
+        return task
+
+    async def _write_pending_outputs(self, delay: float = 0) -> None:
+        """Write every queued agent output, optionally after a delay."""
+        if delay:
+            await asyncio.sleep(delay)
+            self._output_timer = None
+
+        rows, self._pending_outputs = self._pending_outputs, []
+        if not rows:
+            return
+
+        try:
+            await self.save_agent_outputs_bulk(rows)
+        except Exception as e:
+            logger.error(f"Failed to save {len(rows)} agent outputs: {e}", exc_info=True)
+
+    async def flush_agent_outputs(self) -> None:
+        """Write all queued agent outputs and wait for batches in flight."""
+        if self._output_timer is not None:
+            self._output_timer.cancel()
+            self._output_timer = None
+
+        await self._write_pending_outputs()
+        if self._output_writes:
+            await asyncio.gather(*self._output_writes, return_exceptions=True)
+
     async def save_risk_decision(
         self,
         session_id: str,
@@ -145,7 +233,8 @@ class AgentOperations:
             return cursor.lastrowid
 
     async def get_agent_outputs_by_session(self, session_id: str) -> List[Dict[str, Any]]:
-        """Get all agent outputs for a session."""
+        """Get all agent outputs for a session, including queued ones."""
+        await self.flush_agent_outputs()
         async with aiosqlite.connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
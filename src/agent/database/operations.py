@@ -8,6 +8,30 @@ from pathlib import Path
 class TradingDatabase:
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        # Opened on first use and kept for the life of the instance; call
+        # close() when done (aiosqlite's worker thread keeps the process alive)
+        self._conn: Optional[aiosqlite.Connection] = None
+
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """Return the instance's connection, opening it if needed."""
+        if self._conn is None:
+            conn = await aiosqlite.connect(self.db_path)
+            conn.row_factory = aiosqlite.Row
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute("PRAGMA synchronous=NORMAL")
+            await conn.execute("PRAGMA temp_store=MEMORY")
+            if self._conn is not None:
+                # Another call opened one while we were connecting
+                await conn.close()
+            else:
+                self._conn = conn
+        return self._conn
+
+    async def close(self) -> None:
+        """Close the connection, if open."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            await conn.close()
 
     async def save_signal(
         self,
@@ -21,18 +45,18 @@ class TradingDatabase:
         sentiment_data: Dict
     ) -> int:
         """Save a trading signal to the database."""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                INSERT INTO signals
-                (symbol, signal_type, confidence, price, timeframe, reason, technical_data, sentiment_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (symbol, signal_type, confidence, price, timeframe, reason,
-                 json.dumps(technical_data), json.dumps(sentiment_data))
-            )
-            await db.commit()
-            return cursor.lastrowid
+        db = await self._get_conn()
+        cursor = await db.execute(
+            """
+            INSERT INTO signals
+            (symbol, signal_type, confidence, price, timeframe, reason, technical_data, sentiment_data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (symbol, signal_type, confidence, price, timeframe, reason,
+             json.dumps(technical_data), json.dumps(sentiment_data))
+        )
+        await db.commit()
+        return cursor.lastrowid
 
     async def save_technical_analysis(
         self,
@@ -41,25 +65,25 @@ class TradingDatabase:
         indicators: Dict[str, Any]
     ) -> int:
         """Save technical analysis results."""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                INSERT INTO technical_analysis
-                (symbol, timeframe, rsi, macd, macd_signal, macd_hist,
-                 bb_upper, bb_middle, bb_lower, volume, price, additional_indicators)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    symbol, timeframe,
-                    indicators.get('rsi'), indicators.get('macd'),
-                    indicators.get('macd_signal'), indicators.get('macd_hist'),
-                    indicators.get('bb_upper'), indicators.get('bb_middle'),
-                    indicators.get('bb_lower'), indicators.get('volume'),
-                    indicators.get('price'), json.dumps(indicators.get('additional', {}))
-                )
+        db = await self._get_conn()
+        cursor = await db.execute(
+            """
+            INSERT INTO technical_analysis
+            (symbol, timeframe, rsi, macd, macd_signal, macd_hist,
+             bb_upper, bb_middle, bb_lower, volume, price, additional_indicators)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                symbol, timeframe,
+                indicators.get('rsi'), indicators.get('macd'),
+                indicators.get('macd_signal'), indicators.get('macd_hist'),
+                indicators.get('bb_upper'), indicators.get('bb_middle'),
+                indicators.get('bb_lower'), indicators.get('volume'),
+                indicators.get('price'), json.dumps(indicators.get('additional', {}))
             )
-            await db.commit()
-            return cursor.lastrowid
+        )
+        await db.commit()
+        return cursor.lastrowid
 
     async def get_recent_signals(
         self,
@@ -67,27 +91,25 @@ class TradingDatabase:
         limit: int = 10
     ) -> List[Dict]:
         """Retrieve recent signals for a symbol."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM signals
-                WHERE symbol = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (symbol, limit)
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+        db = await self._get_conn()
+        async with db.execute(
+            """
+            SELECT * FROM signals
+            WHERE symbol = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            (symbol, limit)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
 
     async def get_portfolio_position(self, symbol: str) -> Optional[Dict]:
         """Get current portfolio position for a symbol."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM portfolio_state WHERE symbol = ?",
-                (symbol,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                return dict(row) if row else None
+        db = await self._get_conn()
+        async with db.execute(
+            "SELECT * FROM portfolio_state WHERE symbol = ?",
+            (symbol,)
+        ) as cursor:
+            row = await cursor.fetchone()
+            return dict(row) if row else None
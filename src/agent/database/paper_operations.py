@@ -2,9 +2,18 @@
 import aiosqlite
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Any, Tuple
 from pathlib import Path
 
+class PositionRiskView(NamedTuple):
+    """Open-position columns consumed by the risk manager."""
+    symbol: str
+    quantity: float
+    current_price: Optional[float]
+    stop_loss: Optional[float]
+    take_profit: Optional[float]
+    position_type: str
+
 class PaperTradingDatabase:
     def __init__(self, db_path: Path):
         self.db_path = db_path
@@ -187,6 +196,38 @@ class PaperTradingDatabase:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
 
+    async def count_open_positions(self, portfolio_id: int) -> int:
+        """Count open positions for a portfolio."""
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                """
+                SELECT COUNT(*) FROM paper_positions
+                WHERE portfolio_id = ? AND is_open = 1
+                """,
+                (portfolio_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+                return row[0]
+
+    async def get_open_positions_risk_view(
+        self,
+        portfolio_id: int
+    ) -> List[PositionRiskView]:
+        """Get open positions projected to the columns risk checks need."""
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                """
+                SELECT symbol, quantity, current_price, stop_loss,
+                       take_profit, position_type
+                FROM paper_positions
+                WHERE portfolio_id = ? AND is_open = 1
+                ORDER BY opened_at DESC
+                """,
+                (portfolio_id,)
+            ) as cursor:
+                rows = await cursor.fetchall()
+                return [PositionRiskView._make(row) for row in rows]
+
     async def get_position_by_symbol(
         self,
         portfolio_id: int,
@@ -271,6 +312,33 @@ class PaperTradingDatabase:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
 
+    async def iter_execution_quality(
+        self,
+        portfolio_id: int,
+        limit: int = 20
+    ) -> AsyncIterator[Dict]:
+        """Stream the most recent trades with only execution-quality columns.
+
+        Ordering and LIMIT are resolved by SQLite using the
+        idx_paper_trades_portfolio (portfolio_id, executed_at) index, and rows
+        are yielded as they come off the cursor instead of being materialized.
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            async with db.execute(
+                """
+                SELECT executed_at, symbol, trade_type, signal_price,
+                       actual_fill_price, slippage_pct, execution_mode
+                FROM paper_trades
+                WHERE portfolio_id = ?
+                ORDER BY executed_at DESC
+                LIMIT ?
+                """,
+                (portfolio_id, limit)
+            ) as cursor:
+                async for row in cursor:
+                    yield dict(row)
+
     # Risk Audit
 
     async def log_risk_event(
@@ -300,11 +368,67 @@ class PaperTradingDatabase:
             await db.commit()
             return cursor.lastrowid
 
+    async def log_risk_events_batch(
+        self,
+        portfolio_id: int,
+        events: List[Tuple]
+    ) -> None:
+        """
+        Log several risk compliance events in one round trip.
+
+        Args:
+            portfolio_id: Portfolio ID
+            events: Tuples of (event_type, severity, rule_type, rule_limit,
+                current_value, symbol, trade_id, message)
+        """
+        if not events:
+            return
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                """
+                INSERT INTO paper_risk_audit
+                (portfolio_id, event_type, severity, rule_type, rule_limit,
+                 current_value, symbol, trade_id, message)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [(portfolio_id, *event) for event in events]
+            )
+            await db.commit()
+
+    async def trigger_circuit_breaker_atomic(
+        self,
+        portfolio_id: int,
+        reason: str
+    ) -> None:
+        """Activate circuit breaker and log the CRITICAL audit event in one transaction."""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                """
+                UPDATE paper_portfolios
+                SET circuit_breaker_active = 1,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (portfolio_id,)
+            )
+            await db.execute(
+                """
+                INSERT INTO paper_risk_audit
+                (portfolio_id, event_type, severity, rule_type, rule_limit,
+                 current_value, symbol, trade_id, message)
+                VALUES (?, 'CIRCUIT_BREAKER', 'CRITICAL', 'AUTO_HALT', 0, 0, NULL, NULL, ?)
+                """,
+                (portfolio_id, f"Circuit breaker triggered: {reason}")
+            )
+            await db.commit()
+
     async def get_risk_violations(
         self,
         portfolio_id: int,
         hours: int = 24,
-        severity: Optional[str] = None
+        severity: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[Dict]:
         """Get recent risk violations."""
         async with aiosqlite.connect(self.db_path) as db:
@@ -329,10 +453,64 @@ class PaperTradingDatabase:
                 """
                 params = (portfolio_id, cutoff)
 
+            if limit is not None:
+                query += " LIMIT ?"
+                params = params + (limit,)
+
             async with db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
 
+    async def get_risk_violation_counts(
+        self,
+        portfolio_id: int,
+        hours: int = 24
+    ) -> Dict[str, int]:
+        """
+        Count recent risk violations in a single aggregate query.
+
+        Returns:
+            Dict with 'total' and 'critical' counts
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            cutoff = datetime.now() - timedelta(hours=hours)
+            async with db.execute(
+                """
+                SELECT COUNT(*),
+                       COUNT(*) FILTER (WHERE severity = 'CRITICAL')
+                FROM paper_risk_audit
+                WHERE portfolio_id = ?
+                AND triggered_at >= ?
+                """,
+                (portfolio_id, cutoff)
+            ) as cursor:
+                total, critical = await cursor.fetchone()
+                return {'total': total, 'critical': critical}
+
+    async def count_risk_violations(
+        self,
+        portfolio_id: int,
+        hours: int = 24,
+        severity: Optional[str] = None
+    ) -> int:
+        """Count recent risk violations, optionally for one severity."""
+        async with aiosqlite.connect(self.db_path) as db:
+            cutoff = datetime.now() - timedelta(hours=hours)
+            query = """
+                SELECT COUNT(*) FROM paper_risk_audit
+                WHERE portfolio_id = ?
+                AND triggered_at >= ?
+            """
+            params = [portfolio_id, cutoff]
+
+            if severity:
+                query += " AND severity = ?"
+                params.append(severity)
+
+            async with db.execute(query, params) as cursor:
+                row = await cursor.fetchone()
+                return row[0]
+
     # Performance Metrics
 
     async def save_performance_snapshot(
@@ -570,6 +748,42 @@ class PaperTradingDatabase:
             await db.commit()
             return cursor.lastrowid
 
+    async def save_mover_signals_many(self, signals: List[Dict]) -> List[int]:
+        """
+        Save several mover signals in one transaction.
+
+        Args:
+            signals: Dicts with the save_mover_signal keyword arguments
+
+        Returns:
+            Inserted signal IDs, in input order
+        """
+        if not signals:
+            return []
+
+        signal_ids = []
+        async with aiosqlite.connect(self.db_path) as db:
+            for signal in signals:
+                analysis = signal.get('analysis')
+                cursor = await db.execute(
+                    """
+                    INSERT INTO movers_signals
+                    (symbol, direction, confidence, entry_price, stop_loss, tp1,
+                     position_size_usd, risk_amount_usd, technical_score, sentiment_score,
+                     liquidity_score, correlation_score, analysis)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (signal['symbol'], signal['direction'], signal['confidence'],
+                     signal['entry_price'], signal['stop_loss'], signal['tp1'],
+                     signal['position_size_usd'], signal['risk_amount_usd'],
+                     signal.get('technical_score'), signal.get('sentiment_score'),
+                     signal.get('liquidity_score'), signal.get('correlation_score'),
+                     json.dumps(analysis) if analysis else None)
+                )
+                signal_ids.append(cursor.lastrowid)
+            await db.commit()
+        return signal_ids
+
     async def get_mover_signal(self, signal_id: int) -> Optional[Dict]:
         """Get mover signal by ID."""
         async with aiosqlite.connect(self.db_path) as db:
@@ -607,6 +821,31 @@ class PaperTradingDatabase:
             await db.commit()
             return cursor.lastrowid
 
+    async def save_mover_rejections_many(self, rejections: List[Dict]) -> None:
+        """
+        Save several mover rejections in one round trip.
+
+        Args:
+            rejections: Dicts with the save_mover_rejection keyword arguments
+        """
+        if not rejections:
+            return
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                """
+                INSERT INTO movers_rejections
+                (symbol, direction, confidence, reason, details)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (r['symbol'], r['direction'], r['confidence'], r['reason'],
+                     json.dumps(r['details']) if r.get('details') else None)
+                    for r in rejections
+                ]
+            )
+            await db.commit()
+
     async def get_recent_rejections(self, limit: int = 10) -> List[Dict]:
         """Get recent rejections."""
         async with aiosqlite.connect(self.db_path) as db:
@@ -76,5 +76,7 @@ CREATE TABLE IF NOT EXISTS agent_state (
 async def init_database(db_path: Path) -> None:
     """Initialize the SQLite database with schema."""
     async with aiosqlite.connect(db_path) as db:
+        # WAL persists in the database file, so later connections inherit it
+        await db.execute("PRAGMA journal_mode=WAL")
         await db.executescript(DB_SCHEMA)
         await db.commit()
@@ -11,10 +11,23 @@ from .trading_agent import TradingAgent
 from .database.operations import TradingDatabase
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (no Windows support)
+    uvloop = None
+
 load_dotenv()
 console = Console()
 logger = logging.getLogger(__name__)
 
+
+def run_async(coro):
+    """Run a command's coroutine on uvloop when installed, else asyncio."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 @click.group()
 def cli():
     """Bybit Trading Analysis Agent powered by Claude Agent SDK."""
@@ -50,7 +63,7 @@ def monitor(symbol, interval):
             await agent.cleanup()
 
     try:
-        asyncio.run(run())
+        run_async(run())
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitoring stopped by user[/yellow]")
 
@@ -102,7 +115,7 @@ def analyze(symbol, show_tokens, query):
         finally:
             await agent.cleanup()
 
-    asyncio.run(run())
+    run_async(run())
 
 @cli.command()
 @click.option('--symbol', default=None, help='Filter by symbol')
@@ -113,11 +126,14 @@ def signals(symbol, limit):
         db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
         db = TradingDatabase(db_path)
 
-        if symbol:
-            signals_data = await db.get_recent_signals(symbol, limit)
-        else:
-            # Default to BTC/USDT if no symbol specified
-            signals_data = await db.get_recent_signals("BTC/USDT", limit)
+        try:
+            if symbol:
+                signals_data = await db.get_recent_signals(symbol, limit)
+            else:
+                # Default to BTC/USDT if no symbol specified
+                signals_data = await db.get_recent_signals("BTC/USDT", limit)
+        finally:
+            await db.close()
 
         if not signals_data:
             console.print("[yellow]No signals found[/yellow]")
@@ -143,7 +159,7 @@ def signals(symbol, limit):
 
         console.print(table)
 
-    asyncio.run(run())
+    run_async(run())
 
 @cli.command()
 @click.option('--symbol', default='BTC/USDT', help='Trading pair symbol')
@@ -153,7 +169,10 @@ def status(symbol):
         db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
         db = TradingDatabase(db_path)
 
-        position = await db.get_portfolio_position(symbol)
+        try:
+            position = await db.get_portfolio_position(symbol)
+        finally:
+            await db.close()
 
         if not position:
             console.print(f"[yellow]No position found for {symbol}[/yellow]")
@@ -173,7 +192,7 @@ def status(symbol):
 
         console.print(table)
 
-    asyncio.run(run())
+    run_async(run())
 
 @cli.command()
 @click.option('--name', required=True, help='Portfolio name')
@@ -200,7 +219,7 @@ def create_portfolio(name, capital, mode):
         console.print(f"Starting capital: ${capital:,.2f}")
         console.print(f"Execution mode: {mode}")
 
-    asyncio.run(run())
+    run_async(run())
 
 @cli.command()
 @click.option('--name', required=True, help='Portfolio name')
@@ -214,13 +233,16 @@ def paper_status(name):
         from src.agent.database.paper_operations import PaperTradingDatabase
 
         manager = PaperPortfolioManager(db_path, name)
-        await manager.initialize()
+        try:
+            await manager.initialize()
 
-        db = PaperTradingDatabase(db_path)
-        dashboard = AuditDashboard(db, manager.portfolio_id)
-        await dashboard.display_dashboard()
+            db = PaperTradingDatabase(db_path)
+            dashboard = AuditDashboard(db, manager.portfolio_id)
+            await dashboard.display_dashboard()
+        finally:
+            await manager.close()
 
-    asyncio.run(run())
+    run_async(run())
 
 @cli.command()
 @click.option('--symbol', default='BTC/USDT', help='Trading pair symbol')
@@ -254,7 +276,7 @@ def paper_monitor(symbol, portfolio, interval):
         await agent.continuous_monitor(interval_seconds=interval)
 
     try:
-        asyncio.run(run())
+        run_async(run())
     except KeyboardInterrupt:
         console.print("\n[yellow]Paper trading monitoring stopped[/yellow]")
 
@@ -284,7 +306,7 @@ def pnl_report(portfolio, period, min_trades):
             logger.exception("P&L report failed")
             raise click.Abort()
 
-    asyncio.run(run())
+    run_async(run())
 
 @cli.command()
 @click.option('--portfolio', required=True, help='Portfolio name')
@@ -296,13 +318,16 @@ def reset_breaker(portfolio):
         from src.agent.paper_trading.portfolio_manager import PaperPortfolioManager
 
         manager = PaperPortfolioManager(db_path, portfolio)
-        await manager.initialize()
+        try:
+            await manager.initialize()
 
-        await manager.risk_manager.reset_circuit_breaker()
+            await manager.risk_manager.reset_circuit_breaker()
+        finally:
+            await manager.close()
 
         console.print(f"[green]✅ Circuit breaker reset for portfolio '{portfolio}'[/green]")
 
-    asyncio.run(run())
+    run_async(run())
 
 @cli.command()
 @click.option('--interval', default=300, help='Scan interval in seconds')
@@ -639,13 +664,19 @@ def scan_movers(interval, portfolio, daily, dashboard, no_sentiment):
             await scanner.stop()
             console.print("\n[yellow]Scanner stopped by user[/yellow]")
         finally:
+            # Close the persistent agent client (no-op in per-analysis mode)
+            await agent.aclose()
+
+            # Flush queued risk audit events
+            await manager.close()
+
             # End token tracking session
             if token_tracker:
                 await token_tracker.end_session()
                 console.print("[green]✅ Token tracking session ended[/green]")
 
     try:
-        asyncio.run(run_scanner())
+        run_async(run_scanner())
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         logger.error(f"Scanner error: {e}", exc_info=True)
@@ -681,7 +712,7 @@ def token_stats(period, session_id):
             console.print("[bold]Last 24 Hours Usage[/bold]")
             display.display_stats_table(stats)
 
-    asyncio.run(run())
+    run_async(run())
 
 
 @cli.command()
@@ -692,7 +723,7 @@ def token_limits():
 
         from src.agent.database.token_operations import TokenDatabase
         from src.agent.tracking.display import TokenDisplay
-        from agent.config import config
+        from src.agent.config import config
 
         token_db = TokenDatabase(db_path)
         display = TokenDisplay()
@@ -732,11 +763,12 @@ def token_limits():
 
         display.console.print(table)
 
-    asyncio.run(run())
+    run_async(run())
 
 
 @cli.command()
-def fetch_limits():
+@click.option('--refresh', is_flag=True, help='Ignore limits cached within the last day')
+def fetch_limits(refresh):
     """Fetch current Claude Code rate limits from documentation."""
     async def run():
         from src.agent.tracking.limit_fetcher import fetch_current_limits_from_docs, compare_with_current_config
@@ -744,7 +776,8 @@ def fetch_limits():
 
         console.print("[cyan]Fetching current Claude Code rate limits...[/cyan]")
 
-        limits = await fetch_current_limits_from_docs()
+        db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
+        limits = await fetch_current_limits_from_docs(db_path, force_refresh=refresh)
 
         if not limits:
             console.print("[yellow]Could not fetch limits from documentation[/yellow]")
@@ -792,7 +825,7 @@ def fetch_limits():
             console.print()
             console.print("[green]✓ Configuration is up to date[/green]")
 
-    asyncio.run(run())
+    run_async(run())
 
 
 @cli.command()
@@ -841,7 +874,7 @@ def sessions(clear_sessions, clear_type):
             console.print("[dim]Use --clear-type <type> to clear a specific session[/dim]")
             console.print("[dim]Use --clear to clear all sessions[/dim]")
 
-    asyncio.run(run())
+    run_async(run())
 
 
 @cli.command()
@@ -896,7 +929,7 @@ def token_intervals(session_id, limit):
             console.print(table)
             console.print("\n[dim]Use --session-id to see 5-minute interval breakdown[/dim]\n")
 
-    asyncio.run(run())
+    run_async(run())
 
 
 @cli.command()
@@ -1137,7 +1170,7 @@ def pipeline_demo(symbol, once):
                     await asyncio.sleep(5)
 
     try:
-        asyncio.run(run_demo())
+        run_async(run_demo())
     except KeyboardInterrupt:
         console.print("\n[yellow]Demo stopped[/yellow]")
 
@@ -1299,7 +1332,7 @@ def scanner_demo(once):
                     await asyncio.sleep(3)
 
     try:
-        asyncio.run(run_demo())
+        run_async(run_demo())
     except KeyboardInterrupt:
         console.print("\n[yellow]Demo stopped[/yellow]")
 
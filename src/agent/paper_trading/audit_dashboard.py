@@ -9,6 +9,12 @@ from datetime import datetime
 from src.agent.database.paper_operations import PaperTradingDatabase
 from src.agent.paper_trading.metrics_calculator import PerformanceMetricsCalculator
 
+# Pre-rendered status cells for the risk compliance table
+OK_GREEN = "[green]✓[/green]"
+BAD_RED = "[red]✗[/red]"
+CB_ACTIVE = "[red]ACTIVE[/red]"
+CB_READY = "[green]READY[/green]"
+
 class AuditDashboard:
     """Generate real-time paper trading audit reports."""
 
@@ -23,7 +29,8 @@ class AuditDashboard:
         portfolio = await self.db.get_portfolio(self.portfolio_id)
         positions = await self.db.get_open_positions(self.portfolio_id)
         metrics = await self.metrics_calc.calculate_metrics()
-        violations = await self.db.get_risk_violations(self.portfolio_id, hours=24)
+        violation_counts = await self.db.get_risk_violation_counts(self.portfolio_id, hours=24)
+        violations = await self.db.get_risk_violations(self.portfolio_id, hours=24, limit=10)
 
         # Clear screen and display
         self.console.clear()
@@ -42,7 +49,7 @@ class AuditDashboard:
         self._display_performance_metrics(metrics)
 
         # Risk Compliance
-        self._display_risk_compliance(portfolio, positions, metrics, violations)
+        self._display_risk_compliance(portfolio, positions, metrics, violation_counts)
 
         # Recent Violations
         if violations:
@@ -140,7 +147,7 @@ class AuditDashboard:
         portfolio: Dict,
         positions: List[Dict],
         metrics: Dict,
-        violations: List[Dict]
+        violation_counts: Dict[str, int]
     ) -> None:
         """Display risk compliance status."""
         # Calculate current values
@@ -161,43 +168,37 @@ class AuditDashboard:
         table.add_column("Status", style="white")
 
         # Exposure
-        exposure_status = "✓" if exposure_pct <= max_exposure else "✗"
-        exposure_color = "green" if exposure_pct <= max_exposure else "red"
         table.add_row(
             "Total Exposure",
             f"{exposure_pct:.1f}%",
             f"{max_exposure:.1f}%",
-            f"[{exposure_color}]{exposure_status}[/{exposure_color}]"
+            OK_GREEN if exposure_pct <= max_exposure else BAD_RED
         )
 
         # Drawdown
-        dd_status = "✓" if current_dd <= max_dd else "✗"
-        dd_color = "green" if current_dd <= max_dd else "red"
         table.add_row(
             "Drawdown",
             f"{current_dd:.2f}%",
             f"{max_dd:.2f}%",
-            f"[{dd_color}]{dd_status}[/{dd_color}]"
+            OK_GREEN if current_dd <= max_dd else BAD_RED
         )
 
         # Circuit breaker
-        cb_status = "ACTIVE" if circuit_breaker else "READY"
-        cb_color = "red" if circuit_breaker else "green"
         table.add_row(
             "Circuit Breaker",
-            f"[{cb_color}]{cb_status}[/{cb_color}]",
+            CB_ACTIVE if circuit_breaker else CB_READY,
             "-",
-            f"[{cb_color}]{'✗' if circuit_breaker else '✓'}[/{cb_color}]"
+            BAD_RED if circuit_breaker else OK_GREEN
         )
 
         # Violations count
-        critical_violations = len([v for v in violations if v['severity'] == 'CRITICAL'])
+        critical_violations = violation_counts['critical']
         violation_color = "red" if critical_violations > 0 else "green"
         table.add_row(
             "Violations (24h)",
-            f"[{violation_color}]{len(violations)} ({critical_violations} critical)[/{violation_color}]",
+            f"[{violation_color}]{violation_counts['total']} ({critical_violations} critical)[/{violation_color}]",
             "-",
-            f"[{violation_color}]{'✗' if critical_violations > 0 else '✓'}[/{violation_color}]"
+            BAD_RED if critical_violations > 0 else OK_GREEN
         )
 
         self.console.print(table)
@@ -211,7 +212,7 @@ class AuditDashboard:
         table.add_column("Type")
         table.add_column("Message")
 
-        for v in violations[:10]:  # Show last 10
+        for v in violations:
             severity = v['severity']
             color = {
                 'CRITICAL': 'red',
@@ -231,8 +232,6 @@ class AuditDashboard:
 
     async def display_execution_quality(self, limit: int = 20) -> None:
         """Display execution quality analysis."""
-        trades = await self.db.get_trade_history(self.portfolio_id, limit=limit)
-
         table = Table(title=f"Execution Quality (Last {limit} Trades)")
         table.add_column("Time", style="cyan")
         table.add_column("Symbol")
@@ -242,7 +241,7 @@ class AuditDashboard:
         table.add_column("Slippage %")
         table.add_column("Mode")
 
-        for trade in trades:
+        async for trade in self.db.iter_execution_quality(self.portfolio_id, limit=limit):
             slippage = trade['slippage_pct']
             slip_color = "green" if slippage < 0.1 else "yellow" if slippage < 0.3 else "red"
 
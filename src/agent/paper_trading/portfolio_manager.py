@@ -47,6 +47,11 @@ class PaperPortfolioManager:
         self.risk_manager = RiskManager(self.db, self.portfolio_id)
         await self.risk_manager.initialize()
 
+    async def close(self) -> None:
+        """Flush pending risk audit events and stop background logging."""
+        if self.risk_manager:
+            await self.risk_manager.aclose()
+
     async def execute_signal(
         self,
         signal: Dict[str, Any],
@@ -182,6 +187,7 @@ class PaperPortfolioManager:
             stop_loss=stop_loss,
             take_profit=take_profit
         )
+        self.risk_manager.record_position_change(+1)
 
         # Record execution quality
         await self.db.record_execution_quality(
@@ -270,11 +276,13 @@ class PaperPortfolioManager:
 
         # Close position in database
         await self.db.close_position(position['id'])
+        self.risk_manager.record_position_change(-1)
 
         # Update portfolio equity
         portfolio = await self.db.get_portfolio(self.portfolio_id)
         new_equity = portfolio['current_equity'] + realized_pnl
         await self.db.update_portfolio_equity(self.portfolio_id, new_equity)
+        self.risk_manager.invalidate_portfolio_cache()
 
         # Record execution quality
         await self.db.record_execution_quality(
@@ -334,11 +342,12 @@ class PaperPortfolioManager:
         # Update portfolio equity (including unrealized P&L)
         await self._update_portfolio_equity()
 
-        # Run continuous monitoring
-        alerts = await self.risk_manager.monitor_positions()
+        # Run continuous monitoring and circuit breaker checks against one snapshot
+        snap = await self.risk_manager.snapshot()
+        alerts = await self.risk_manager.monitor_positions(snap)
 
         # Check circuit breakers
-        await self.risk_manager.check_circuit_breakers()
+        await self.risk_manager.check_circuit_breakers(snap)
 
     async def _update_portfolio_equity(self) -> None:
         """Calculate and update total portfolio equity."""
@@ -355,6 +364,7 @@ class PaperPortfolioManager:
         new_equity = portfolio['starting_capital'] + total_unrealized_pnl
 
         await self.db.update_portfolio_equity(self.portfolio_id, new_equity)
+        self.risk_manager.invalidate_portfolio_cache()
 
     def get_total_value(self) -> float:
         """
@@ -374,8 +384,7 @@ class PaperPortfolioManager:
         Returns:
             Number of open positions
         """
-        positions = await self.db.get_open_positions(self.portfolio_id)
-        return len(positions)
+        return await self.db.count_open_positions(self.portfolio_id)
 
     async def calculate_exposure_pct(self) -> float:
         """
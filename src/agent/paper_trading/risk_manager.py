@@ -1,12 +1,22 @@
 """Risk management system for paper trading."""
+import asyncio
+import logging
+import time
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from src.agent.database.paper_operations import PaperTradingDatabase
+import numpy as np
 
-@dataclass
+from src.agent.database.paper_operations import PaperTradingDatabase, PositionRiskView
+
+logger = logging.getLogger(__name__)
+
+# Monitoring warns once a metric reaches this share of its limit
+WARNING_THRESHOLD_RATIO = 0.8
+
+@dataclass(frozen=True)
 class RiskLimits:
     """Risk limit configuration."""
     max_position_size_pct: float = 5.0  # % of portfolio
@@ -15,6 +25,70 @@ class RiskLimits:
     max_drawdown_pct: float = 10.0  # % loss from peak equity
     max_violations_per_hour: int = 3  # Circuit breaker trigger
 
+    # Fractions derived from the percentages above, computed once
+    max_position_size_frac: float = field(init=False, repr=False)
+    max_total_exposure_frac: float = field(init=False, repr=False)
+    max_daily_loss_frac: float = field(init=False, repr=False)
+    max_drawdown_frac: float = field(init=False, repr=False)
+    exposure_warning_frac: float = field(init=False, repr=False)
+    drawdown_warning_frac: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        derived = {
+            'max_position_size_frac': self.max_position_size_pct / 100,
+            'max_total_exposure_frac': self.max_total_exposure_pct / 100,
+            'max_daily_loss_frac': self.max_daily_loss_pct / 100,
+            'max_drawdown_frac': self.max_drawdown_pct / 100,
+        }
+        derived['exposure_warning_frac'] = derived['max_total_exposure_frac'] * WARNING_THRESHOLD_RATIO
+        derived['drawdown_warning_frac'] = derived['max_drawdown_frac'] * WARNING_THRESHOLD_RATIO
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+def _positions_to_soa(positions: List[PositionRiskView]) -> Dict[str, np.ndarray]:
+    """
+    Project position rows into column arrays (structure of arrays).
+
+    Missing stop loss / take profit levels become NaN so that comparisons
+    against them are always False.
+    """
+    if positions:
+        symbols, quantity, current_price, stop_loss, take_profit, position_type = zip(*positions)
+    else:
+        symbols = quantity = current_price = stop_loss = take_profit = position_type = ()
+
+    def levels(values: Tuple) -> np.ndarray:
+        return np.array([v if v else np.nan for v in values], dtype=np.float64)
+
+    return {
+        "symbols": np.array(symbols, dtype=object),
+        "quantity": np.array(quantity, dtype=np.float64),
+        "current_price": np.array(current_price, dtype=np.float64),
+        "stop_loss": levels(stop_loss),
+        "take_profit": levels(take_profit),
+        "is_long": np.array([t == 'LONG' for t in position_type], dtype=bool),
+    }
+
+# Below this many positions a Python loop beats NumPy call overhead
+SOA_MIN_POSITIONS = 16
+
+def _total_exposure(positions: List[PositionRiskView]) -> float:
+    """Sum quantity * current_price over positions."""
+    n = len(positions)
+    if n < SOA_MIN_POSITIONS:
+        return sum(pos.quantity * pos.current_price for pos in positions)
+
+    quantity = np.fromiter((pos.quantity for pos in positions), dtype=np.float64, count=n)
+    current_price = np.fromiter((pos.current_price for pos in positions), dtype=np.float64, count=n)
+    return float(quantity @ current_price)
+
+@dataclass
+class RiskSnapshot:
+    """Portfolio and open positions fetched once and shared by risk checks."""
+    portfolio: Dict
+    positions: List[PositionRiskView]
+    fetched_at: float  # time.monotonic() at fetch
+
 @dataclass
 class TradeProposal:
     """Proposed trade for validation."""
@@ -35,10 +109,29 @@ class RiskManager:
     4. Circuit breakers: Auto-halt on critical violations
     """
 
+    # How long a fetched portfolio row may be reused across risk checks
+    PORTFOLIO_CACHE_TTL_SECONDS = 0.25
+
+    # How long a zero open-position count is trusted before re-checking the
+    # database; other processes may open positions on the same portfolio
+    EMPTY_BOOK_TTL_SECONDS = 2.0
+
+    # Upper bound on audit events written per batch by the log consumer
+    LOG_BATCH_SIZE = 100
+
     def __init__(self, db: PaperTradingDatabase, portfolio_id: int):
         self.db = db
         self.portfolio_id = portfolio_id
         self.limits = RiskLimits()  # Will be loaded from portfolio config
+        self._portfolio_cache: Optional[Tuple[float, Dict]] = None
+        # Open-position count, None until the first fetch; lets risk checks
+        # skip the positions query while the portfolio is flat
+        self._open_position_count: Optional[int] = None
+        self._open_position_count_at = 0.0
+        # Audit events are queued and written by a background consumer,
+        # started lazily on first use (needs a running event loop)
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_consumer: Optional[asyncio.Task] = None
 
     async def initialize(self) -> None:
         """Load risk limits from portfolio configuration."""
@@ -53,20 +146,45 @@ class RiskManager:
 
     # Layer 1: Pre-Trade Validation
 
+    async def snapshot(self) -> RiskSnapshot:
+        """Fetch portfolio and open positions together for a batch of risk checks."""
+        portfolio, positions = await asyncio.gather(
+            self._get_portfolio_cached(),
+            self._get_open_positions()
+        )
+        return RiskSnapshot(portfolio, positions, time.monotonic())
+
     async def validate_trade(
         self,
-        trade: TradeProposal
+        trade: TradeProposal,
+        snap: Optional[RiskSnapshot] = None
     ) -> Tuple[bool, List[str]]:
         """
         Validate trade against all risk limits.
 
+        Args:
+            trade: Proposed trade
+            snap: Optional pre-fetched snapshot; skips the DB reads when given
+
         Returns:
             (is_valid, list_of_violations)
         """
         violations = []
 
+        # Portfolio and positions are independent reads; positions are only
+        # needed for opening trades
+        if snap is not None:
+            portfolio, positions = snap.portfolio, snap.positions
+        elif trade.position_type == "CLOSE":
+            portfolio = await self._get_portfolio_cached()
+            positions = []
+        else:
+            portfolio, positions = await asyncio.gather(
+                self._get_portfolio_cached(),
+                self._get_open_positions()
+            )
+
         # Check circuit breaker status first
-        portfolio = await self.db.get_portfolio(self.portfolio_id)
         if portfolio['circuit_breaker_active']:
             violations.append(
                 "CIRCUIT BREAKER ACTIVE - All trading halted pending manual reset"
@@ -77,7 +195,7 @@ class RiskManager:
                 "CIRCUIT_BREAKER",
                 0, 1,
                 trade.symbol,
-                "Trade blocked by active circuit breaker"
+                message="Trade blocked by active circuit breaker"
             )
             return False, violations
 
@@ -85,164 +203,143 @@ class RiskManager:
         if trade.position_type == "CLOSE":
             return True, []
 
-        # 1. Position size limit
-        position_size_valid, pos_violation = await self._check_position_size(trade)
-        if not position_size_valid:
-            violations.append(pos_violation)
-
-        # 2. Total exposure limit
-        exposure_valid, exp_violation = await self._check_total_exposure(trade)
-        if not exposure_valid:
-            violations.append(exp_violation)
-
-        # 3. Daily loss limit
-        daily_loss_valid, daily_violation = await self._check_daily_loss()
-        if not daily_loss_valid:
-            violations.append(daily_violation)
-
-        # 4. Drawdown limit
-        drawdown_valid, dd_violation = await self._check_drawdown()
-        if not drawdown_valid:
-            violations.append(dd_violation)
+        violations = self._evaluate_all_limits(trade, portfolio, positions)
 
-        # Log pre-trade blocks
+        # Log pre-trade blocks (written as one batch by the log consumer)
         if violations:
+            rule_type = "MULTIPLE" if len(violations) > 1 else "POSITION_SIZE"
             for violation in violations:
                 await self._log_risk_event(
                     "PRE_TRADE_BLOCK",
                     "CRITICAL",
-                    "MULTIPLE" if len(violations) > 1 else "POSITION_SIZE",
+                    rule_type,
                     0, 0,
                     trade.symbol,
-                    violation
+                    message=violation
                 )
 
         return len(violations) == 0, violations
 
-    async def _check_position_size(
+    def _evaluate_all_limits(
         self,
-        trade: TradeProposal
-    ) -> Tuple[bool, Optional[str]]:
-        """Check if position size is within limits."""
-        portfolio = await self.db.get_portfolio(self.portfolio_id)
-        max_position_value = portfolio['current_equity'] * (self.limits.max_position_size_pct / 100)
+        trade: TradeProposal,
+        portfolio: Dict,
+        positions: List[PositionRiskView]
+    ) -> List[str]:
+        """
+        Evaluate position size, exposure, daily loss and drawdown limits.
 
+        All four checks run in one pass over an already-fetched
+        portfolio/positions snapshot.
+
+        Returns:
+            List of violation messages, in check order
+        """
+        violations = []
+        limits = self.limits
+        current_equity = portfolio['current_equity']
         proposed_position_value = trade.quantity * trade.price
 
+        # 1. Position size limit
+        max_position_value = current_equity * limits.max_position_size_frac
         if proposed_position_value > max_position_value:
-            return False, (
+            violations.append(
                 f"Position size ${proposed_position_value:.2f} exceeds limit "
-                f"${max_position_value:.2f} ({self.limits.max_position_size_pct}% of portfolio)"
+                f"${max_position_value:.2f} ({limits.max_position_size_pct}% of portfolio)"
             )
 
-        return True, None
-
-    async def _check_total_exposure(
-        self,
-        trade: TradeProposal
-    ) -> Tuple[bool, Optional[str]]:
-        """Check total portfolio exposure."""
-        portfolio = await self.db.get_portfolio(self.portfolio_id)
-        positions = await self.db.get_open_positions(self.portfolio_id)
-
-        # Calculate current exposure
-        current_exposure = sum(
-            pos['quantity'] * pos['current_price']
-            for pos in positions
-        )
-
-        # Add proposed trade exposure
-        new_exposure = current_exposure + (trade.quantity * trade.price)
-        max_exposure = portfolio['current_equity'] * (self.limits.max_total_exposure_pct / 100)
-
-        exposure_pct = (new_exposure / portfolio['current_equity']) * 100
-
+        # 2. Total exposure limit
+        current_exposure = _total_exposure(positions)
+        new_exposure = current_exposure + proposed_position_value
+        max_exposure = current_equity * limits.max_total_exposure_frac
         if new_exposure > max_exposure:
-            return False, (
+            exposure_pct = (new_exposure / current_equity) * 100
+            violations.append(
                 f"Total exposure {exposure_pct:.1f}% exceeds limit "
-                f"{self.limits.max_total_exposure_pct}%"
+                f"{limits.max_total_exposure_pct}%"
             )
 
-        return True, None
-
-    async def _check_daily_loss(self) -> Tuple[bool, Optional[str]]:
-        """Check if daily loss limit exceeded."""
-        portfolio = await self.db.get_portfolio(self.portfolio_id)
-
+        # 3. Daily loss limit
         # Get equity at start of day (from performance metrics or first trade)
         # For simplicity, using starting capital as baseline
         # In production, would track daily starting equity
         starting_equity = portfolio['starting_capital']
-        current_equity = portfolio['current_equity']
-
-        daily_loss_pct = ((starting_equity - current_equity) / starting_equity) * 100
-
-        if daily_loss_pct > self.limits.max_daily_loss_pct:
-            return False, (
+        daily_loss = starting_equity - current_equity
+        if daily_loss > starting_equity * limits.max_daily_loss_frac:
+            daily_loss_pct = (daily_loss / starting_equity) * 100
+            violations.append(
                 f"Daily loss {daily_loss_pct:.2f}% exceeds limit "
-                f"{self.limits.max_daily_loss_pct}%"
+                f"{limits.max_daily_loss_pct}%"
             )
 
-        return True, None
-
-    async def _check_drawdown(self) -> Tuple[bool, Optional[str]]:
-        """Check if drawdown limit exceeded."""
-        portfolio = await self.db.get_portfolio(self.portfolio_id)
-
+        # 4. Drawdown limit
         peak_equity = portfolio['peak_equity']
-        current_equity = portfolio['current_equity']
-
-        drawdown_pct = ((peak_equity - current_equity) / peak_equity) * 100
-
-        if drawdown_pct > self.limits.max_drawdown_pct:
-            return False, (
+        drawdown = peak_equity - current_equity
+        if drawdown > peak_equity * limits.max_drawdown_frac:
+            drawdown_pct = (drawdown / peak_equity) * 100
+            violations.append(
                 f"Drawdown {drawdown_pct:.2f}% exceeds limit "
-                f"{self.limits.max_drawdown_pct}%"
+                f"{limits.max_drawdown_pct}%"
             )
 
-        return True, None
+        return violations
 
     # Layer 2: Continuous Monitoring
 
-    async def monitor_positions(self) -> List[Dict[str, Any]]:
+    async def monitor_positions(
+        self,
+        snap: Optional[RiskSnapshot] = None
+    ) -> List[Dict[str, Any]]:
         """
         Monitor all open positions and generate warnings.
 
+        Args:
+            snap: Optional pre-fetched snapshot; skips the DB reads when given
+
         Returns list of warnings/alerts.
         """
         alerts = []
-        portfolio = await self.db.get_portfolio(self.portfolio_id)
-        positions = await self.db.get_open_positions(self.portfolio_id)
-
-        # Check each position
-        for pos in positions:
-            # Stop loss check
-            if pos['stop_loss']:
-                if pos['position_type'] == 'LONG' and pos['current_price'] <= pos['stop_loss']:
-                    alerts.append({
-                        "type": "STOP_LOSS_HIT",
-                        "severity": "WARNING",
-                        "symbol": pos['symbol'],
-                        "message": f"Stop loss hit for {pos['symbol']} at ${pos['current_price']}"
-                    })
-
-            # Take profit check
-            if pos['take_profit']:
-                if pos['position_type'] == 'LONG' and pos['current_price'] >= pos['take_profit']:
-                    alerts.append({
-                        "type": "TAKE_PROFIT_HIT",
-                        "severity": "INFO",
-                        "symbol": pos['symbol'],
-                        "message": f"Take profit hit for {pos['symbol']} at ${pos['current_price']}"
-                    })
+        if snap is None:
+            snap = await self.snapshot()
+        portfolio, positions = snap.portfolio, snap.positions
+
+        soa = _positions_to_soa(positions)
+        current_price = soa["current_price"]
+
+        # Stop loss / take profit checks (NaN levels never match)
+        with np.errstate(invalid='ignore'):
+            sl_mask = soa["is_long"] & (current_price <= soa["stop_loss"])
+            tp_mask = soa["is_long"] & (current_price >= soa["take_profit"])
+
+        # Only positions with a hit are visited in Python
+        for i in np.flatnonzero(sl_mask | tp_mask):
+            symbol = soa["symbols"][i]
+            price = positions[i].current_price
+            if sl_mask[i]:
+                alerts.append({
+                    "type": "STOP_LOSS_HIT",
+                    "severity": "WARNING",
+                    "symbol": symbol,
+                    "message": f"Stop loss hit for {symbol} at ${price}"
+                })
+            if tp_mask[i]:
+                alerts.append({
+                    "type": "TAKE_PROFIT_HIT",
+                    "severity": "INFO",
+                    "symbol": symbol,
+                    "message": f"Take profit hit for {symbol} at ${price}"
+                })
 
         # Check portfolio-level metrics
-        total_exposure = sum(p['quantity'] * p['current_price'] for p in positions)
-        exposure_pct = (total_exposure / portfolio['current_equity']) * 100
+        limits = self.limits
+        peak_equity = portfolio['peak_equity']
+        current_equity = portfolio['current_equity']
+        # Reuses the SoA arrays already built for the level checks
+        total_exposure = float(soa["quantity"] @ current_price)
 
-        # Warning at 80% of limit
-        warning_threshold = self.limits.max_total_exposure_pct * 0.8
-        if exposure_pct > warning_threshold:
+        # Warning at WARNING_THRESHOLD_RATIO of limit
+        if total_exposure > current_equity * limits.exposure_warning_frac:
+            exposure_pct = (total_exposure / current_equity) * 100
             alerts.append({
                 "type": "EXPOSURE_WARNING",
                 "severity": "WARNING",
@@ -256,16 +353,13 @@ class RiskManager:
                 self.limits.max_total_exposure_pct,
                 exposure_pct,
                 None,
-                f"Exposure at {exposure_pct:.1f}%"
+                message=f"Exposure at {exposure_pct:.1f}%"
             )
 
         # Drawdown warning
-        peak_equity = portfolio['peak_equity']
-        current_equity = portfolio['current_equity']
-        drawdown_pct = ((peak_equity - current_equity) / peak_equity) * 100
-
-        dd_warning_threshold = self.limits.max_drawdown_pct * 0.8
-        if drawdown_pct > dd_warning_threshold:
+        drawdown = peak_equity - current_equity
+        if drawdown > peak_equity * limits.drawdown_warning_frac:
+            drawdown_pct = (drawdown / peak_equity) * 100
             alerts.append({
                 "type": "DRAWDOWN_WARNING",
                 "severity": "WARNING",
@@ -279,7 +373,7 @@ class RiskManager:
                 self.limits.max_drawdown_pct,
                 drawdown_pct,
                 None,
-                f"Drawdown at {drawdown_pct:.2f}%"
+                message=f"Drawdown at {drawdown_pct:.2f}%"
             )
 
         return alerts
@@ -292,6 +386,8 @@ class RiskManager:
         execution_result: Dict[str, Any]
     ) -> None:
         """Log trade execution quality and any violations."""
+        self.invalidate_portfolio_cache()
+
         # Log excessive slippage
         slippage = execution_result.get('slippage_pct', 0)
         if slippage > 0.5:  # > 0.5% slippage
@@ -308,43 +404,61 @@ class RiskManager:
 
     # Layer 4: Circuit Breakers
 
-    async def check_circuit_breakers(self) -> Tuple[bool, Optional[str]]:
+    async def check_circuit_breakers(
+        self,
+        snap: Optional[RiskSnapshot] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         Check if circuit breaker should be triggered.
 
+        Args:
+            snap: Optional pre-fetched snapshot; its portfolio is used instead
+                of re-reading it
+
         Returns:
             (should_trigger, reason)
         """
-        portfolio = await self.db.get_portfolio(self.portfolio_id)
+        # Queued audit events must be persisted before counting violations
+        await self.flush_risk_events()
+        violation_count_query = self.db.count_risk_violations(
+            self.portfolio_id,
+            hours=1,
+            severity="CRITICAL"
+        )
+        if snap is not None:
+            portfolio = snap.portfolio
+            violation_count = await violation_count_query
+        else:
+            portfolio, violation_count = await asyncio.gather(
+                self._get_portfolio_cached(),
+                violation_count_query
+            )
 
         # 1. Check drawdown circuit breaker
+        limits = self.limits
         peak_equity = portfolio['peak_equity']
         current_equity = portfolio['current_equity']
-        drawdown_pct = ((peak_equity - current_equity) / peak_equity) * 100
+        drawdown = peak_equity - current_equity
 
-        if drawdown_pct >= self.limits.max_drawdown_pct:
+        if drawdown >= peak_equity * limits.max_drawdown_frac:
+            drawdown_pct = (drawdown / peak_equity) * 100
             reason = f"Drawdown {drawdown_pct:.2f}% hit limit {self.limits.max_drawdown_pct}%"
             await self._trigger_circuit_breaker(reason)
             return True, reason
 
         # 2. Check daily loss circuit breaker
         starting_equity = portfolio['starting_capital']
-        daily_loss_pct = ((starting_equity - current_equity) / starting_equity) * 100
+        daily_loss = starting_equity - current_equity
 
-        if daily_loss_pct >= self.limits.max_daily_loss_pct:
+        if daily_loss >= starting_equity * limits.max_daily_loss_frac:
+            daily_loss_pct = (daily_loss / starting_equity) * 100
             reason = f"Daily loss {daily_loss_pct:.2f}% hit limit {self.limits.max_daily_loss_pct}%"
             await self._trigger_circuit_breaker(reason)
             return True, reason
 
         # 3. Check violation frequency
-        violations = await self.db.get_risk_violations(
-            self.portfolio_id,
-            hours=1,
-            severity="CRITICAL"
-        )
-
-        if len(violations) >= self.limits.max_violations_per_hour:
-            reason = f"Too many violations: {len(violations)} in past hour"
+        if violation_count >= limits.max_violations_per_hour:
+            reason = f"Too many violations: {violation_count} in past hour"
             await self._trigger_circuit_breaker(reason)
             return True, reason
 
@@ -352,21 +466,13 @@ class RiskManager:
 
     async def _trigger_circuit_breaker(self, reason: str) -> None:
         """Activate circuit breaker and halt all trading."""
-        await self.db.set_circuit_breaker(self.portfolio_id, True)
-
-        await self._log_risk_event(
-            "CIRCUIT_BREAKER",
-            "CRITICAL",
-            "AUTO_HALT",
-            0, 0,
-            None,
-            None,
-            f"Circuit breaker triggered: {reason}"
-        )
+        await self.db.trigger_circuit_breaker_atomic(self.portfolio_id, reason)
+        self.invalidate_portfolio_cache()
 
     async def reset_circuit_breaker(self) -> None:
         """Manually reset circuit breaker (requires user action)."""
         await self.db.set_circuit_breaker(self.portfolio_id, False)
+        self.invalidate_portfolio_cache()
 
         await self._log_risk_event(
             "CIRCUIT_BREAKER",
@@ -375,11 +481,61 @@ class RiskManager:
             0, 0,
             None,
             None,
-            "Circuit breaker manually reset"
+            "Circuit breaker manually reset",
+            critical=True
         )
 
     # Helper Methods
 
+    async def _get_portfolio_cached(self) -> Dict:
+        """
+        Get the portfolio row, reusing a recent fetch.
+
+        Risk checks run back-to-back against the same portfolio, so a row
+        fetched within PORTFOLIO_CACHE_TTL_SECONDS is reused instead of
+        issuing another identical query.
+        """
+        now = time.monotonic()
+        if self._portfolio_cache is not None:
+            fetched_at, portfolio = self._portfolio_cache
+            if now - fetched_at < self.PORTFOLIO_CACHE_TTL_SECONDS:
+                return portfolio
+
+        portfolio = await self.db.get_portfolio(self.portfolio_id)
+        self._portfolio_cache = (now, portfolio)
+        return portfolio
+
+    def invalidate_portfolio_cache(self) -> None:
+        """Drop the cached portfolio row after portfolio state changes."""
+        self._portfolio_cache = None
+
+    async def _get_open_positions(self) -> List[PositionRiskView]:
+        """
+        Get open positions for risk checks, skipping the query while flat.
+
+        A zero count is only trusted for EMPTY_BOOK_TTL_SECONDS; after that a
+        cheap COUNT query confirms the book is still empty, since positions
+        opened by another process never reach record_position_change.
+        """
+        if self._open_position_count == 0:
+            now = time.monotonic()
+            if now - self._open_position_count_at < self.EMPTY_BOOK_TTL_SECONDS:
+                return []
+            if await self.db.count_open_positions(self.portfolio_id) == 0:
+                self._open_position_count_at = now
+                return []
+
+        positions = await self.db.get_open_positions_risk_view(self.portfolio_id)
+        self._open_position_count = len(positions)
+        self._open_position_count_at = time.monotonic()
+        return positions
+
+    def record_position_change(self, delta: int) -> None:
+        """Adjust the tracked open-position count (+1 on open, -1 on close)."""
+        if self._open_position_count is not None:
+            self._open_position_count = max(self._open_position_count + delta, 0)
+            self._open_position_count_at = time.monotonic()
+
     async def _log_risk_event(
         self,
         event_type: str,
@@ -389,17 +545,67 @@ class RiskManager:
         current_value: float,
         symbol: Optional[str],
         trade_id: Optional[int] = None,
-        message: Optional[str] = None
+        message: Optional[str] = None,
+        critical: bool = False
     ) -> None:
-        """Log risk event to audit trail."""
-        await self.db.log_risk_event(
-            self.portfolio_id,
-            event_type,
-            severity,
-            rule_type,
-            rule_limit,
-            current_value,
-            symbol,
-            trade_id,
-            message
+        """
+        Log risk event to audit trail.
+
+        Events are queued for the background consumer so callers do not wait
+        on the insert. Pass critical=True to write synchronously where the
+        audit row must be persisted before continuing.
+        """
+        if critical:
+            await self.db.log_risk_event(
+                self.portfolio_id,
+                event_type,
+                severity,
+                rule_type,
+                rule_limit,
+                current_value,
+                symbol,
+                trade_id,
+                message
+            )
+            return
+
+        if self._log_consumer is None or self._log_consumer.done():
+            self._log_queue = asyncio.Queue()
+            self._log_consumer = asyncio.create_task(self._drain_log_queue())
+
+        self._log_queue.put_nowait(
+            (event_type, severity, rule_type, rule_limit, current_value,
+             symbol, trade_id, message)
         )
+
+    async def _drain_log_queue(self) -> None:
+        """Consume queued audit events and write them in batches."""
+        queue = self._log_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.LOG_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self.db.log_risk_events_batch(self.portfolio_id, batch)
+            except Exception as e:
+                logger.error(f"Failed to log {len(batch)} risk events: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush_risk_events(self) -> None:
+        """Wait until every queued audit event has been written."""
+        if self._log_consumer is not None and not self._log_consumer.done():
+            await self._log_queue.join()
+
+    async def aclose(self) -> None:
+        """Flush pending audit events and stop the log consumer."""
+        await self.flush_risk_events()
+        if self._log_consumer is not None:
+            self._log_consumer.cancel()
+            try:
+                await self._log_consumer
+            except asyncio.CancelledError:
+                pass
+            self._log_consumer = None
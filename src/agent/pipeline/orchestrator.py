@@ -1,8 +1,9 @@
 """Pipeline orchestrator for multi-agent trading system."""
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Union
 
 from src.agent.agents.base_agent import BaseAgent
 from src.agent.database.agent_operations import AgentOperations
@@ -53,6 +54,19 @@ class PipelineOrchestrator:
         self.db_ops = db_ops
         self.event_callback = event_callback
 
+    async def flush(self) -> None:
+        """
+        Save queued agent outputs; each run_* entry point ends with this.
+
+        Agents queue through their own db_ops, which need not be the
+        orchestrator's, so every distinct instance is flushed.
+        """
+        agents = (self.analysis_agent, self.risk_auditor, self.execution_agent, self.pnl_auditor)
+        targets = {id(self.db_ops): self.db_ops}
+        for agent in agents:
+            targets.setdefault(id(agent.db_ops), agent.db_ops)
+        await asyncio.gather(*(ops.flush_agent_outputs() for ops in targets.values()))
+
     def _emit_event(
         self,
         stage: str,
@@ -99,6 +113,23 @@ class PipelineOrchestrator:
         Returns:
             PipelineResult with status and outputs
         """
+        try:
+            return await self._run_stages(
+                session_id, symbol, momentum_data, current_price, volume_24h, portfolio_state
+            )
+        finally:
+            await self.flush()
+
+    async def _run_stages(
+        self,
+        session_id: str,
+        symbol: str,
+        momentum_data: Dict[str, float],
+        current_price: Optional[float],
+        volume_24h: Optional[float],
+        portfolio_state: Optional[Dict[str, Any]]
+    ) -> PipelineResult:
+        """Run the pipeline stages in order; see run_pipeline()."""
         logger.info(f"Starting pipeline for {symbol} (session: {session_id})")
 
         # Stage 1: Analysis
@@ -261,14 +292,46 @@ class PipelineOrchestrator:
         Returns:
             Trade review output
         """
-        return await self.pnl_auditor.run_with_tracking(
-            session_id=session_id,
-            symbol=trade.get("symbol", "UNKNOWN"),
-            input_data={
-                "mode": "TRADE_REVIEW",
-                "trade": trade
-            }
-        )
+        try:
+            return await self.pnl_auditor.run_with_tracking(
+                session_id=session_id,
+                symbol=trade.get("symbol", "UNKNOWN"),
+                input_data={
+                    "mode": "TRADE_REVIEW",
+                    "trade": trade
+                }
+            )
+        finally:
+            await self.flush()
+
+    async def run_trade_reviews(
+        self,
+        session_id: str,
+        trades: List[Dict[str, Any]],
+        max_concurrent: int = 4
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Run P&L Auditor for several closed trades concurrently.
+
+        Args:
+            session_id: Session identifier
+            trades: Closed trade details
+            max_concurrent: Most reviews in flight at once
+
+        Returns:
+            Trade review outputs in the order of trades; a failed review
+            yields its exception
+        """
+        try:
+            return await self.pnl_auditor.run_many(
+                [
+                    (session_id, trade.get("symbol", "UNKNOWN"), {"mode": "TRADE_REVIEW", "trade": trade})
+                    for trade in trades
+                ],
+                max_concurrent=max_concurrent
+            )
+        finally:
+            await self.flush()
 
     async def run_daily_report(
         self,
@@ -287,12 +350,15 @@ class PipelineOrchestrator:
         Returns:
             Daily report output
         """
-        return await self.pnl_auditor.run_with_tracking(
-            session_id=session_id,
-            symbol="PORTFOLIO",
-            input_data={
-                "mode": "DAILY_REPORT",
-                "date": date,
-                "trades": trades
-            }
-        )
+        try:
+            return await self.pnl_auditor.run_with_tracking(
+                session_id=session_id,
+                symbol="PORTFOLIO",
+                input_data={
+                    "mode": "DAILY_REPORT",
+                    "date": date,
+                    "trades": trades
+                }
+            )
+        finally:
+            await self.flush()
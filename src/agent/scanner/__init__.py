@@ -1,21 +1,35 @@
 """Market movers scanner module."""
-from .config import ScannerConfig
-from .risk_config import RiskConfig, ConfidenceTier
-from .symbol_manager import FuturesSymbolManager
-from .momentum_scanner import MomentumScanner
-from .confidence import ConfidenceCalculator
-from .risk_validator import RiskValidator
-from .prompts import PromptBuilder
-from .main_loop import MarketMoversScanner
+import importlib
+from typing import Any
 
-__all__ = [
-    'ScannerConfig',
-    'RiskConfig',
-    'ConfidenceTier',
-    'FuturesSymbolManager',
-    'MomentumScanner',
-    'ConfidenceCalculator',
-    'RiskValidator',
-    'PromptBuilder',
-    'MarketMoversScanner',
-]
+# Public name -> submodule. Submodules are imported on first attribute
+# access (PEP 562), so importing e.g. scanner.config does not pull in the
+# main loop, dashboard and their dependencies.
+_EXPORTS = {
+    'ScannerConfig': '.config',
+    'RiskConfig': '.risk_config',
+    'ConfidenceTier': '.risk_config',
+    'FuturesSymbolManager': '.symbol_manager',
+    'MomentumScanner': '.momentum_scanner',
+    'Mover': '.momentum_scanner',
+    'ConfidenceCalculator': '.confidence',
+    'RiskValidator': '.risk_validator',
+    'PromptBuilder': '.prompts',
+    'MarketMoversScanner': '.main_loop',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,13 @@
 """Wrapper for Claude Agent to provide scanner-compatible interface."""
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import asyncio
+import copy
+import hashlib
+import json
 import logging
 import time
+from types import MappingProxyType
 from claude_agent_sdk import (
     ClaudeAgentOptions,
     ClaudeSDKClient,
@@ -12,20 +17,39 @@ from claude_agent_sdk import (
     ToolUseBlock,
     ToolResultBlock
 )
-from .tools import set_signal_queue, clear_signal_queue
+from src.agent._json import dumps
+from .tools import FutureSink, SignalRelay, set_signal_queue, clear_signal_queue
 
 logger = logging.getLogger(__name__)
 
+
+class _RunState:
+    """Per-run results collected from the agent's message stream."""
+
+    __slots__ = ('findings', 'result_message')
+
+    def __init__(self):
+        self.findings: list = []
+        self.result_message: Optional[ResultMessage] = None
+
+
 class AgentWrapper:
     """Wraps Claude Agent SDK to provide scanner-compatible interface."""
 
+    # Maximum number of prompts whose signals are kept for reuse
+    RESULT_CACHE_SIZE = 256
+
+    # How long to wait for submit_trading_signal when run() is given no timeout
+    SIGNAL_TIMEOUT_SECONDS = 120.0
+
     def __init__(
         self,
         agent_options: ClaudeAgentOptions,
         token_tracker: Optional[Any] = None,
         session_manager: Optional[Any] = None,
         operation_type: str = "scanner",
-        persistent_client: bool = False
+        persistent_client: bool = False,
+        result_cache_ttl_seconds: float = 60.0
     ):
         """
         Initialize wrapper.
@@ -36,74 +60,127 @@ class AgentWrapper:
             session_manager: Optional SessionManager for session persistence
             operation_type: Type of operation for session isolation (default: scanner)
             persistent_client: If True, reuse same Claude client across multiple run() calls
+            result_cache_ttl_seconds: How long a signal is reused for an identical
+                prompt (0 disables the cache)
         """
         self.agent_options = agent_options
         self.token_tracker = token_tracker
         self.session_manager = session_manager
         self.operation_type = operation_type
         self.persistent_client = persistent_client
+        # Sentiment findings are collected from the message stream
+        self._uses_sentiment_tool = any(
+            name.endswith('fetch_sentiment_data')
+            for name in (getattr(agent_options, 'allowed_tools', None) or ())
+        )
 
         # Store persistent client and session if enabled
         self._client = None
         self._session_id = None
-
-    async def run(self, prompt: str, symbol: str = None) -> Dict[str, Any]:
+        self._client_lock = asyncio.Lock()
+        # Runs on the persistent client take turns; its tool handlers reach
+        # the current run's sink through the relay
+        self._run_lock = asyncio.Lock()
+        self._signal_relay = SignalRelay()
+
+        # Prompt hash -> (monotonic store time, signal, sentiment findings),
+        # least recently used first
+        self.result_cache_ttl_seconds = result_cache_ttl_seconds
+        self._result_cache: OrderedDict[str, Tuple[float, Dict[str, Any], list]] = OrderedDict()
+
+    async def run(
+        self,
+        prompt: str,
+        symbol: str = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Run analysis and return structured response.
 
         Uses Claude Agent SDK with tool-based output pattern:
-        1. Creates signal queue for communication
-        2. Sets queue in context for submit_trading_signal tool
+        1. Creates a single-shot signal future for communication
+        2. Sets it in context for submit_trading_signal tool
         3. Sends prompt to agent via ClaudeSDKClient
         4. Waits for agent to call submit_trading_signal (max 120s)
         5. Returns signal dict or confidence=0 on timeout/error
 
+        With a timeout, the whole analysis is bounded instead and
+        asyncio.TimeoutError is raised when it expires. The timer starts once
+        the analysis begins, not while waiting for the persistent client.
+
         Args:
             prompt: Analysis prompt
             symbol: Optional symbol for metadata tracking
+            timeout: Optional bound on the analysis in seconds
 
         Returns:
-            Dict with confidence, entry_price, stop_loss, tp1, scoring components, analysis
+            Dict with confidence, entry_price, stop_loss, tp1, scoring components,
+            analysis, and sentiment_findings collected during this run
         """
-        # Create queue for signal communication
-        signal_queue = asyncio.Queue()
+        # Identical prompts within the TTL reuse the previous signal
+        cache_key = self._prompt_cache_key(prompt)
+        cached = self._get_cached_signal(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached agent analysis for identical prompt")
+            return cached
+
+        if self.persistent_client:
+            # One shared client and session, so its runs take turns
+            async with self._run_lock:
+                return await self._analyze_within(timeout, prompt, symbol, cache_key)
+        return await self._analyze_within(timeout, prompt, symbol, cache_key)
+
+    async def _analyze_within(
+        self,
+        timeout: Optional[float],
+        prompt: str,
+        symbol: Optional[str],
+        cache_key: str
+    ) -> Dict[str, Any]:
+        """Run _analyze under the caller's timeout, or the default signal wait."""
+        if timeout is None:
+            return await self._analyze(
+                prompt, symbol, cache_key, self.SIGNAL_TIMEOUT_SECONDS
+            )
+        # A single timer: the signal wait inside is left unbounded
+        return await asyncio.wait_for(
+            self._analyze(prompt, symbol, cache_key, None), timeout
+        )
 
-        # Set queue in module-level storage so submit_trading_signal tool can access it
-        set_signal_queue(signal_queue)
+    async def _analyze(
+        self,
+        prompt: str,
+        symbol: Optional[str],
+        cache_key: str,
+        signal_timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """Run one analysis on the agent; see run()."""
+        # Single-shot future for signal communication (one signal per analysis)
+        signal_future = asyncio.get_running_loop().create_future()
+        sink = FutureSink(signal_future)
+
+        # A fresh client's tool handlers inherit this run's sink from the
+        # context; the persistent client reaches it through the relay
+        if self.persistent_client:
+            self._signal_relay.sink = sink
+        sink_token = set_signal_queue(sink)
+
+        # Findings and token usage for this run only
+        state = _RunState()
 
         # Track timing for token tracking
         start_time = time.time()
-        final_message = None
+        message_task = None
 
         try:
-            # In persistent mode, reuse existing client and session
-            if self.persistent_client and self._client is not None:
-                client = self._client
-                session_id = self._session_id
-                logger.info(f"Reusing persistent client (session: {session_id})")
+            if self.persistent_client:
+                # Reuse one client (and session) across run() calls
+                client, session_id = await self._get_client()
             else:
-                # Get existing session ID if session manager is available
-                session_id = None
-                if self.session_manager:
-                    session_id = await self.session_manager.get_session_id(
-                        self.operation_type,
-                        daily=self.persistent_client  # Use daily sessions in persistent mode
-                    )
-                    if session_id:
-                        logger.info(f"Resuming {self.operation_type} session: {session_id}")
-                    else:
-                        logger.info(f"Starting new {self.operation_type} session")
-
-                # Create agent client with configured options
-                if self.persistent_client:
-                    # In persistent mode, store the client
-                    self._client = ClaudeSDKClient(options=self.agent_options)
-                    await self._client.__aenter__()
-                    client = self._client
-                else:
-                    # In non-persistent mode, use context manager (will auto-close)
-                    client = ClaudeSDKClient(options=self.agent_options)
-                    await client.__aenter__()
+                # Fresh client per analysis, closed in the finally block
+                session_id = await self._resume_session_id()
+                client = ClaudeSDKClient(options=self.agent_options)
+                await client.__aenter__()
 
             logger.info("Starting agent analysis")
 
@@ -114,17 +191,19 @@ class AgentWrapper:
 
             await client.query(prompt, **query_options)
 
-            # Process agent messages (log for debugging and capture final message)
-            message_task = asyncio.create_task(
-                self._process_messages(client)
-            )
+            # Process agent messages (log for debugging and capture final message).
+            # The stream is only consumed when something reads the results.
+            if self._needs_message_stream():
+                message_task = asyncio.create_task(
+                    self._process_messages(client, signal_future, state)
+                )
 
-            # Wait for signal with 120-second timeout
-            # (Increased from 45s to accommodate Claude's processing speed with bundled tools)
+            # Wait for the signal (120s by default, to accommodate Claude's
+            # processing speed with bundled tools)
             try:
                 signal = await asyncio.wait_for(
-                    signal_queue.get(),
-                    timeout=120.0
+                    signal_future,
+                    timeout=signal_timeout
                 )
 
                 logger.info(
@@ -132,18 +211,17 @@ class AgentWrapper:
                     f"symbol={signal['symbol']}"
                 )
 
-                # Cancel message processing task
-                message_task.cancel()
-                try:
-                    await message_task
-                except asyncio.CancelledError:
-                    pass
+                # The signal is all we need; stop the agent generating further
+                # turns on the shared client, then stop reading its stream
+                if self.persistent_client:
+                    await self._interrupt_client(client)
+                await self._cancel_message_task(message_task)
 
                 # Record token usage if tracker is available
-                if self.token_tracker and hasattr(self, '_result_message'):
+                if self.token_tracker and state.result_message is not None:
                     duration = time.time() - start_time
                     await self.token_tracker.record_usage(
-                        result=self._result_message,
+                        result=state.result_message,
                         operation_type="mover_analysis",
                         duration_seconds=duration,
                         metadata={"symbol": symbol or signal.get('symbol', 'unknown')}
@@ -166,22 +244,30 @@ class AgentWrapper:
                         metadata=f'{{"symbol": "{symbol or signal.get("symbol", "unknown")}"}}'
                     )
 
+                self._cache_signal(cache_key, signal, state.findings)
+                signal['sentiment_findings'] = state.findings
                 return signal
 
             except asyncio.TimeoutError:
                 logger.warning(
-                    "Agent analysis timeout after 120 seconds - "
+                    f"Agent analysis timeout after {signal_timeout:.0f} seconds - "
                     "agent did not call submit_trading_signal"
                 )
 
                 # Cancel message processing
-                message_task.cancel()
-                try:
-                    await message_task
-                except asyncio.CancelledError:
-                    pass
+                await self._cancel_message_task(message_task)
 
-                return self._timeout_response()
+                response = self._timeout_response()
+                response['sentiment_findings'] = state.findings
+                return response
+
+        except asyncio.CancelledError:
+            # Cancelled by the caller (e.g. its timeout): stop the agent and the
+            # stream reader so neither carries over into the next run
+            await self._cancel_message_task(message_task)
+            if self.persistent_client and 'client' in locals():
+                await self._interrupt_client(client)
+            raise
 
         except Exception as e:
             logger.error(f"Error in agent analysis: {e}", exc_info=True)
@@ -189,102 +275,194 @@ class AgentWrapper:
 
         finally:
             # Clean up queue
-            clear_signal_queue()
+            clear_signal_queue(sink_token)
+            if self.persistent_client:
+                self._signal_relay.sink = None
 
             # Only close client if NOT in persistent mode
             if not self.persistent_client and 'client' in locals():
                 await client.__aexit__(None, None, None)
 
-    async def _process_messages(self, client: ClaudeSDKClient):
+    @staticmethod
+    def _prompt_cache_key(prompt: str) -> str:
+        """Hash a prompt into a compact result cache key."""
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_signal(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of a fresh cached signal, evicting it if expired.
+
+        The copy carries the sentiment findings of the run that produced it.
+        """
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        stored_at, signal, findings = entry
+        if time.monotonic() - stored_at >= self.result_cache_ttl_seconds:
+            del self._result_cache[cache_key]
+            return None
+
+        self._result_cache.move_to_end(cache_key)
+        # Callers may mutate the signal, so never hand out the cached object
+        cached = copy.deepcopy(signal)
+        cached['sentiment_findings'] = copy.deepcopy(findings)
+        return cached
+
+    def _cache_signal(self, cache_key: str, signal: Dict[str, Any], findings: list) -> None:
+        """Store a signal and its findings for reuse; zero-confidence results are not cached."""
+        if self.result_cache_ttl_seconds <= 0 or not signal.get('confidence'):
+            return
+
+        self._result_cache[cache_key] = (
+            time.monotonic(), copy.deepcopy(signal), copy.deepcopy(findings)
+        )
+        self._result_cache.move_to_end(cache_key)
+        while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached analysis results."""
+        self._result_cache.clear()
+
+    async def _resume_session_id(self) -> Optional[str]:
+        """Look up the session to resume, if a session manager is available."""
+        if not self.session_manager:
+            return None
+
+        session_id = await self.session_manager.get_session_id(
+            self.operation_type,
+            daily=self.persistent_client  # Use daily sessions in persistent mode
+        )
+        if session_id:
+            logger.info(f"Resuming {self.operation_type} session: {session_id}")
+        else:
+            logger.info(f"Starting new {self.operation_type} session")
+        return session_id
+
+    async def _get_client(self):
+        """
+        Get the persistent client, connecting it on first use.
+
+        Returns:
+            Tuple of (client, session_id)
+        """
+        async with self._client_lock:
+            if self._client is None:
+                session_id = await self._resume_session_id()
+                client = ClaudeSDKClient(options=self.agent_options)
+                # Tasks spawned on connect keep this context, so later runs'
+                # signals arrive through the relay
+                relay_token = set_signal_queue(self._signal_relay)
+                try:
+                    await client.__aenter__()
+                finally:
+                    clear_signal_queue(relay_token)
+                self._client = client
+                self._session_id = session_id
+            else:
+                logger.info(f"Reusing persistent client (session: {self._session_id})")
+
+            return self._client, self._session_id
+
+    def _needs_message_stream(self) -> bool:
+        """
+        Check whether the agent's message stream has a consumer.
+
+        Messages feed INFO logging, token tracking (ResultMessage) and the
+        sentiment findings, so the stream is always read when the agent may
+        call fetch_sentiment_data. A persistent client's stream is also read
+        during each run; once the signal arrives the run interrupts the agent
+        and stops reading, so the stream is not drained.
+        """
+        return (
+            self._uses_sentiment_tool
+            or logger.isEnabledFor(logging.INFO)
+            or self.token_tracker is not None
+            or self.persistent_client
+        )
+
+    @staticmethod
+    async def _cancel_message_task(message_task: Optional[asyncio.Task]) -> None:
+        """Cancel the message processing task if one was started."""
+        if message_task is None:
+            return
+
+        message_task.cancel()
+        try:
+            await message_task
+        except asyncio.CancelledError:
+            pass
+
+    @staticmethod
+    async def _interrupt_client(client: ClaudeSDKClient) -> None:
+        """Ask the agent to stop generating; failures are non-fatal."""
+        try:
+            await client.interrupt()
+        except Exception as e:
+            logger.debug(f"Agent interrupt failed: {e}")
+
+    async def _process_messages(
+        self,
+        client: ClaudeSDKClient,
+        signal_future: Optional[asyncio.Future] = None,
+        state: Optional[_RunState] = None
+    ):
         """
         Process messages from agent for logging/debugging.
 
         Args:
             client: ClaudeSDKClient instance
+            signal_future: Stop reading once this future holds the signal
+            state: Collects this run's sentiment findings and ResultMessage
         """
+        if state is None:
+            state = _RunState()
+
         # Track tool calls to detect duplicates
         tool_call_count = {}
         message_count = 0
 
-        # Track sentiment data for summary
-        self._sentiment_findings = []
+        # Resolve the log level once for the whole stream
+        verbose = logger.isEnabledFor(logging.INFO)
 
         try:
             async for message in client.receive_response():
+                # Messages after the signal are not needed
+                if signal_future is not None and signal_future.done():
+                    break
+
                 # Log raw message type for debugging
                 message_type = type(message).__name__
                 logger.debug(f"📬 Received message type: {message_type}")
 
                 # Capture ResultMessage for token tracking
                 if isinstance(message, ResultMessage):
-                    self._result_message = message
+                    state.result_message = message
 
                 if isinstance(message, AssistantMessage):
                     # Track assistant messages for debugging
                     message_count += 1
 
-                    # Count tools in this message
-                    tools_in_message = []
-                    for block in message.content:
-                        if isinstance(block, ToolUseBlock):
-                            tools_in_message.append(block.name)
-
-                    # Log message summary
-                    if tools_in_message:
-                        logger.info(
-                            f"📨 Message #{message_count}: {len(tools_in_message)} tool(s) - "
-                            f"{', '.join(tools_in_message)}"
-                        )
-                    else:
-                        logger.info(f"📨 Message #{message_count}: text only (no tools)")
+                    # Log message summary (tool names only gathered when shown)
+                    if verbose:
+                        tools_in_message = [
+                            block.name for block in message.content
+                            if type(block) is ToolUseBlock
+                        ]
+                        if tools_in_message:
+                            logger.info(
+                                f"📨 Message #{message_count}: {len(tools_in_message)} tool(s) - "
+                                f"{', '.join(tools_in_message)}"
+                            )
+                        else:
+                            logger.info(f"📨 Message #{message_count}: text only (no tools)")
 
                     # Process blocks for detailed logging
                     for block in message.content:
-                        if isinstance(block, TextBlock):
-                            # Log full agent reasoning
-                            text = block.text
-                            if len(text) > 500:
-                                logger.info(f"💭 Agent reasoning:\n{text[:500]}...\n[{len(text)-500} more chars]")
-                            else:
-                                logger.info(f"💭 Agent reasoning:\n{text}")
-                        elif isinstance(block, ToolUseBlock):
-                            # Track tool call frequency
-                            tool_key = f"{block.name}"
-                            tool_call_count[tool_key] = tool_call_count.get(tool_key, 0) + 1
-
-                            # Log tool usage with full parameters
-                            params_str = ""
-                            if hasattr(block, 'input') and block.input:
-                                import json
-                                params_str = json.dumps(block.input, indent=2)
-
-                            # Warn on duplicate calls
-                            duplicate_marker = ""
-                            if tool_call_count[tool_key] > 1:
-                                duplicate_marker = f" ⚠️  DUPLICATE #{tool_call_count[tool_key]}"
-
-                            logger.info(
-                                f"🔧 Tool call: {block.name}{duplicate_marker}\n"
-                                f"   Parameters: {params_str}"
-                            )
-                        elif isinstance(block, ToolResultBlock):
-                            # Log tool results
-                            tool_id = block.tool_use_id
-                            is_error = block.is_error if hasattr(block, 'is_error') else False
-                            content = block.content if hasattr(block, 'content') else str(block)
-
-                            if is_error:
-                                logger.error(f"❌ Tool error (ID: {tool_id}):\n{content}")
-                            else:
-                                # Check if this is a sentiment data result
-                                self._process_sentiment_result(block)
-
-                                # Truncate long results
-                                content_str = str(content)
-                                if len(content_str) > 300:
-                                    logger.info(f"✅ Tool result (ID: {tool_id}):\n{content_str[:300]}...\n[{len(content_str)-300} more chars]")
-                                else:
-                                    logger.info(f"✅ Tool result (ID: {tool_id}):\n{content_str}")
+                        handler = self._BLOCK_HANDLERS.get(type(block))
+                        if handler is not None:
+                            handler(self, block, tool_call_count, verbose, state)
                         else:
                             # Log unknown block types
                             logger.debug(f"🔍 Unknown block type: {type(block).__name__}")
@@ -313,6 +491,107 @@ class AgentWrapper:
         except Exception as e:
             logger.error(f"Error processing agent messages: {e}", exc_info=True)
 
+    def _handle_text_block(
+        self,
+        block: TextBlock,
+        tool_call_count: Dict[str, int],
+        verbose: bool,
+        state: _RunState
+    ) -> None:
+        """Log agent reasoning text."""
+        if not verbose:
+            return
+
+        text = block.text
+        if len(text) > 500:
+            logger.info(f"💭 Agent reasoning:\n{text[:500]}...\n[{len(text)-500} more chars]")
+        else:
+            logger.info(f"💭 Agent reasoning:\n{text}")
+
+    def _handle_tool_use_block(
+        self,
+        block: ToolUseBlock,
+        tool_call_count: Dict[str, int],
+        verbose: bool,
+        state: _RunState
+    ) -> None:
+        """Count a tool call and log its parameters."""
+        # Track tool call frequency (needed for the duplicate summary)
+        tool_key = f"{block.name}"
+        tool_call_count[tool_key] = tool_call_count.get(tool_key, 0) + 1
+
+        if not verbose:
+            return
+
+        # Log tool usage with full parameters
+        params_str = ""
+        block_input = getattr(block, 'input', None)
+        if block_input:
+            params_str = dumps(block_input, pretty=True)
+
+        # Warn on duplicate calls
+        duplicate_marker = ""
+        if tool_call_count[tool_key] > 1:
+            duplicate_marker = f" ⚠️  DUPLICATE #{tool_call_count[tool_key]}"
+
+        logger.info(
+            f"🔧 Tool call: {block.name}{duplicate_marker}\n"
+            f"   Parameters: {params_str}"
+        )
+
+    def _handle_tool_result_block(
+        self,
+        block: ToolResultBlock,
+        tool_call_count: Dict[str, int],
+        verbose: bool,
+        state: _RunState
+    ) -> None:
+        """Log a tool result and collect sentiment findings."""
+        tool_id = block.tool_use_id
+        is_error = getattr(block, 'is_error', False)
+        # Fall back to the block itself; it is only formatted when logged
+        content = getattr(block, 'content', block)
+
+        if is_error:
+            logger.error(f"❌ Tool error (ID: {tool_id}):\n{content}")
+            return
+
+        # Check if this is a sentiment data result
+        self._process_sentiment_result(block, state.findings)
+
+        if not verbose:
+            return
+
+        # Truncate long results
+        content_str = str(content)
+        if len(content_str) > 300:
+            logger.info(f"✅ Tool result (ID: {tool_id}):\n{content_str[:300]}...\n[{len(content_str)-300} more chars]")
+        else:
+            logger.info(f"✅ Tool result (ID: {tool_id}):\n{content_str}")
+
+    # Block type -> handler, looked up by exact type in _process_messages
+    _BLOCK_HANDLERS = {
+        TextBlock: _handle_text_block,
+        ToolUseBlock: _handle_tool_use_block,
+        ToolResultBlock: _handle_tool_result_block,
+    }
+
+    # Zero-confidence responses returned on timeout/error; copied per call
+    _ERROR_RESPONSE_BASE = MappingProxyType({
+        'confidence': 0,
+        'entry_price': None,
+        'stop_loss': None,
+        'tp1': None,
+        'technical_score': 0.0,
+        'sentiment_score': 0.0,
+        'liquidity_score': 0.0,
+        'correlation_score': 0.0,
+    })
+    _TIMEOUT_RESPONSE_TEMPLATE = MappingProxyType({
+        **_ERROR_RESPONSE_BASE,
+        'analysis': 'Analysis timeout - exceeded 60 second limit'
+    })
+
     def _timeout_response(self) -> Dict[str, Any]:
         """
         Build response for timeout case.
@@ -320,17 +599,7 @@ class AgentWrapper:
         Returns:
             Dict with confidence=0 and timeout message
         """
-        return {
-            'confidence': 0,
-            'entry_price': None,
-            'stop_loss': None,
-            'tp1': None,
-            'technical_score': 0.0,
-            'sentiment_score': 0.0,
-            'liquidity_score': 0.0,
-            'correlation_score': 0.0,
-            'analysis': 'Analysis timeout - exceeded 60 second limit'
-        }
+        return dict(self._TIMEOUT_RESPONSE_TEMPLATE)
 
     def _error_response(self, error_msg: str) -> Dict[str, Any]:
         """
@@ -342,30 +611,21 @@ class AgentWrapper:
         Returns:
             Dict with confidence=0 and error message
         """
-        return {
-            'confidence': 0,
-            'entry_price': None,
-            'stop_loss': None,
-            'tp1': None,
-            'technical_score': 0.0,
-            'sentiment_score': 0.0,
-            'liquidity_score': 0.0,
-            'correlation_score': 0.0,
-            'analysis': f'Analysis error: {error_msg}'
-        }
-
-    def _process_sentiment_result(self, tool_result_block: ToolResultBlock):
+        return {**self._ERROR_RESPONSE_BASE, 'analysis': f'Analysis error: {error_msg}'}
+
+    def _process_sentiment_result(self, tool_result_block: ToolResultBlock, findings: list):
         """
         Process sentiment tool result and display web search findings.
 
         Args:
             tool_result_block: ToolResultBlock from fetch_sentiment_data
+            findings: The run's findings list to append the summary to
         """
         try:
-            import json
-
             # Extract content from block
-            content = tool_result_block.content if hasattr(tool_result_block, 'content') else str(tool_result_block)
+            content = getattr(tool_result_block, 'content', None)
+            if content is None:
+                content = str(tool_result_block)
 
             # Try to parse as JSON
             if isinstance(content, str):
@@ -421,26 +681,26 @@ class AgentWrapper:
                     logger.info("   • No significant news found")
 
             # Store for summary display later
-            if hasattr(self, '_sentiment_findings'):
-                self._sentiment_findings.append({
-                    'success': success,
-                    'warnings': warnings,
-                    'web_results': web_results,
-                    'summary': sentiment_summary,
-                    'bullet_points': bullet_points if 'bullet_points' in locals() else []
-                })
+            findings.append({
+                'success': success,
+                'warnings': warnings,
+                'web_results': web_results,
+                'summary': sentiment_summary,
+                'bullet_points': bullet_points if 'bullet_points' in locals() else []
+            })
 
         except Exception as e:
             logger.debug(f"Could not process sentiment result: {e}")
 
-    def get_sentiment_findings(self) -> list:
-        """Get collected sentiment findings for summary display."""
-        return getattr(self, '_sentiment_findings', [])
-
     async def cleanup(self):
         """Clean up persistent client if exists."""
-        if self._client:
-            await self._client.__aexit__(None, None, None)
-            self._client = None
-            self._session_id = None
-            logger.info("Persistent client cleaned up")
+        async with self._client_lock:
+            if self._client:
+                await self._client.__aexit__(None, None, None)
+                self._client = None
+                self._session_id = None
+                logger.info("Persistent client cleaned up")
+
+    async def aclose(self):
+        """Close the persistent client (alias of cleanup)."""
+        await self.cleanup()
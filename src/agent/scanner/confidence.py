@@ -1,9 +1,136 @@
 """Confidence score calculation for trading signals."""
+from enum import IntEnum
 from typing import Dict, Any
 import logging
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
+
+class MacdSignal(IntEnum):
+    """MACD signal categories."""
+    NONE = 0
+    BULLISH_CROSS = 1
+    BEARISH_CROSS = 2
+    HISTOGRAM_POSITIVE = 3
+
+
+class BBPosition(IntEnum):
+    """Price position relative to the Bollinger Bands."""
+    MIDDLE = 0
+    UPPER = 1
+    LOWER = 2
+
+
+class SentimentClass(IntEnum):
+    """News sentiment classification."""
+    NEUTRAL = 0
+    STRONG_POSITIVE = 1
+    MILD_POSITIVE = 2
+    MILD_NEGATIVE = 3
+    STRONG_NEGATIVE = 4
+
+
+# One-time translation of legacy string values; unknown strings map to code 0
+_MACD_CODES = {
+    'bullish_cross': MacdSignal.BULLISH_CROSS,
+    'bearish_cross': MacdSignal.BEARISH_CROSS,
+    'histogram_positive': MacdSignal.HISTOGRAM_POSITIVE,
+}
+_BB_CODES = {
+    'middle': BBPosition.MIDDLE,
+    'upper': BBPosition.UPPER,
+    'lower': BBPosition.LOWER,
+}
+_SENTIMENT_CODES = {member.name: member for member in SentimentClass}
+
+# Score tables indexed by enum value
+_MACD_POINTS = np.array([0, 2, -2, 1], dtype=np.int64)
+_BB_POINTS = np.array([0, 1, 1], dtype=np.int64)
+_SENTIMENT_SCORES = np.array([12.0, 27.5, 19.5, 7.0, 2.0])  # LONG; SHORT uses 30 - score
+
+
+def _category_code(value: Any, codes: Dict[str, int]) -> int:
+    """Map an enum member (or int code) or legacy string to its int code."""
+    if isinstance(value, int):
+        return int(value)
+    return codes.get(value, 0)
+
+
+@njit(cache=True)
+def _confidence_kernel(
+    weights, rsi, macd_points, bb_extreme, tf_volume_ratio,
+    sentiment_base, is_short,
+    volume_ratio, bid_ask_spread, order_book_depth,
+    btc_change, symbol_change
+):
+    """
+    Compute all four component scores and the final confidence in one pass.
+
+    Mirrors the individual ConfidenceCalculator.calculate_* methods over
+    pre-marshalled arrays/scalars so it can be compiled by Numba.
+
+    Returns:
+        (technical, sentiment, liquidity, correlation, confidence)
+    """
+    # Technical (0-40)
+    technical = 0.0
+    for i in range(weights.shape[0]):
+        r = rsi[i]
+        if 30 <= r <= 70:
+            points = 2
+        elif r < 30:
+            points = 1
+        elif r > 70:
+            points = -1
+        else:
+            points = 0
+        points += macd_points[i] + bb_extreme[i]
+        if tf_volume_ratio[i] > 1.0:
+            points += 2
+        technical += points / 7 * weights[i] * 40
+    technical = min(technical, 40.0)
+
+    # Sentiment (0-30), inverted for SHORT
+    sentiment = 30.0 - sentiment_base if is_short else sentiment_base
+
+    # Liquidity (0-20)
+    if volume_ratio >= 2.0:
+        liquidity = 20.0
+    elif volume_ratio >= 1.5:
+        liquidity = 15.0
+    elif volume_ratio >= 1.0:
+        liquidity = 10.0
+    else:
+        liquidity = 5.0
+    if bid_ask_spread < 0.05:
+        liquidity = min(liquidity + 5, 20.0)
+    if order_book_depth > 500_000:
+        liquidity = min(liquidity + 3, 20.0)
+
+    # Correlation (0-10)
+    if btc_change > 0:
+        correlation = 10.0 if symbol_change > 0 else 5.0
+    else:
+        correlation = 7.0 if symbol_change > 0 else 3.0
+    if symbol_change - btc_change > 3.0:
+        correlation = min(correlation + 3, 10.0)
+
+    confidence = technical + sentiment + liquidity + correlation
+    confidence = 0.0 if confidence < 0.0 else 100.0 if confidence > 100.0 else confidence
+
+    return technical, sentiment, liquidity, correlation, int(confidence)
+
 class ConfidenceCalculator:
     """Calculates multi-factor confidence scores (0-100)."""
 
@@ -16,56 +143,67 @@ class ConfidenceCalculator:
         '1m': 0.10,
     }
 
+    # Timeframes in weight order, and their weights as a vector
+    _TIMEFRAMES = tuple(TIMEFRAME_WEIGHTS)
+    _WEIGHTS = np.array(list(TIMEFRAME_WEIGHTS.values()))
+
+    # Liquidity base score per volume-ratio bucket: <1.0, <1.5, <2.0, >=2.0
+    _LIQUIDITY_THRESHOLDS = np.array([1.0, 1.5, 2.0])
+    _LIQUIDITY_SCORES = np.array([5, 10, 15, 20])
+
+    # Correlation base score for (BTC down, sym down), (BTC down, sym up),
+    # (BTC up, sym down), (BTC up, sym up)
+    _CORRELATION_SCORES = np.array([3, 7, 5, 10])
+
+    def _technical_arrays(self, technical_data: Dict[str, Dict[str, Any]]):
+        """
+        Marshal per-timeframe indicators into arrays in TIMEFRAME_WEIGHTS order.
+
+        Returns:
+            (weights, rsi, macd_points, bb_extreme, volume_ratio); missing
+            timeframes get zero weight
+        """
+        frames = [technical_data.get(tf) for tf in self._TIMEFRAMES]
+        weights = self._WEIGHTS * np.array([data is not None for data in frames])
+        frames = [data or {} for data in frames]
+
+        rsi = np.array([data.get('rsi', 50) for data in frames], dtype=np.float64)
+        macd_points = _MACD_POINTS[
+            [_category_code(data.get('macd_signal', MacdSignal.NONE), _MACD_CODES) for data in frames]
+        ]
+        bb_extreme = _BB_POINTS[
+            [_category_code(data.get('bb_position', BBPosition.MIDDLE), _BB_CODES) for data in frames]
+        ]
+        volume_ratio = np.array(
+            [data.get('volume_ratio', 1.0) for data in frames], dtype=np.float64
+        )
+        return weights, rsi, macd_points, bb_extreme, volume_ratio
+
     def calculate_technical_score(self, technical_data: Dict[str, Dict[str, Any]]) -> float:
         """
         Calculate technical alignment score (0-40 points).
 
+        Indicators for all timeframes are gathered into arrays and scored
+        together; missing timeframes get zero weight.
+
         Args:
             technical_data: Dict of timeframe -> indicators
 
         Returns:
             Score 0-40
         """
-        weighted_sum = 0.0
-
-        for timeframe, weight in self.TIMEFRAME_WEIGHTS.items():
-            if timeframe not in technical_data:
-                continue
+        weights, rsi, macd_points, bb_extreme, volume_ratio = self._technical_arrays(technical_data)
 
-            data = technical_data[timeframe]
-            points = 0
+        # RSI: neutral band +2, oversold bounce potential +1, overbought -1
+        rsi_points = np.where(
+            (rsi >= 30) & (rsi <= 70), 2,
+            np.where(rsi < 30, 1, np.where(rsi > 70, -1, 0))
+        )
+        points = rsi_points + macd_points + bb_extreme + 2 * (volume_ratio > 1.0)
 
-            # RSI scoring
-            rsi = data.get('rsi', 50)
-            if 30 <= rsi <= 70:
-                points += 2
-            elif rsi < 30:
-                points += 1  # Oversold bounce potential
-            elif rsi > 70:
-                points -= 1  # Overbought
-
-            # MACD scoring
-            macd_signal = data.get('macd_signal', '')
-            if macd_signal == 'bullish_cross':
-                points += 2
-            elif macd_signal == 'bearish_cross':
-                points -= 2
-            elif macd_signal == 'histogram_positive':
-                points += 1
-
-            # Bollinger Bands scoring
-            bb_position = data.get('bb_position', 'middle')
-            if bb_position in ['upper', 'lower']:
-                points += 1
-
-            # Volume scoring
-            volume_ratio = data.get('volume_ratio', 1.0)
-            if volume_ratio > 1.0:
-                points += 2
-
-            # Weight by timeframe
-            max_points = 7  # Max possible per timeframe
-            weighted_sum += (points / max_points) * weight * 40
+        # Weight by timeframe
+        max_points = 7  # Max possible per timeframe
+        weighted_sum = float((points / max_points * 40) @ weights)
 
         return min(weighted_sum, 40.0)
 
@@ -80,18 +218,9 @@ class ConfidenceCalculator:
         Returns:
             Score 0-30
         """
-        classification = sentiment_data.get('classification', 'NEUTRAL')
-
-        # Base scores for LONG
-        score_map = {
-            'STRONG_POSITIVE': 27.5,
-            'MILD_POSITIVE': 19.5,
-            'NEUTRAL': 12.0,
-            'MILD_NEGATIVE': 7.0,
-            'STRONG_NEGATIVE': 2.0,
-        }
+        classification = sentiment_data.get('classification', SentimentClass.NEUTRAL)
 
-        score = score_map.get(classification, 12.0)
+        score = float(_SENTIMENT_SCORES[_category_code(classification, _SENTIMENT_CODES)])
 
         # Invert for SHORT positions
         if direction == 'SHORT':
@@ -111,26 +240,17 @@ class ConfidenceCalculator:
         """
         volume_ratio = liquidity_data.get('volume_ratio', 1.0)
 
-        # Base score from volume
-        if volume_ratio >= 2.0:
-            score = 20
-        elif volume_ratio >= 1.5:
-            score = 15
-        elif volume_ratio >= 1.0:
-            score = 10
-        else:
-            score = 5
+        # Base score from volume: bucket index = thresholds at or below the ratio
+        score = self._LIQUIDITY_SCORES[
+            np.searchsorted(self._LIQUIDITY_THRESHOLDS, volume_ratio, side='right')
+        ]
 
         # Bonuses (but cap total at 20)
         bid_ask_spread = liquidity_data.get('bid_ask_spread_pct', 0.1)
-        if bid_ask_spread < 0.05:
-            score = min(score + 5, 20)
-
         order_book_depth = liquidity_data.get('order_book_depth_usd', 0)
-        if order_book_depth > 500_000:
-            score = min(score + 3, 20)
+        score += 5 * (bid_ask_spread < 0.05) + 3 * (order_book_depth > 500_000)
 
-        return min(score, 20.0)
+        return float(min(score, 20.0))
 
     def calculate_correlation_score(self, correlation_data: Dict[str, Any]) -> float:
         """
@@ -146,17 +266,13 @@ class ConfidenceCalculator:
         symbol_change = correlation_data.get('symbol_change_1h', 0)
         relative_strength = symbol_change - btc_change
 
-        # Base score
-        if btc_change > 0:  # BTC uptrend
-            score = 10 if symbol_change > 0 else 5
-        else:  # BTC downtrend
-            score = 7 if symbol_change > 0 else 3
+        # Base score indexed by (BTC uptrend, symbol up)
+        score = self._CORRELATION_SCORES[2 * (btc_change > 0) + (symbol_change > 0)]
 
         # Bonus for strong outperformance
-        if relative_strength > 3.0:
-            score = min(score + 3, 10)
+        score += 3 * (relative_strength > 3.0)
 
-        return min(score, 10.0)
+        return float(min(score, 10.0))
 
     def calculate_final_confidence(
         self,
@@ -178,5 +294,46 @@ class ConfidenceCalculator:
             Final confidence (0-100)
         """
         confidence = technical + sentiment + liquidity + correlation
-        confidence = min(max(confidence, 0), 100)  # Clamp 0-100
-        return int(confidence)
+        # Clamp 0-100 inline rather than through min()/max() calls
+        return int(0 if confidence < 0 else 100 if confidence > 100 else confidence)
+
+    def calculate_confidence(
+        self,
+        technical_data: Dict[str, Dict[str, Any]],
+        sentiment_data: Dict[str, Any],
+        liquidity_data: Dict[str, Any],
+        correlation_data: Dict[str, Any],
+        direction: str
+    ) -> Dict[str, float]:
+        """
+        Calculate every component score and the final confidence at once.
+
+        Equivalent to calling the four calculate_*_score methods and
+        calculate_final_confidence, but runs as one kernel (compiled with
+        Numba when it is installed).
+
+        Returns:
+            Dict with technical, sentiment, liquidity, correlation and confidence
+        """
+        weights, rsi, macd_points, bb_extreme, tf_volume_ratio = self._technical_arrays(technical_data)
+        sentiment_base = float(_SENTIMENT_SCORES[_category_code(
+            sentiment_data.get('classification', SentimentClass.NEUTRAL), _SENTIMENT_CODES
+        )])
+
+        technical, sentiment, liquidity, correlation, confidence = _confidence_kernel(
+            weights, rsi, macd_points, bb_extreme, tf_volume_ratio,
+            sentiment_base, direction == 'SHORT',
+            float(liquidity_data.get('volume_ratio', 1.0)),
+            float(liquidity_data.get('bid_ask_spread_pct', 0.1)),
+            float(liquidity_data.get('order_book_depth_usd', 0)),
+            float(correlation_data.get('btc_change_1h', 0)),
+            float(correlation_data.get('symbol_change_1h', 0))
+        )
+
+        return {
+            'technical': technical,
+            'sentiment': sentiment,
+            'liquidity': liquidity,
+            'correlation': correlation,
+            'confidence': confidence,
+        }
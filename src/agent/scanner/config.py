@@ -1,30 +1,80 @@
 """Scanner configuration."""
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import Any, Dict
+
+# Field name -> (environment variable, type, default)
+_ENV_FIELDS = {
+    'scan_interval_seconds': ('SCAN_INTERVAL', int, '300'),
+    'mover_threshold_pct': ('MOVER_THRESHOLD', float, '5.0'),
+    'max_movers_per_scan': ('MAX_MOVERS_PER_SCAN', int, '20'),
+    'min_volume_usd': ('MIN_VOLUME_USD', float, '5000000'),
+    'min_confidence': ('MIN_CONFIDENCE', int, '60'),
+    'agent_timeout_seconds': ('AGENT_TIMEOUT', int, '120'),
+    'max_concurrent_analyses': ('MAX_CONCURRENT_ANALYSES', int, '3'),
+    'web_search_mcp_url': ('WEB_SEARCH_MCP_URL', str, 'http://localhost:3000/mcp'),
+    'web_search_timeout_seconds': ('WEB_SEARCH_TIMEOUT', int, '30'),
+    'monitoring_interval_seconds': ('MONITORING_INTERVAL', int, '300'),
+    'symbols_cache_path': ('SYMBOLS_CACHE', str, '.symbols_cache.json'),
+}
+
+
+def _read_env() -> Dict[str, Any]:
+    """Parse the environment-backed config fields."""
+    return {
+        name: cast(os.getenv(var, default))
+        for name, (var, cast, default) in _ENV_FIELDS.items()
+    }
+
+
+# Resolved once at import; use ScannerConfig.from_env() to re-read
+_ENV = _read_env()
+
 
 @dataclass
 class ScannerConfig:
     """Configuration for market movers scanner."""
 
     # Scanning parameters
-    scan_interval_seconds: int = field(default_factory=lambda: int(os.getenv('SCAN_INTERVAL', '300')))
-    mover_threshold_pct: float = field(default_factory=lambda: float(os.getenv('MOVER_THRESHOLD', '5.0')))
-    max_movers_per_scan: int = field(default_factory=lambda: int(os.getenv('MAX_MOVERS_PER_SCAN', '20')))
-    min_volume_usd: float = field(default_factory=lambda: float(os.getenv('MIN_VOLUME_USD', '5000000')))
+    scan_interval_seconds: int = _ENV['scan_interval_seconds']
+    mover_threshold_pct: float = _ENV['mover_threshold_pct']
+    max_movers_per_scan: int = _ENV['max_movers_per_scan']
+    min_volume_usd: float = _ENV['min_volume_usd']
+    symbol_refresh_interval_seconds: int = 3600
+    # Filtered symbol list persisted across restarts; empty disables it
+    symbols_cache_path: str = _ENV['symbols_cache_path']
 
     # Agent analysis
-    min_confidence: int = field(default_factory=lambda: int(os.getenv('MIN_CONFIDENCE', '60')))
-    agent_timeout_seconds: int = field(default_factory=lambda: int(os.getenv('AGENT_TIMEOUT', '120')))
+    min_confidence: int = _ENV['min_confidence']
+    agent_timeout_seconds: int = _ENV['agent_timeout_seconds']
     max_search_queries_per_cycle: int = 20
+    # Movers analyzed concurrently per cycle. AgentWrapper keeps signals and
+    # sentiment findings per run; a persistent client still runs one at a time.
+    max_concurrent_analyses: int = _ENV['max_concurrent_analyses']
 
     # Sentiment analysis toggle
     use_sentiment: bool = True  # Set to False to disable sentiment scoring
 
     # Web search configuration
-    web_search_mcp_url: str = field(default_factory=lambda: os.getenv('WEB_SEARCH_MCP_URL', 'http://localhost:3000/mcp'))
-    web_search_timeout_seconds: int = field(default_factory=lambda: int(os.getenv('WEB_SEARCH_TIMEOUT', '30')))
+    web_search_mcp_url: str = _ENV['web_search_mcp_url']
+    web_search_timeout_seconds: int = _ENV['web_search_timeout_seconds']
+    # Reuse a symbol's sentiment analysis for this long (0 disables)
+    sentiment_cache_ttl_seconds: int = 900
 
     # Position management
-    monitoring_interval_seconds: int = field(default_factory=lambda: int(os.getenv('MONITORING_INTERVAL', '300')))
+    monitoring_interval_seconds: int = _ENV['monitoring_interval_seconds']
     reanalysis_interval_seconds: int = 900
     trailing_stop_update_seconds: int = 300
+
+    @classmethod
+    def from_env(cls, **overrides) -> 'ScannerConfig':
+        """
+        Build a config from the current environment.
+
+        Args:
+            **overrides: Field values taking precedence over the environment
+
+        Returns:
+            ScannerConfig with environment-backed fields re-read
+        """
+        return cls(**{**_read_env(), **overrides})
@@ -1,6 +1,11 @@
 """Main scanner loop for market movers strategy."""
 import asyncio
+import heapq
+import inspect
 import logging
+import sys
+import time
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 
@@ -11,18 +16,29 @@ from rich.panel import Panel
 from .config import ScannerConfig
 from .risk_config import RiskConfig
 from .symbol_manager import FuturesSymbolManager
-from .momentum_scanner import MomentumScanner
+from .momentum_scanner import MomentumScanner, Mover, _by_max_change
 from .confidence import ConfidenceCalculator
 from .risk_validator import RiskValidator
-from .prompts import PromptBuilder
+from .prompts import build_analysis_prompt
 from .dashboard import ScannerEvent
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Banner rules, built once rather than per log call
+_RULE = '=' * 80
+_HR = '─' * 80
+
 # Type alias for event callback
 EventCallback = Callable[[str, Dict[str, Any]], None]
 
+
+async def _maybe_await(value: Any) -> Any:
+    """Await value if it is awaitable (portfolio methods may be sync or async)."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
 class MarketMoversScanner:
     """Main market movers scanner orchestrator."""
 
@@ -63,7 +79,9 @@ class MarketMoversScanner:
         # Initialize components
         self.symbol_manager = FuturesSymbolManager(
             exchange,
-            min_volume_usd=self.config.min_volume_usd
+            min_volume_usd=self.config.min_volume_usd,
+            cache_path=self.config.symbols_cache_path or None,
+            cache_ttl_minutes=self.config.symbol_refresh_interval_seconds / 60
         )
         self.momentum_scanner = MomentumScanner(
             exchange,
@@ -71,11 +89,27 @@ class MarketMoversScanner:
         )
         self.confidence_calculator = ConfidenceCalculator()
         self.risk_validator = RiskValidator(self.risk_config, portfolio)
-        self.prompt_builder = PromptBuilder()
 
         self.running = False
         self.cycle_number = 0
 
+        # Serializes risk validation + execution across concurrent analyses
+        self._execution_lock = asyncio.Lock()
+
+        # Tickers fetched by the latest pre-filter pass (symbol -> ticker)
+        self._last_tickers: Dict[str, Dict] = {}
+
+        # Symbols scanned each cycle; rebuilt only when the symbol list refreshes
+        self._symbols_list: List[str] = []
+        self._symbol_refresh_task: Optional[asyncio.Task] = None
+
+        # Agent calls aborted after agent_timeout_seconds (running total)
+        self.agent_timeouts = 0
+
+        # Signal/rejection rows buffered during a cycle, written in bulk at its end
+        self._pending_signals: List[Dict[str, Any]] = []
+        self._pending_rejections: List[Dict[str, Any]] = []
+
     def _emit_event(self, event_type: str, **kwargs) -> None:
         """
         Emit an event to the dashboard callback.
@@ -88,15 +122,25 @@ class MarketMoversScanner:
             try:
                 self.event_callback(event_type, kwargs)
             except Exception as e:
-                logger.warning(f"Event callback error: {e}")
+                logger.warning("Event callback error: %s", e)
 
     async def start(self):
         """Start the scanning loop."""
         logger.info("🚀 Market Movers Scanner starting...")
 
-        # Initialize symbol list
-        await self.symbol_manager.refresh_symbols()
-        logger.info(f"📊 Monitoring {len(self.symbol_manager.get_symbols())} futures pairs")
+        # Initialize symbol list, unless a fresh one was loaded from the cache
+        refresh_minutes = self.config.symbol_refresh_interval_seconds / 60
+        if not self.symbol_manager.get_symbols() or self.symbol_manager.should_refresh(refresh_minutes):
+            await self.symbol_manager.refresh_symbols()
+        self._symbols_list = self._current_symbols()
+        logger.info("📊 Monitoring %d futures pairs", len(self._symbols_list))
+
+        # Push-based candles when the exchange supports them; REST otherwise
+        if self.momentum_scanner.supports_streaming:
+            self.momentum_scanner.start_streams(self._symbols_list)
+            logger.info("📡 Streaming candles over WebSocket")
+
+        self._symbol_refresh_task = asyncio.create_task(self._symbol_refresher())
 
         self.running = True
 
@@ -104,17 +148,51 @@ class MarketMoversScanner:
             try:
                 await self.scan_cycle()
             except Exception as e:
-                logger.error(f"❌ Error in scan cycle: {e}", exc_info=True)
+                logger.error("❌ Error in scan cycle: %s", e, exc_info=True)
                 await asyncio.sleep(30)
 
             # Wait until next scan
             await asyncio.sleep(self.config.scan_interval_seconds)
 
+    def _current_symbols(self) -> List[str]:
+        """
+        Symbol list to scan, with each symbol interned.
+
+        Every mover, cache key and stream buffer downstream reuses these
+        strings, so dict lookups on them short-circuit on identity.
+        """
+        return [sys.intern(symbol) for symbol in self.symbol_manager.get_symbols()]
+
+    async def _symbol_refresher(self):
+        """Refresh the futures symbol list in the background, off the scan path."""
+        while True:
+            await asyncio.sleep(self.config.symbol_refresh_interval_seconds)
+            try:
+                await self.symbol_manager.refresh_symbols()
+            except Exception as e:
+                logger.warning("Symbol refresh failed, keeping %d symbols: %s", len(self._symbols_list), e)
+                continue
+
+            # Swap in a new list; a cycle in progress keeps iterating the old one
+            self._symbols_list = self._current_symbols()
+            logger.info("📊 Symbol list refreshed: %d futures pairs", len(self._symbols_list))
+
+            if self.momentum_scanner.supports_streaming:
+                await self.momentum_scanner.prune_streams(self._symbols_list)
+                self.momentum_scanner.start_streams(self._symbols_list)
+
     async def stop(self):
         """Stop the scanning loop."""
         logger.info("Stopping scanner...")
         self.running = False
 
+        if self._symbol_refresh_task is not None:
+            self._symbol_refresh_task.cancel()
+            await asyncio.gather(self._symbol_refresh_task, return_exceptions=True)
+            self._symbol_refresh_task = None
+
+        await self.momentum_scanner.stop_streams()
+
         # Clean up agent persistent client if in daily mode
         if self.daily_mode and hasattr(self.agent, 'cleanup'):
             await self.agent.cleanup()
@@ -179,44 +257,50 @@ class MarketMoversScanner:
             console.print()  # Empty line after portfolio status
 
         except Exception as e:
-            logger.warning(f"Could not display portfolio status: {e}")
+            logger.warning("Could not display portfolio status: %s", e)
 
     async def scan_cycle(self):
         """Execute one complete scan cycle."""
-        cycle_start = datetime.now()
+        cycle_start = datetime.now()  # Wall clock, for display only
+        cycle_start_mono = time.monotonic()
         self.cycle_number += 1
-        logger.info(f"\n{'='*80}")
-        logger.info(f"🔍 SCAN CYCLE #{self.cycle_number} - {cycle_start.strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"{'='*80}")
+        agent_timeouts_before = self.agent_timeouts
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", _RULE)
+            logger.info("🔍 SCAN CYCLE #%d - %s", self.cycle_number, cycle_start.strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info(_RULE)
 
         # Display portfolio status with P&L before scanning
         await self.display_portfolio_status()
 
-        # Metrics tracking
-        signals_generated = 0
-        trades_executed = 0
-        trades_rejected = 0
-
         # Track sentiment findings per symbol for summary
         sentiment_summary = {}
 
         # Step 1: Scan for movers
-        symbols_list = list(self.symbol_manager.get_symbols().keys())
-        movers = await self.momentum_scanner.scan_all_symbols(symbols_list)
+        movers = await self.momentum_scanner.scan_all_symbols(self._symbols_list)
         gainers_count = len(movers.get('gainers', []))
         losers_count = len(movers.get('losers', []))
-        logger.info(f"📈 Found {gainers_count} gainers, {losers_count} losers")
+        logger.info("📈 Found %d gainers, %d losers", gainers_count, losers_count)
 
         # Step 2: Pre-filter (top N by magnitude)
         top_movers = await self.pre_filter_movers(movers)
-        logger.info(f"🎯 Analyzing top {len(top_movers)} movers")
+
+        # Portfolio context shared by every mover's prompt; refreshed only
+        # after a trade executes
+        portfolio_context = await self._snapshot_portfolio()
+
+        # No agent calls when no new position could pass risk validation
+        if top_movers and not self.risk_validator.can_accept_new_position(portfolio_context):
+            logger.info("🚫 Portfolio saturated, skipping agent analysis")
+            top_movers = []
+        logger.info("🎯 Analyzing top %d movers", len(top_movers))
 
         # Emit cycle start event with movers data
         movers_data = [
             {
-                "symbol": m["symbol"],
-                "change_pct": m.get("max_change", m.get("change_1h", 0)),
-                "direction": m.get("direction", "gainer"),
+                "symbol": m.symbol,
+                "change_pct": m.max_change,
+                "direction": m.direction,
             }
             for m in top_movers
         ]
@@ -226,122 +310,55 @@ class MarketMoversScanner:
             movers=movers_data,
         )
 
-        # Step 3: Deep analysis with agent for each mover
-        for mover in top_movers:
-            symbol = mover.get('symbol', 'UNKNOWN')
-            try:
-                # Emit mover start event
-                self._emit_event(ScannerEvent.MOVER_START, symbol=symbol)
-
-                signal, sentiment_findings, analysis_data = await self._analyze_mover_with_agent(mover)
-
-                # Store sentiment findings for summary
-                if sentiment_findings:
-                    sentiment_summary[symbol] = sentiment_findings
-
-                # Extract key findings for dashboard display (top 3)
-                key_findings = []
-                if sentiment_findings:
-                    for finding in sentiment_findings:
-                        if isinstance(finding, dict) and 'key_findings' in finding:
-                            key_findings = finding['key_findings'][:3]
-                            break
-                        elif isinstance(finding, dict) and 'bullet_points' in finding:
-                            key_findings = finding['bullet_points'][:3]
-                            break
-
-                if signal is None:
-                    # Agent didn't generate a signal (low confidence or error)
-                    self._emit_event(
-                        ScannerEvent.MOVER_COMPLETE,
-                        symbol=symbol,
-                        result="NO_TRADE",
-                        confidence=analysis_data.get('confidence'),
-                        score_breakdown=analysis_data.get('score_breakdown'),
-                        weak_components=analysis_data.get('weak_components'),
-                        sentiment_findings=key_findings,
-                    )
-                    continue
 
-                signals_generated += 1
+        # Step 3: Deep analysis with agent for each mover, up to
+        # max_concurrent_analyses at a time; risk validation and execution
+        # (steps 4-5) stay serialized under the execution lock
+        counts = Counter()
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_analyses)
 
-                # Emit signal generated event
-                self._emit_event(
-                    ScannerEvent.SIGNAL_GENERATED,
-                    symbol=symbol,
-                    confidence=signal.get('confidence'),
-                    entry_price=signal.get('entry_price'),
-                )
+        async def process_bounded(mover: Mover) -> None:
+            async with semaphore:
+                await self._process_mover(mover, counts, sentiment_summary, portfolio_context)
 
-                # Step 4: Risk validation
-                self._emit_event(ScannerEvent.RISK_CHECK, symbol=symbol)
-                validation = await self.risk_validator.validate_signal(signal)
+        await asyncio.gather(*(process_bounded(mover) for mover in top_movers))
 
-                if validation['valid']:
-                    # Step 5: Execute trade
-                    self._emit_event(ScannerEvent.EXECUTION, symbol=symbol)
-                    await self._execute_signal(signal)
-                    trades_executed += 1
-                    self._emit_event(
-                        ScannerEvent.MOVER_COMPLETE,
-                        symbol=symbol,
-                        result="EXECUTED",
-                        confidence=signal.get('confidence'),
-                        entry_price=signal.get('entry_price'),
-                        score_breakdown=analysis_data.get('score_breakdown'),
-                        sentiment_findings=key_findings,
-                    )
-                else:
-                    # Save rejection
-                    await self._save_rejection(signal, validation['reason'])
-                    trades_rejected += 1
-                    self._emit_event(
-                        ScannerEvent.MOVER_COMPLETE,
-                        symbol=symbol,
-                        result="REJECTED",
-                        confidence=signal.get('confidence'),
-                        score_breakdown=analysis_data.get('score_breakdown'),
-                        weak_components=analysis_data.get('weak_components'),
-                        sentiment_findings=key_findings,
-                    )
-
-            except Exception as e:
-                logger.error(f"❌ Error analyzing {symbol}: {e}", exc_info=True)
-                self._emit_event(
-                    ScannerEvent.MOVER_COMPLETE,
-                    symbol=symbol,
-                    result="ERROR",
-                )
+        signals_generated = counts['signals_generated']
+        trades_executed = counts['trades_executed']
+        trades_rejected = counts['trades_rejected']
 
-        logger.info(f"⚡ Generated {signals_generated} signals (confidence ≥ 60)")
-        logger.info(f"✅ Executed {trades_executed} trades, ❌ Rejected {trades_rejected}")
+        logger.info("⚡ Generated %d signals (confidence ≥ 60)", signals_generated)
+        logger.info("✅ Executed %d trades, ❌ Rejected %d", trades_executed, trades_rejected)
 
         # Display sentiment analysis summary
-        if sentiment_summary:
-            logger.info(f"\n{'='*80}")
+        if sentiment_summary and logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", _RULE)
             logger.info("📰 SENTIMENT ANALYSIS SUMMARY")
-            logger.info(f"{'='*80}")
+            logger.info(_RULE)
 
             for symbol, findings in sentiment_summary.items():
-                logger.info(f"\n{symbol}:")
+                logger.info("\n%s:", symbol)
 
                 # findings is a list, process the most recent/relevant one
                 if findings and len(findings) > 0:
                     finding = findings[0]  # Use first/most relevant finding
 
                     if not finding.get('success') and finding.get('warnings'):
-                        logger.warning(f"  ⚠️  Web search failed - sentiment score defaulted")
+                        logger.warning("  ⚠️  Web search failed - sentiment score defaulted")
                     elif not finding.get('web_results') or not finding.get('bullet_points'):
                         logger.info("  • No significant news found")
                     else:
                         for point in finding.get('bullet_points', []):
-                            logger.info(f"  {point}")
+                            logger.info("  %s", point)
 
-            logger.info(f"\n{'='*80}\n")
+            logger.info("\n%s\n", _RULE)
 
-        # Step 6: Save cycle metrics
+        # Step 6: Persist buffered signals/rejections and cycle metrics
+        await self._flush_pending_records()
+        cycle_duration = time.monotonic() - cycle_start_mono
         await self._save_cycle_metrics(
-            cycle_start=cycle_start,
+            cycle_duration=cycle_duration,
+            portfolio_context=portfolio_context,
             movers_found=gainers_count + losers_count,
             movers_analyzed=len(top_movers),
             signals_generated=signals_generated,
@@ -349,9 +366,11 @@ class MarketMoversScanner:
             trades_rejected=trades_rejected
         )
 
-        cycle_duration = (datetime.now() - cycle_start).total_seconds()
-        logger.info(f"\n⏱️  Cycle completed in {cycle_duration:.1f}s")
-        logger.info(f"{'='*80}\n")
+        cycle_agent_timeouts = self.agent_timeouts - agent_timeouts_before
+        if cycle_agent_timeouts:
+            logger.warning("⏰ %d agent analyses timed out this cycle", cycle_agent_timeouts)
+        logger.info("\n⏱️  Cycle completed in %.1fs", cycle_duration)
+        logger.info("%s\n", _RULE)
 
         # Emit cycle complete event
         self._emit_event(
@@ -361,9 +380,122 @@ class MarketMoversScanner:
             trades_executed=trades_executed,
             trades_rejected=trades_rejected,
             duration_seconds=cycle_duration,
+            agent_timeouts=cycle_agent_timeouts,
         )
 
-    async def pre_filter_movers(self, movers: Dict[str, List]) -> List[Dict]:
+    async def _process_mover(
+        self,
+        mover: Mover,
+        counts: Counter,
+        sentiment_summary: Dict[str, list],
+        portfolio_context: Dict[str, Any]
+    ) -> None:
+        """
+        Analyze one mover and validate/execute its signal.
+
+        Args:
+            mover: Mover context from the pre-filter
+            counts: Cycle counters (signals_generated, trades_executed, trades_rejected)
+            sentiment_summary: Per-symbol sentiment findings, updated in place
+            portfolio_context: Cycle portfolio snapshot, refreshed in place after a trade
+        """
+        symbol = mover.symbol
+        try:
+            # Earlier executions this cycle may have used up the remaining room
+            if not self.risk_validator.can_accept_new_position(portfolio_context):
+                logger.info("🚫 Portfolio saturated, skipping %s", symbol)
+                self._emit_event(ScannerEvent.MOVER_COMPLETE, symbol=symbol, result="NO_TRADE")
+                return
+
+            # Emit mover start event
+            self._emit_event(ScannerEvent.MOVER_START, symbol=symbol)
+
+            signal, sentiment_findings, analysis_data = await self._analyze_mover_with_agent(
+                mover, portfolio_context
+            )
+
+            # Store sentiment findings for summary
+            if sentiment_findings:
+                sentiment_summary[symbol] = sentiment_findings
+
+            # Extract key findings for dashboard display (top 3)
+            key_findings = []
+            if sentiment_findings:
+                for finding in sentiment_findings:
+                    if isinstance(finding, dict) and 'key_findings' in finding:
+                        key_findings = finding['key_findings'][:3]
+                        break
+                    elif isinstance(finding, dict) and 'bullet_points' in finding:
+                        key_findings = finding['bullet_points'][:3]
+                        break
+
+            if signal is None:
+                # Agent didn't generate a signal (low confidence or error)
+                self._emit_event(
+                    ScannerEvent.MOVER_COMPLETE,
+                    symbol=symbol,
+                    result="NO_TRADE",
+                    confidence=analysis_data.get('confidence'),
+                    score_breakdown=analysis_data.get('score_breakdown'),
+                    weak_components=analysis_data.get('weak_components'),
+                    sentiment_findings=key_findings,
+                )
+                return
+
+            counts['signals_generated'] += 1
+
+            # Emit signal generated event
+            self._emit_event(
+                ScannerEvent.SIGNAL_GENERATED,
+                symbol=symbol,
+                confidence=signal.get('confidence'),
+                entry_price=signal.get('entry_price'),
+            )
+
+            # Portfolio checks must see the effect of earlier executions
+            async with self._execution_lock:
+                # Step 4: Risk validation
+                self._emit_event(ScannerEvent.RISK_CHECK, symbol=symbol)
+                validation = await self.risk_validator.validate_signal(signal)
+
+                if validation['valid']:
+                    # Step 5: Execute trade
+                    self._emit_event(ScannerEvent.EXECUTION, symbol=symbol)
+                    await self._execute_signal(signal)
+                    counts['trades_executed'] += 1
+                    portfolio_context.update(await self._snapshot_portfolio())
+                    self._emit_event(
+                        ScannerEvent.MOVER_COMPLETE,
+                        symbol=symbol,
+                        result="EXECUTED",
+                        confidence=signal.get('confidence'),
+                        entry_price=signal.get('entry_price'),
+                        score_breakdown=analysis_data.get('score_breakdown'),
+                        sentiment_findings=key_findings,
+                    )
+                else:
+                    # Save rejection
+                    self._save_rejection(signal, validation['reason'])
+                    counts['trades_rejected'] += 1
+                    self._emit_event(
+                        ScannerEvent.MOVER_COMPLETE,
+                        symbol=symbol,
+                        result="REJECTED",
+                        confidence=signal.get('confidence'),
+                        score_breakdown=analysis_data.get('score_breakdown'),
+                        weak_components=analysis_data.get('weak_components'),
+                        sentiment_findings=key_findings,
+                    )
+
+        except Exception as e:
+            logger.error("❌ Error analyzing %s: %s", symbol, e, exc_info=True)
+            self._emit_event(
+                ScannerEvent.MOVER_COMPLETE,
+                symbol=symbol,
+                result="ERROR",
+            )
+
+    async def pre_filter_movers(self, movers: Dict[str, List[Mover]]) -> List[Mover]:
         """
         Pre-filter movers by volume before deep analysis.
 
@@ -375,28 +507,66 @@ class MarketMoversScanner:
         """
         all_movers = movers['gainers'] + movers['losers']
 
+        # One round-trip for every mover's ticker
+        tickers = await self._fetch_tickers([m.symbol for m in all_movers])
+        self._last_tickers = tickers
+
         # Filter by volume
         filtered = []
         for mover in all_movers:
-            ticker = await self.exchange.fetch_ticker(mover['symbol'])
+            ticker = tickers.get(mover.symbol) or {}
             volume_24h = ticker.get('quoteVolume', 0)
 
             if volume_24h >= self.config.min_volume_usd:
-                mover['volume_24h'] = volume_24h
+                mover.volume_24h = volume_24h
                 filtered.append(mover)
 
-        # Sort by % change and take top N
-        filtered.sort(key=lambda x: x['max_change'], reverse=True)
-        return filtered[:self.config.max_movers_per_scan]
+        # Top N by % change, without sorting the whole list
+        return heapq.nlargest(self.config.max_movers_per_scan, filtered, key=_by_max_change)
+
+    async def _fetch_tickers(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch tickers for several symbols at once.
+
+        Uses the exchange's bulk fetch_tickers when supported, otherwise
+        issues the per-symbol fetches concurrently.
+
+        Returns:
+            Dict of symbol -> ticker
+        """
+        if not symbols:
+            return {}
+
+        if self.exchange.has.get('fetchTickers'):
+            return await self.exchange.fetch_tickers(symbols)
+
+        tickers = await asyncio.gather(
+            *(self.exchange.fetch_ticker(symbol) for symbol in symbols)
+        )
+        return dict(zip(symbols, tickers))
+
+    async def _snapshot_portfolio(self) -> Dict[str, Any]:
+        """
+        Collect the portfolio values used for prompts and cycle metrics.
+
+        Returns:
+            Dict with total_value, open_positions and exposure_pct
+        """
+        return {
+            'total_value': await _maybe_await(self.portfolio.get_total_value()),
+            'open_positions': await _maybe_await(self.portfolio.count_open_positions()),
+            'exposure_pct': await _maybe_await(self.portfolio.calculate_exposure_pct()),
+        }
 
     async def _analyze_mover_with_agent(
-        self, mover: Dict[str, Any]
+        self, mover: Mover, portfolio_context: Dict[str, Any]
     ) -> tuple[Optional[Dict[str, Any]], list, Dict[str, Any]]:
         """
         Invoke Claude Agent to analyze a mover.
 
         Args:
             mover: Mover context (symbol, direction, changes, price, volume)
+            portfolio_context: Portfolio snapshot from _snapshot_portfolio
 
         Returns:
             Tuple of:
@@ -404,43 +574,28 @@ class MarketMoversScanner:
             - sentiment_findings list (key findings from news)
             - analysis_data dict with score breakdown (always returned)
         """
-        symbol = mover['symbol']
-        logger.info(f"\n🤖 Analyzing {symbol} ({mover['direction']}) {mover['change_1h']:+.2f}% (1h)")
+        symbol = mover.symbol
+        logger.info("\n🤖 Analyzing %s (%s) %+.2f%% (1h)", symbol, mover.direction, mover.change_1h)
 
         # Emit analysis phase event
         self._emit_event(ScannerEvent.ANALYSIS_PHASE, symbol=symbol, phase="technical")
 
-        # Build portfolio context (await all async calls)
-        total_value = self.portfolio.get_total_value()
-        if hasattr(total_value, '__await__'):
-            total_value = await total_value
-
-        open_positions = self.portfolio.count_open_positions()
-        if hasattr(open_positions, '__await__'):
-            open_positions = await open_positions
-
-        exposure_pct = self.portfolio.calculate_exposure_pct()
-        if hasattr(exposure_pct, '__await__'):
-            exposure_pct = await exposure_pct
-
-        portfolio_context = {
-            'total_value': total_value,
-            'open_positions': open_positions,
-            'exposure_pct': exposure_pct
-        }
-
         # Build agent prompt
-        prompt = self.prompt_builder.build_analysis_prompt(mover, portfolio_context)
+        prompt = build_analysis_prompt(mover.to_dict(), portfolio_context)
 
         try:
             # Emit sentiment phase before agent (agent will do both technical and sentiment)
             self._emit_event(ScannerEvent.ANALYSIS_PHASE, symbol=symbol, phase="sentiment")
 
-            # Invoke agent
-            response = await self.agent.run(prompt, symbol=symbol)
+            # Invoke agent; a hung call must not hold up the rest of the cycle.
+            # The agent starts the timer once the analysis begins, so time
+            # queued behind other analyses is not counted
+            response = await self.agent.run(
+                prompt, symbol=symbol, timeout=self.config.agent_timeout_seconds
+            )
 
-            # Get sentiment findings from agent
-            sentiment_findings = self.agent.get_sentiment_findings() if hasattr(self.agent, 'get_sentiment_findings') else []
+            # Sentiment findings collected during this run
+            sentiment_findings = response.pop('sentiment_findings', None) or []
 
             # Extract confidence and scores
             confidence = response.get('confidence', 0)
@@ -464,27 +619,27 @@ class MarketMoversScanner:
             }
 
             if confidence < self.config.min_confidence:
-                logger.info(f"❌ Rejected - Confidence: {confidence}/100 (below threshold)")
+                logger.info("❌ Rejected - Confidence: %s/100 (below threshold)", confidence)
                 # Save low confidence rejection
-                await self.db.save_mover_rejection(
-                    symbol=mover['symbol'],
-                    direction=mover['direction'],
-                    confidence=confidence,
-                    reason='CONFIDENCE_BELOW_THRESHOLD',
-                    details=f"Confidence {confidence} < {self.config.min_confidence}"
-                )
+                self._pending_rejections.append({
+                    'symbol': mover.symbol,
+                    'direction': mover.direction,
+                    'confidence': confidence,
+                    'reason': 'CONFIDENCE_BELOW_THRESHOLD',
+                    'details': f"Confidence {confidence} < {self.config.min_confidence}",
+                })
                 return None, sentiment_findings, analysis_data
 
             # Build signal dict with price fallbacks
             # Use current_price if entry_price is 0 or missing
             entry_price = response.get('entry_price') or 0
             if entry_price <= 0:
-                entry_price = mover['current_price']
-                logger.info(f"Using current price as entry: ${entry_price:.2f}")
+                entry_price = mover.current_price
+                logger.info("Using current price as entry: $%.2f", entry_price)
 
             # Calculate stop_loss/tp1 fallbacks based on direction
             # Default: 2% stop loss, 3% take profit
-            is_long = mover['direction'] == 'gainer'
+            is_long = mover.direction == 'gainer'
             stop_loss = response.get('stop_loss') or 0
             tp1 = response.get('tp1') or 0
 
@@ -493,18 +648,18 @@ class MarketMoversScanner:
                     stop_loss = entry_price * 0.98  # 2% below for long
                 else:
                     stop_loss = entry_price * 1.02  # 2% above for short
-                logger.info(f"Calculated stop_loss: ${stop_loss:.2f}")
+                logger.info("Calculated stop_loss: $%.2f", stop_loss)
 
             if tp1 <= 0:
                 if is_long:
                     tp1 = entry_price * 1.03  # 3% above for long
                 else:
                     tp1 = entry_price * 0.97  # 3% below for short
-                logger.info(f"Calculated tp1: ${tp1:.2f}")
+                logger.info("Calculated tp1: $%.2f", tp1)
 
             signal = {
-                'symbol': mover['symbol'],
-                'direction': mover['direction'],
+                'symbol': mover.symbol,
+                'direction': mover.direction,
                 'confidence': confidence,
                 'entry_price': entry_price,
                 'stop_loss': stop_loss,
@@ -516,11 +671,18 @@ class MarketMoversScanner:
                 'analysis': response.get('analysis', ''),
             }
 
-            logger.info(f"✅ Signal generated - Confidence: {confidence}/100")
+            logger.info("✅ Signal generated - Confidence: %s/100", confidence)
             return signal, sentiment_findings, analysis_data
 
+        except asyncio.TimeoutError:
+            self.agent_timeouts += 1
+            logger.warning(
+                "⏰ Agent timeout for %s after %ss", symbol, self.config.agent_timeout_seconds
+            )
+            return None, [], {}
+
         except Exception as e:
-            logger.error(f"❌ Agent analysis failed: {e}", exc_info=True)
+            logger.error("❌ Agent analysis failed: %s", e, exc_info=True)
             return None, [], {}
 
     async def _execute_signal(self, signal: Dict[str, Any]):
@@ -530,15 +692,16 @@ class MarketMoversScanner:
         Args:
             signal: Signal dictionary
         """
-        logger.info(f"\n🎯 EXECUTING PAPER TRADE")
-        logger.info(f"{'─'*80}")
-        logger.info(f"Symbol:     {signal['symbol']}")
-        logger.info(f"Direction:  {signal['direction']}")
-        logger.info(f"Confidence: {signal['confidence']}/100")
-        logger.info(f"Entry:      ${signal['entry_price']:.2f}")
-        logger.info(f"Stop Loss:  ${signal['stop_loss']:.2f}")
-        logger.info(f"TP1:        ${signal['tp1']:.2f}")
-        logger.info(f"{'─'*80}\n")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n🎯 EXECUTING PAPER TRADE")
+            logger.info(_HR)
+            logger.info("Symbol:     %s", signal['symbol'])
+            logger.info("Direction:  %s", signal['direction'])
+            logger.info("Confidence: %s/100", signal['confidence'])
+            logger.info("Entry:      $%.2f", signal['entry_price'])
+            logger.info("Stop Loss:  $%.2f", signal['stop_loss'])
+            logger.info("TP1:        $%.2f", signal['tp1'])
+            logger.info("%s\n", _HR)
 
         # Calculate position sizing
         portfolio_value = self.portfolio.get_total_value()
@@ -555,22 +718,22 @@ class MarketMoversScanner:
         quantity = position_size_usd / entry_price
         risk_amount_usd = quantity * risk_per_unit
 
-        # Save signal to database first
-        signal_id = await self.db.save_mover_signal(
-            symbol=signal['symbol'],
-            direction=signal['direction'],
-            confidence=signal['confidence'],
-            entry_price=signal['entry_price'],
-            stop_loss=signal['stop_loss'],
-            tp1=signal['tp1'],
-            position_size_usd=position_size_usd,
-            risk_amount_usd=risk_amount_usd,
-            technical_score=signal.get('technical_score'),
-            sentiment_score=signal.get('sentiment_score'),
-            liquidity_score=signal.get('liquidity_score'),
-            correlation_score=signal.get('correlation_score'),
-            analysis=signal.get('analysis', '')
-        )
+        # Queue the signal row; it is saved with the rest of the cycle's signals
+        self._pending_signals.append({
+            'symbol': signal['symbol'],
+            'direction': signal['direction'],
+            'confidence': signal['confidence'],
+            'entry_price': signal['entry_price'],
+            'stop_loss': signal['stop_loss'],
+            'tp1': signal['tp1'],
+            'position_size_usd': position_size_usd,
+            'risk_amount_usd': risk_amount_usd,
+            'technical_score': signal.get('technical_score'),
+            'sentiment_score': signal.get('sentiment_score'),
+            'liquidity_score': signal.get('liquidity_score'),
+            'correlation_score': signal.get('correlation_score'),
+            'analysis': signal.get('analysis', ''),
+        })
 
         # Execute paper trade using execute_signal method
         # Map direction (LONG/SHORT) to signal type (BUY/SELL)
@@ -589,11 +752,10 @@ class MarketMoversScanner:
         )
 
         if result['executed']:
-            logger.info(f"✓ Position created (Signal ID: {signal_id})")
-            logger.info(f"✓ Monitoring activated\n")
+            logger.info("✓ Position created")
+            logger.info("✓ Monitoring activated\n")
         else:
-            logger.warning(f"⚠ Trade execution issue: {result.get('reason', 'Unknown')}")
-            logger.info(f"Signal saved as ID: {signal_id}\n")
+            logger.warning("⚠ Trade execution issue: %s", result.get('reason', 'Unknown'))
 
     def _get_weak_components(
         self,
@@ -636,27 +798,39 @@ class MarketMoversScanner:
                 weak.append("correlation")
         return weak
 
-    async def _save_rejection(self, signal: Dict[str, Any], reason: str):
+    def _save_rejection(self, signal: Dict[str, Any], reason: str):
         """
-        Save rejected signal to database.
+        Queue rejected signal for the end-of-cycle database write.
 
         Args:
             signal: Signal dictionary
             reason: Rejection reason
         """
-        logger.info(f"❌ Rejected {signal['symbol']} - {reason}")
-
-        await self.db.save_mover_rejection(
-            symbol=signal['symbol'],
-            direction=signal['direction'],
-            confidence=signal['confidence'],
-            reason=reason,
-            details=f"Signal failed risk check: {reason}"
-        )
+        logger.info("❌ Rejected %s - %s", signal['symbol'], reason)
+
+        self._pending_rejections.append({
+            'symbol': signal['symbol'],
+            'direction': signal['direction'],
+            'confidence': signal['confidence'],
+            'reason': reason,
+            'details': f"Signal failed risk check: {reason}",
+        })
+
+    async def _flush_pending_records(self):
+        """Write the signals and rejections buffered during the cycle in bulk."""
+        # Buffers are only cleared once written, so a failed flush is retried next cycle
+        if self._pending_signals:
+            signal_ids = await self.db.save_mover_signals_many(self._pending_signals)
+            self._pending_signals = []
+            logger.info("Saved %d signals (IDs: %s)", len(signal_ids), signal_ids)
+        if self._pending_rejections:
+            await self.db.save_mover_rejections_many(self._pending_rejections)
+            self._pending_rejections = []
 
     async def _save_cycle_metrics(
         self,
-        cycle_start: datetime,
+        cycle_duration: float,
+        portfolio_context: Dict[str, Any],
         movers_found: int,
         movers_analyzed: int,
         signals_generated: int,
@@ -667,28 +841,14 @@ class MarketMoversScanner:
         Save scan cycle metrics to database.
 
         Args:
-            cycle_start: Cycle start timestamp
+            cycle_duration: Cycle duration in seconds (monotonic clock)
+            portfolio_context: Current portfolio snapshot
             movers_found: Total movers detected
             movers_analyzed: Movers passed to agent
             signals_generated: Signals with confidence >= 60
             trades_executed: Trades that passed risk checks
             trades_rejected: Trades that failed risk checks
         """
-        cycle_duration = (datetime.now() - cycle_start).total_seconds()
-
-        # Get portfolio values (handle both sync and async)
-        portfolio_value = self.portfolio.get_total_value()
-        if hasattr(portfolio_value, '__await__'):
-            portfolio_value = await portfolio_value
-
-        open_positions = self.portfolio.count_open_positions()
-        if hasattr(open_positions, '__await__'):
-            open_positions = await open_positions
-
-        exposure_pct = self.portfolio.calculate_exposure_pct()
-        if hasattr(exposure_pct, '__await__'):
-            exposure_pct = await exposure_pct
-
         # Build metrics dict
         metrics = {
             'cycle_duration_seconds': cycle_duration,
@@ -696,9 +856,9 @@ class MarketMoversScanner:
             'signals_generated': signals_generated,
             'signals_executed': trades_executed,
             'signals_rejected': trades_rejected,
-            'open_positions': open_positions,
-            'total_exposure_pct': exposure_pct,
-            'portfolio_value': portfolio_value,
+            'open_positions': portfolio_context['open_positions'],
+            'total_exposure_pct': portfolio_context['exposure_pct'],
+            'portfolio_value': portfolio_context['total_value'],
             # These would come from portfolio risk metrics:
             'daily_pnl_pct': 0.0,  # TODO: Get from portfolio
             'weekly_pnl_pct': 0.0,  # TODO: Get from portfolio
@@ -1,14 +1,48 @@
 """Momentum scanner for detecting market movers."""
-from typing import Dict, List, Optional, Any
+from collections import deque
+from dataclasses import asdict, dataclass
+from operator import attrgetter
+from typing import Deque, Dict, List, Optional, Any, Tuple
 import asyncio
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+_by_max_change = attrgetter('max_change')
+
+
+@dataclass(slots=True)
+class Mover:
+    """Symbol whose 1h or 4h move exceeded the scanner threshold."""
+    symbol: str
+    direction: str  # 'LONG' or 'SHORT'
+    change_1h: float
+    change_4h: float
+    max_change: float
+    current_price: float
+    volume_24h: float = 0.0  # Filled in by the volume pre-filter
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for prompts, events and persistence."""
+        return asdict(self)
+
+
 class MomentumScanner:
     """Scans symbols for momentum exceeding threshold."""
 
-    def __init__(self, exchange, threshold_pct: float = 5.0, batch_size: int = 10):
+    STREAM_TIMEFRAMES = ('1h', '4h')
+    STREAM_BUFFER_SIZE = 2  # Only the last two closes are ever read
+    STREAM_RECONNECT_BASE_SECONDS = 1.0
+    STREAM_RECONNECT_MAX_SECONDS = 60.0
+
+    def __init__(
+        self,
+        exchange,
+        threshold_pct: float = 5.0,
+        batch_size: int = 10
+    ):
         """
         Initialize momentum scanner.
 
@@ -21,7 +55,103 @@ class MomentumScanner:
         self.threshold_pct = threshold_pct
         self.batch_size = batch_size
 
-    async def scan_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        # WebSocket-fed candles: (symbol, timeframe) -> latest candles, and
+        # the background tasks keeping them current
+        self._streamed_ohlcv: Dict[Tuple[str, str], Deque[list]] = {}
+        self._stream_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether the exchange can push candles (ccxt.pro watchOHLCV)."""
+        has = getattr(self.exchange, 'has', None)
+        return isinstance(has, dict) and bool(has.get('watchOHLCV'))
+
+    def start_streams(self, symbols: List[str]) -> None:
+        """
+        Start streaming 1h/4h candles for symbols over the exchange WebSocket.
+
+        Scans then read the streamed candles instead of calling fetch_ohlcv.
+        Symbols that are already streaming are left alone.
+
+        Args:
+            symbols: Symbols to stream
+        """
+        for symbol in symbols:
+            for timeframe in self.STREAM_TIMEFRAMES:
+                key = (symbol, timeframe)
+                if key not in self._stream_tasks:
+                    self._stream_tasks[key] = asyncio.create_task(
+                        self._stream_ohlcv(symbol, timeframe)
+                    )
+
+    async def prune_streams(self, symbols: List[str]) -> None:
+        """
+        Cancel streams and drop buffers for symbols no longer in symbols.
+
+        Args:
+            symbols: Symbols that should keep streaming
+        """
+        keep = set(symbols)
+        dropped = [key for key in self._stream_tasks if key[0] not in keep]
+        tasks = [self._stream_tasks.pop(key) for key in dropped]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for key in dropped:
+            self._streamed_ohlcv.pop(key, None)
+
+    async def stop_streams(self) -> None:
+        """Cancel all candle streams and drop their buffers."""
+        tasks = list(self._stream_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._stream_tasks.clear()
+        self._streamed_ohlcv.clear()
+
+    async def _stream_ohlcv(self, symbol: str, timeframe: str) -> None:
+        """Keep the candle buffer for one symbol/timeframe current, reconnecting with backoff."""
+        key = (symbol, timeframe)
+        delay = self.STREAM_RECONNECT_BASE_SECONDS
+
+        while True:
+            try:
+                if key not in self._streamed_ohlcv:
+                    # Seed with REST so both closes exist before the first push
+                    seed = await self.exchange.fetch_ohlcv(
+                        symbol, timeframe, limit=self.STREAM_BUFFER_SIZE
+                    )
+                    self._streamed_ohlcv[key] = deque(seed, maxlen=self.STREAM_BUFFER_SIZE)
+
+                candles = await self.exchange.watch_ohlcv(
+                    symbol, timeframe, limit=self.STREAM_BUFFER_SIZE
+                )
+                buffer = self._streamed_ohlcv[key]
+                for candle in candles:
+                    if buffer and candle[0] == buffer[-1][0]:
+                        buffer[-1] = candle  # Update to the still-open candle
+                    elif not buffer or candle[0] > buffer[-1][0]:
+                        buffer.append(candle)
+                delay = self.STREAM_RECONNECT_BASE_SECONDS
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Drop the buffer so stale candles are not read while disconnected
+                self._streamed_ohlcv.pop(key, None)
+                logger.warning(f"Candle stream {symbol} {timeframe} lost ({e}); retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.STREAM_RECONNECT_MAX_SECONDS)
+
+    async def _get_ohlcv(self, symbol: str, timeframe: str, limit: int) -> list:
+        """Get candles, preferring streamed ones over a REST fetch."""
+        streamed = self._streamed_ohlcv.get((symbol, timeframe))
+        if streamed is not None and len(streamed) >= limit:
+            return list(streamed)[-limit:]
+
+        return await self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+
+    async def scan_symbol(self, symbol: str) -> Optional[Mover]:
         """
         Scan single symbol for momentum.
 
@@ -33,8 +163,8 @@ class MomentumScanner:
         """
         try:
             # Fetch 1h and 4h data (last 2 candles)
-            ohlcv_1h = await self.exchange.fetch_ohlcv(symbol, '1h', limit=2)
-            ohlcv_4h = await self.exchange.fetch_ohlcv(symbol, '4h', limit=2)
+            ohlcv_1h = await self._get_ohlcv(symbol, '1h', 2)
+            ohlcv_4h = await self._get_ohlcv(symbol, '4h', 2)
 
             # Calculate % changes
             change_1h = ((ohlcv_1h[-1][4] - ohlcv_1h[-2][4]) / ohlcv_1h[-2][4]) * 100
@@ -45,14 +175,14 @@ class MomentumScanner:
 
             # Check threshold
             if max_change >= self.threshold_pct:
-                return {
-                    'symbol': symbol,
-                    'change_1h': change_1h,
-                    'change_4h': change_4h,
-                    'max_change': max_change,
-                    'direction': 'LONG' if change_1h > 0 else 'SHORT',
-                    'current_price': ohlcv_1h[-1][4],
-                }
+                return Mover(
+                    symbol=symbol,
+                    direction='LONG' if change_1h > 0 else 'SHORT',
+                    change_1h=change_1h,
+                    change_4h=change_4h,
+                    max_change=max_change,
+                    current_price=ohlcv_1h[-1][4],
+                )
 
             return None
 
@@ -60,10 +190,37 @@ class MomentumScanner:
             logger.error(f"Error scanning {symbol}: {e}")
             return None
 
-    async def scan_all_symbols(self, symbols: List[str]) -> Dict[str, List[Dict]]:
+    async def _fetch_closes(
+        self,
+        symbol: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Fetch the last two 1h and 4h closes for a symbol.
+
+        Returns:
+            (prev_1h, last_1h, prev_4h, last_4h), or None if the fetch failed
+        """
+        try:
+            async with semaphore:
+                ohlcv_1h, ohlcv_4h = await asyncio.gather(
+                    self._get_ohlcv(symbol, '1h', 2),
+                    self._get_ohlcv(symbol, '4h', 2)
+                )
+            return ohlcv_1h[-2][4], ohlcv_1h[-1][4], ohlcv_4h[-2][4], ohlcv_4h[-1][4]
+
+        except Exception as e:
+            logger.error(f"Error scanning {symbol}: {e}")
+            return None
+
+    async def scan_all_symbols(self, symbols: List[str]) -> Dict[str, List[Mover]]:
         """
         Scan all symbols for movers.
 
+        Candles are fetched concurrently (at most batch_size symbols in
+        flight) and the % changes for all symbols are computed in one
+        vectorized pass.
+
         Args:
             symbols: List of symbols to scan
 
@@ -72,25 +229,39 @@ class MomentumScanner:
         """
         movers = {'gainers': [], 'losers': []}
 
-        # Process in batches
-        for i in range(0, len(symbols), self.batch_size):
-            batch = symbols[i:i+self.batch_size]
+        semaphore = asyncio.Semaphore(self.batch_size)
+        results = await asyncio.gather(
+            *(self._fetch_closes(symbol, semaphore) for symbol in symbols)
+        )
+
+        # Columns: prev_1h, last_1h, prev_4h, last_4h (NaN rows for failed fetches)
+        closes = np.full((len(symbols), 4), np.nan)
+        for i, result in enumerate(results):
+            if result is not None:
+                closes[i] = result
 
-            # Scan batch in parallel
-            tasks = [self.scan_symbol(symbol) for symbol in batch]
-            results = await asyncio.gather(*tasks)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_1h = (closes[:, 1] - closes[:, 0]) / closes[:, 0] * 100
+            change_4h = (closes[:, 3] - closes[:, 2]) / closes[:, 2] * 100
+            max_change = np.maximum(np.abs(change_1h), np.abs(change_4h))
+            # Zero previous closes give inf; those symbols are skipped
+            mask = np.isfinite(max_change) & (max_change >= self.threshold_pct)
 
-            # Categorize movers
-            for result in results:
-                if result is not None:
-                    if result['direction'] == 'LONG':
-                        movers['gainers'].append(result)
-                    else:
-                        movers['losers'].append(result)
+        # Categorize movers
+        for i in np.flatnonzero(mask):
+            is_long = change_1h[i] > 0
+            movers['gainers' if is_long else 'losers'].append(Mover(
+                symbol=symbols[i],
+                direction='LONG' if is_long else 'SHORT',
+                change_1h=float(change_1h[i]),
+                change_4h=float(change_4h[i]),
+                max_change=float(max_change[i]),
+                current_price=float(closes[i, 1]),
+            ))
 
         # Sort by magnitude
-        movers['gainers'].sort(key=lambda x: x['max_change'], reverse=True)
-        movers['losers'].sort(key=lambda x: x['max_change'], reverse=True)
+        movers['gainers'].sort(key=_by_max_change, reverse=True)
+        movers['losers'].sort(key=_by_max_change, reverse=True)
 
         logger.info(f"Found {len(movers['gainers'])} gainers, {len(movers['losers'])} losers")
 
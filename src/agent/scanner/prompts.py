@@ -1,20 +1,39 @@
 """Prompt templates for Claude Agent analysis."""
 from typing import Dict, Any
 
+# Per-mover task instructions. They are identical for every mover, so they
+# live in the system prompt (a cached prompt prefix) rather than being resent
+# in each analysis request, which carries only the mover's context.
+ANALYSIS_TASK_INSTRUCTIONS = """For each market mover you are asked to analyze:
+1. Gather multi-timeframe technical analysis (1m, 5m, 15m, 1h, 4h)
+2. Analyze market sentiment and detect catalysts using web search
+3. Check liquidity and volume quality
+4. Assess correlation with BTC
+5. Calculate confidence score (0-100):
+   - Technical alignment: 0-40 points
+   - Sentiment: 0-30 points
+   - Liquidity: 0-20 points
+   - Correlation: 0-10 points
+6. Determine if HIGH PROBABILITY trade (confidence ≥ 60)
+7. If yes, specify entry, stop-loss, take-profit, position size
 
-def build_scanner_system_prompt(use_sentiment: bool = True) -> str:
-    """
-    Build system prompt for scanner agent based on configuration.
+Use your tools systematically. Think step-by-step. Show reasoning.
 
-    Args:
-        use_sentiment: Whether to include sentiment analysis in scoring.
+EFFICIENCY GUIDELINES:
+- Call tools in PARALLEL when possible (multiple independent fetch_market_data calls in one message)
+- DO NOT call the same tool multiple times with identical parameters
+- Use multi_timeframe_analysis when available instead of individual fetches
+- Verify symbol format once (e.g., try "XANUSDT" not "XAN") before making multiple calls
 
-    Returns:
-        System prompt string with appropriate scoring breakdown.
-    """
-    if use_sentiment:
-        # Full scoring with sentiment (default)
-        return """You are an expert cryptocurrency trading analysis agent for market movers scanning.
+IMPORTANT: Only recommend trades with confidence ≥ 60. Be conservative.
+
+FINAL STEP: Call submit_trading_signal() with your complete analysis.
+This is REQUIRED - include all 10 parameters (confidence, prices, scores, symbol, analysis).
+"""
+
+
+# Full scoring with sentiment (default)
+_SENTIMENT_SCORING_PROMPT = """You are an expert cryptocurrency trading analysis agent for market movers scanning.
 
 Your mission: Analyze high-momentum market movers (5%+ moves) to identify high-probability trading opportunities.
 
@@ -49,9 +68,9 @@ CRITICAL REQUIREMENTS:
 4. Your analysis is NOT complete until you call submit_trading_signal()
 
 Speed target: Complete analysis in under 30 seconds."""
-    else:
-        # Technical-only scoring (no sentiment)
-        return """You are an expert cryptocurrency trading analysis agent for market movers scanning.
+
+# Technical-only scoring (no sentiment)
+_TECHNICAL_SCORING_PROMPT = """You are an expert cryptocurrency trading analysis agent for market movers scanning.
 
 Your mission: Analyze high-momentum market movers (5%+ moves) to identify high-probability trading opportunities using TECHNICAL ANALYSIS ONLY.
 
@@ -86,37 +105,30 @@ CRITICAL REQUIREMENTS:
 
 Speed target: Complete analysis in under 20 seconds."""
 
+# Both system prompt variants are fixed, so they are assembled once at import
+_SCANNER_SYSTEM_PROMPTS = {
+    True: f"{_SENTIMENT_SCORING_PROMPT}\n\n{ANALYSIS_TASK_INSTRUCTIONS}",
+    False: f"{_TECHNICAL_SCORING_PROMPT}\n\n{ANALYSIS_TASK_INSTRUCTIONS}",
+}
 
-class PromptBuilder:
-    """Builds prompts for agent analysis tasks."""
-
-    def build_analysis_prompt(
-        self,
-        mover_context: Dict[str, Any],
-        portfolio_context: Dict[str, Any]
-    ) -> str:
-        """
-        Build prompt for analyzing a market mover.
-
-        Args:
-            mover_context: Mover details (symbol, direction, changes, price)
-            portfolio_context: Portfolio state (value, positions, exposure)
-
-        Returns:
-            Formatted prompt string
-        """
-        symbol = mover_context['symbol']
-        direction = mover_context['direction']
-        change_1h = mover_context['change_1h']
-        change_4h = mover_context['change_4h']
-        current_price = mover_context['current_price']
-        volume_24h = mover_context.get('volume_24h', 0)
-
-        portfolio_value = portfolio_context['total_value']
-        open_positions = portfolio_context['open_positions']
-        exposure_pct = portfolio_context['exposure_pct']
-
-        prompt = f"""Analyze {symbol} as a potential {direction} opportunity.
+
+def build_scanner_system_prompt(use_sentiment: bool = True) -> str:
+    """
+    Build system prompt for scanner agent based on configuration.
+
+    Args:
+        use_sentiment: Whether to include sentiment analysis in scoring.
+
+    Returns:
+        System prompt string with appropriate scoring breakdown, followed by
+        the per-mover task instructions.
+    """
+    return _SCANNER_SYSTEM_PROMPTS[bool(use_sentiment)]
+
+
+# Per-call prompt templates; bound str.format so only the dynamic fields are
+# filled in per mover/position, with the static tails appended as-is
+_format_analysis_prompt = """Analyze {symbol} as a potential {direction} opportunity.
 
 Context:
 - Current momentum: {change_1h:+.2f}% in 1h, {change_4h:+.2f}% in 4h
@@ -125,54 +137,13 @@ Context:
 - Paper portfolio: ${portfolio_value:,.0f}
 - Open positions: {open_positions}/5
 - Current exposure: {exposure_pct:.1f}%
+""".format
 
-Your task:
-1. Gather multi-timeframe technical analysis (1m, 5m, 15m, 1h, 4h)
-2. Analyze market sentiment and detect catalysts using web search
-3. Check liquidity and volume quality
-4. Assess correlation with BTC
-5. Calculate confidence score (0-100):
-   - Technical alignment: 0-40 points
-   - Sentiment: 0-30 points
-   - Liquidity: 0-20 points
-   - Correlation: 0-10 points
-6. Determine if HIGH PROBABILITY trade (confidence ≥ 60)
-7. If yes, specify entry, stop-loss, take-profit, position size
-
-Use your tools systematically. Think step-by-step. Show reasoning.
-
-EFFICIENCY GUIDELINES:
-- Call tools in PARALLEL when possible (multiple independent fetch_market_data calls in one message)
-- DO NOT call the same tool multiple times with identical parameters
-- Use multi_timeframe_analysis when available instead of individual fetches
-- Verify symbol format once (e.g., try "XANUSDT" not "XAN") before making multiple calls
-
-IMPORTANT: Only recommend trades with confidence ≥ 60. Be conservative.
-
-FINAL STEP: Call submit_trading_signal() with your complete analysis.
-This is REQUIRED - include all 10 parameters (confidence, prices, scores, symbol, analysis).
+_ANALYSIS_PROMPT_TAIL = """
+Follow the per-mover analysis steps from your instructions and finish with submit_trading_signal().
 """
-        return prompt
 
-    def build_reanalysis_prompt(self, position: Dict[str, Any]) -> str:
-        """
-        Build prompt for re-analyzing an open position.
-
-        Args:
-            position: Position details
-
-        Returns:
-            Formatted prompt string
-        """
-        symbol = position['symbol']
-        direction = position['direction']
-        entry_price = position['entry_price']
-        current_price = position['current_price']
-        pnl_pct = position['pnl_pct']
-        original_confidence = position['original_confidence']
-        duration = position['duration_minutes']
-
-        prompt = f"""Re-analyze open position for {symbol} {direction}.
+_format_reanalysis_prompt = """Re-analyze open position for {symbol} {direction}.
 
 Position details:
 - Entry: ${entry_price:,.2f} @ {duration} minutes ago
@@ -180,7 +151,9 @@ Position details:
 - P&L: {pnl_pct:+.2f}%
 - Original confidence: {original_confidence}
 - Time in position: {duration} minutes
+""".format
 
+_REANALYSIS_PROMPT_TAIL = """
 Check:
 1. Has market sentiment changed? (query web search)
 2. Are technicals still aligned?
@@ -189,4 +162,61 @@ Check:
 
 Calculate updated confidence score. If <40, recommend early exit.
 """
-        return prompt
+
+
+def build_analysis_prompt(
+    mover_context: Dict[str, Any],
+    portfolio_context: Dict[str, Any]
+) -> str:
+    """
+    Build prompt for analyzing a market mover.
+
+    Only the per-mover context is included; the task instructions are part
+    of the system prompt (see ANALYSIS_TASK_INSTRUCTIONS).
+
+    Args:
+        mover_context: Mover details (symbol, direction, changes, price)
+        portfolio_context: Portfolio state (value, positions, exposure)
+
+    Returns:
+        Formatted prompt string
+    """
+    return _format_analysis_prompt(
+        symbol=mover_context['symbol'],
+        direction=mover_context['direction'],
+        change_1h=mover_context['change_1h'],
+        change_4h=mover_context['change_4h'],
+        current_price=mover_context['current_price'],
+        volume_24h=mover_context.get('volume_24h', 0),
+        portfolio_value=portfolio_context['total_value'],
+        open_positions=portfolio_context['open_positions'],
+        exposure_pct=portfolio_context['exposure_pct'],
+    ) + _ANALYSIS_PROMPT_TAIL
+
+
+def build_reanalysis_prompt(position: Dict[str, Any]) -> str:
+    """
+    Build prompt for re-analyzing an open position.
+
+    Args:
+        position: Position details
+
+    Returns:
+        Formatted prompt string
+    """
+    return _format_reanalysis_prompt(
+        symbol=position['symbol'],
+        direction=position['direction'],
+        entry_price=position['entry_price'],
+        current_price=position['current_price'],
+        pnl_pct=position['pnl_pct'],
+        original_confidence=position['original_confidence'],
+        duration=position['duration_minutes'],
+    ) + _REANALYSIS_PROMPT_TAIL
+
+
+class PromptBuilder:
+    """Namespace kept for callers of the former builder class."""
+
+    build_analysis_prompt = staticmethod(build_analysis_prompt)
+    build_reanalysis_prompt = staticmethod(build_reanalysis_prompt)
@@ -1,15 +1,50 @@
 """Risk management configuration."""
 import os
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable
 from enum import Enum
 
+_NO_GROUPS: FrozenSet[str] = frozenset()
+
+# Quote currencies stripped from unslashed symbols such as 'ETHUSDT'
+_QUOTE_SUFFIXES = ('USDT', 'USDC', 'BUSD', 'USD')
+
+
+def base_asset(symbol: str) -> str:
+    """
+    Extract the base asset from an exchange symbol.
+
+    'BTC/USDT:USDT', 'BTC/USDT' and 'BTCUSDT' all give 'BTC'; multiplier
+    prefixes are dropped ('1000PEPEUSDT' gives 'PEPE').
+    """
+    base, slash, _ = symbol.partition('/')
+    if not slash:
+        for quote in _QUOTE_SUFFIXES:
+            if base.endswith(quote) and len(base) > len(quote):
+                base = base[:-len(quote)]
+                break
+    return base.lstrip('0123456789')
+
 class ConfidenceTier(Enum):
     """Confidence tiers for position sizing."""
     HIGH = (80, 100, 2.5)       # (min, max, risk_pct)
     MEDIUM = (60, 79, 1.5)
     LOW = (0, 59, 0.0)
 
+
+def _tier_risk_pct(confidence: float) -> float:
+    """Walk the confidence tiers for a confidence score."""
+    for tier in ConfidenceTier:
+        min_conf, max_conf, risk_pct = tier.value
+        if min_conf <= confidence <= max_conf:
+            return risk_pct
+    return 0.0
+
+
+# Risk percentage for every integer confidence 0-100, indexed by confidence
+_RISK_PCT_BY_CONF = tuple(_tier_risk_pct(confidence) for confidence in range(101))
+
 @dataclass
 class RiskConfig:
     """Risk management configuration."""
@@ -42,8 +77,8 @@ class RiskConfig:
     tp1_risk_reward_ratio: float = 2.0
     tp1_exit_percentage: float = 0.5
 
-    # Correlation groups
-    correlation_groups: Dict[str, List[str]] = field(default_factory=lambda: {
+    # Correlation groups (group -> base assets)
+    correlation_groups: Dict[str, Iterable[str]] = field(default_factory=lambda: {
         'BTC_CORRELATED': ['BTC', 'ETH', 'BNB', 'SOL', 'ADA', 'AVAX', 'DOT', 'MATIC'],
         'DEFI': ['UNI', 'AAVE', 'COMP', 'MKR', 'SNX', 'CRV', 'SUSHI'],
         'GAMING': ['AXS', 'SAND', 'MANA', 'ENJ', 'GALA', 'ILV'],
@@ -52,17 +87,33 @@ class RiskConfig:
         'LAYER2': ['ARB', 'OP', 'MATIC', 'IMX'],
     })
 
+    # Reverse index: base asset -> groups containing it (built in __post_init__)
+    symbol_to_groups: Dict[str, FrozenSet[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.correlation_groups = {
+            group: frozenset(sys.intern(asset) for asset in assets)
+            for group, assets in self.correlation_groups.items()
+        }
+
+        index: Dict[str, set] = {}
+        for group, assets in self.correlation_groups.items():
+            for asset in assets:
+                index.setdefault(asset, set()).add(group)
+        self.symbol_to_groups = {asset: frozenset(groups) for asset, groups in index.items()}
+
+    def get_correlation_groups(self, symbol: str) -> FrozenSet[str]:
+        """Get the correlation groups a symbol's base asset belongs to."""
+        return self.symbol_to_groups.get(base_asset(symbol), _NO_GROUPS)
+
     def get_risk_pct_for_confidence(self, confidence: int) -> float:
         """Get risk percentage based on confidence score."""
-        for tier in ConfidenceTier:
-            min_conf, max_conf, risk_pct = tier.value
-            if min_conf <= confidence <= max_conf:
-                return risk_pct
-        return 0.0
+        if type(confidence) is int and 0 <= confidence <= 100:
+            return _RISK_PCT_BY_CONF[confidence]
+        return _tier_risk_pct(confidence)  # Fractional or out-of-range scores
 
     def get_trailing_distance(self, confidence: int) -> float:
         """Get trailing stop distance based on confidence."""
         if confidence >= 80:
             return self.trailing_distance_high_confidence
-        else:
-            return self.trailing_distance_medium_confidence
+        return self.trailing_distance_medium_confidence
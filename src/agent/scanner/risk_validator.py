@@ -19,6 +19,21 @@ class RiskValidator:
         self.config = config
         self.portfolio = portfolio
 
+    def can_accept_new_position(self, portfolio_context: Dict[str, Any]) -> bool:
+        """
+        Cheap pre-check, before any analysis, that a new position could still pass.
+
+        Args:
+            portfolio_context: Snapshot with 'open_positions' and 'exposure_pct'
+
+        Returns:
+            False if the position count or total exposure is already at its limit
+        """
+        return (
+            portfolio_context['open_positions'] < self.config.max_concurrent_positions
+            and portfolio_context['exposure_pct'] < self.config.max_total_exposure_pct
+        )
+
     async def validate_signal(self, signal: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate signal against all risk checks.
@@ -91,27 +106,19 @@ class RiskValidator:
         """Check correlation group limits."""
         symbol = signal.get('symbol', '')
 
-        # Find correlation group for new signal
-        new_group = None
-        for group, symbols in self.config.correlation_groups.items():
-            if any(sym in symbol for sym in symbols):
-                new_group = group
-                break
-
-        if new_group is None:
+        # Find correlation group for new signal (first declared group wins)
+        groups = self.config.get_correlation_groups(symbol)
+        if not groups:
             # Uncategorized symbol, allow
             return {'valid': True, 'reason': None}
+        new_group = next(group for group in self.config.correlation_groups if group in groups)
 
         # Count existing positions in same group
         open_positions = await self.portfolio.get_open_positions()
-        count_in_group = 0
-
-        for position in open_positions:
-            pos_symbol = position.get('symbol', '')
-            for group, symbols in self.config.correlation_groups.items():
-                if group == new_group and any(sym in pos_symbol for sym in symbols):
-                    count_in_group += 1
-                    break
+        count_in_group = sum(
+            1 for position in open_positions
+            if new_group in self.config.get_correlation_groups(position.get('symbol', ''))
+        )
 
         if count_in_group >= self.config.max_correlated_positions:
             return {
@@ -1,26 +1,53 @@
 """Futures symbol manager for market scanning."""
+import asyncio
+import os
+import tempfile
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
 import logging
 
+from src.agent._json import dumpb, loads
+
 logger = logging.getLogger(__name__)
 
+
 class FuturesSymbolManager:
     """Manages list of tradeable Bybit USDT perpetual futures."""
 
-    def __init__(self, exchange, min_volume_usd: float = 5_000_000):
+    def __init__(
+        self,
+        exchange,
+        min_volume_usd: float = 5_000_000,
+        ticker_chunk_size: Optional[int] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        cache_ttl_minutes: float = 60
+    ):
         """
         Initialize symbol manager.
 
         Args:
             exchange: CCXT exchange instance
             min_volume_usd: Minimum 24h volume filter
+            ticker_chunk_size: Symbols per concurrent fetch_tickers request.
+                None fetches all tickers in one request, which suits
+                exchanges (like Bybit) that return every ticker per call.
+            cache_path: File to persist the filtered symbols to, so a restart
+                within cache_ttl_minutes skips the network reload. None
+                disables the cache.
+            cache_ttl_minutes: Maximum age of a cache file that is loaded
         """
         self.exchange = exchange
         self.min_volume_usd = min_volume_usd
+        self.ticker_chunk_size = ticker_chunk_size
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache_ttl_minutes = cache_ttl_minutes
         self.symbols: Dict[str, Any] = {}
         self.last_refresh: Optional[datetime] = None
 
+        if self.cache_path is not None:
+            self._load_cache()
+
     async def refresh_symbols(self) -> Dict[str, Any]:
         """
         Fetch and filter tradeable USDT perpetual futures.
@@ -33,34 +60,114 @@ class FuturesSymbolManager:
         # Load all markets
         markets = await self.exchange.load_markets()
 
-        # Filter for USDT perpetual futures
-        usdt_futures = {
-            symbol: market
-            for symbol, market in markets.items()
-            if market.get('type') == 'swap'
-            and market.get('quote') == 'USDT'
-            and market.get('info', {}).get('quoteCoin') == 'USDT'
-        }
+        def _is_usdt_swap(market: Dict[str, Any]) -> bool:
+            return (
+                market.get('type') == 'swap'
+                and market.get('quote') == 'USDT'
+                and market.get('info', {}).get('quoteCoin') == 'USDT'
+            )
 
-        logger.info(f"Found {len(usdt_futures)} USDT perpetual futures")
+        # USDT perpetual futures; tickers are only fetched for these
+        symbols_list = [
+            symbol for symbol, market in markets.items() if _is_usdt_swap(market)
+        ]
+
+        logger.info(f"Found {len(symbols_list)} USDT perpetual futures")
 
         # Fetch tickers for volume filtering
-        symbols_list = list(usdt_futures.keys())
-        tickers = await self.exchange.fetch_tickers(symbols_list)
+        tickers = await self._fetch_tickers(symbols_list)
 
-        # Filter by volume
+        # Filter by volume in the same pass that picks up the market info
+        min_volume = self.min_volume_usd
         self.symbols = {
-            symbol: market
-            for symbol, market in usdt_futures.items()
-            if symbol in tickers
-            and tickers[symbol].get('quoteVolume', 0) >= self.min_volume_usd
+            symbol: markets[symbol]
+            for symbol in symbols_list
+            if (ticker := tickers.get(symbol)) is not None
+            and (ticker.get('quoteVolume') or 0) >= min_volume
         }
 
         self.last_refresh = datetime.now()
         logger.info(f"Filtered to {len(self.symbols)} symbols with ≥${self.min_volume_usd:,.0f} volume")
 
+        if self.cache_path is not None:
+            self._save_cache()
+
         return self.symbols
 
+    async def _fetch_tickers(self, symbols_list: List[str]) -> Dict[str, Any]:
+        """
+        Fetch tickers, split into concurrent chunks when configured.
+
+        Args:
+            symbols_list: Symbols to fetch tickers for
+
+        Returns:
+            Dict of symbol -> ticker
+        """
+        chunk_size = self.ticker_chunk_size
+        if not chunk_size or len(symbols_list) <= chunk_size:
+            return await self.exchange.fetch_tickers(symbols_list)
+
+        chunks = [
+            symbols_list[i:i + chunk_size]
+            for i in range(0, len(symbols_list), chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(self.exchange.fetch_tickers(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+
+        tickers: Dict[str, Any] = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                # Exchange rejected a partial symbol list; fall back to one request
+                logger.warning(f"Chunked ticker fetch failed ({result}), retrying in one request")
+                return await self.exchange.fetch_tickers(symbols_list)
+            tickers.update(result)
+
+        return tickers
+
+    def _load_cache(self) -> None:
+        """Load symbols from the cache file if it is fresh and matches min_volume_usd."""
+        try:
+            mtime = self.cache_path.stat().st_mtime
+            cached_at = datetime.fromtimestamp(mtime)
+            if datetime.now() - cached_at > timedelta(minutes=self.cache_ttl_minutes):
+                return
+
+            cached = loads(self.cache_path.read_bytes())
+            if cached.get('min_volume_usd') != self.min_volume_usd:
+                return
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable symbols cache {self.cache_path}: {e}")
+            return
+
+        self.symbols = cached['symbols']
+        self.last_refresh = cached_at
+        logger.info(f"Loaded {len(self.symbols)} symbols from cache {self.cache_path}")
+
+    def _save_cache(self) -> None:
+        """Atomically write the current symbols to the cache file."""
+        payload = dumpb({
+            'min_volume_usd': self.min_volume_usd,
+            'symbols': self.symbols,
+        })
+        directory = self.cache_path.parent
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=self.cache_path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write symbols cache {self.cache_path}: {e}")
+
     def get_symbols(self) -> Dict[str, Any]:
         """
         Get cached symbols without refresh.
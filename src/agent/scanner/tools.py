@@ -2,30 +2,94 @@
 import anthropic
 import asyncio
 import concurrent.futures
+import inspect
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from typing import Awaitable, Dict, Any, Optional, List, Tuple, TypeVar
 from claude_agent_sdk import tool
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from duckduckgo_search import DDGS
 
+from src.agent._json import dumps
+from src.agent.tools import market_data
+
 from .config import ScannerConfig
 
 logger = logging.getLogger(__name__)
 
-# Module-level storage for signal queue (simpler than contextvars for MCP)
-_signal_queue: Optional[asyncio.Queue] = None
+T = TypeVar('T')
+
+# Default per-fetch timeout for fetch_technical_snapshot
+SNAPSHOT_FETCH_TIMEOUT_SECONDS = 5.0
+
+
+class FutureSink:
+    """
+    Single-shot signal sink backed by an asyncio.Future.
+
+    Exposes the put_nowait() side of the asyncio.Queue interface so it can be
+    installed with set_signal_queue(). Only the first signal is kept.
+    """
+
+    __slots__ = ('future',)
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+
+    def put_nowait(self, item: Any) -> None:
+        """Resolve the future with item unless already resolved."""
+        if not self.future.done():
+            self.future.set_result(item)
+
 
+class SignalRelay:
+    """
+    Re-targetable signal sink for a long-lived client.
+
+    Tool handlers run in tasks the SDK client spawns when it connects, so
+    they see the sink installed at connect time. A persistent client is
+    connected with a relay installed instead, and each run points the relay
+    at its own sink.
+    """
+
+    __slots__ = ('sink',)
+
+    def __init__(self):
+        self.sink: Optional[Any] = None
+
+    def put_nowait(self, item: Any) -> None:
+        """Forward item to the current run's sink."""
+        if self.sink is None:
+            raise RuntimeError("No analysis is waiting for a signal")
+        self.sink.put_nowait(item)
+
+
+# Signal sink for the current analysis. A context variable, so concurrent
+# analyses (each in its own task, with its own client) do not see each
+# other's sink.
+_signal_queue: ContextVar[Optional[Any]] = ContextVar('signal_queue', default=None)
+
+
+def set_signal_queue(queue: Any) -> Token:
+    """
+    Set the signal sink for the current analysis session.
 
-def set_signal_queue(queue: asyncio.Queue):
-    """Set the signal queue for the current analysis session."""
-    global _signal_queue
-    _signal_queue = queue
+    Accepts any object with put_nowait(), e.g. asyncio.Queue or FutureSink.
+    Returns a token for clear_signal_queue().
+    """
+    return _signal_queue.set(queue)
 
 
-def clear_signal_queue():
+def clear_signal_queue(token: Optional[Token] = None):
     """Clear the signal queue after analysis completes."""
-    global _signal_queue
-    _signal_queue = None
+    if token is not None:
+        _signal_queue.reset(token)
+    else:
+        _signal_queue.set(None)
 
 
 # Module-level storage for scanner config
@@ -52,6 +116,114 @@ def get_web_search_timeout() -> int:
     return 30
 
 
+def get_sentiment_cache_ttl() -> int:
+    """Get sentiment cache TTL from config; caching is off without a scanner config."""
+    if _scanner_config:
+        return _scanner_config.sentiment_cache_ttl_seconds
+    return 0
+
+
+# Sentiment responses per symbol and move direction: key -> (monotonic store
+# time, response text), least recently used first. News sentiment over a
+# 24-48h window does not change between scan cycles minutes apart, so one web
+# search + LLM call serves every analysis of a symbol moving the same way
+# within the TTL.
+SENTIMENT_CACHE_SIZE = 256
+_sentiment_cache: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+# Contexts asking for the very latest news bypass the cache
+_TIME_SENSITIVE_CONTEXT = re.compile(
+    r"\b(?:now|latest|breaking|just)\b|\b\d{1,2}:\d{2}\b|\b\d{9,}\b",
+    re.IGNORECASE
+)
+
+
+# Move direction in a sentiment context; the context shapes the search query
+# and the LLM scoring prompt, so a gainer never reuses a loser's analysis
+_UP_CONTEXT = re.compile(
+    r"\b(?:up|gain\w*|pump\w*|ris(?:e|es|ing)|rall\w*|surg\w*|bull\w*|long)\b|(?<![\w.])\+\d",
+    re.IGNORECASE
+)
+_DOWN_CONTEXT = re.compile(
+    r"\b(?:down|los(?:s|es|er|ers|ing)|dump\w*|drop\w*|fall\w*|fell|crash\w*|bear\w*|short)\b|(?<![\w.])-\d",
+    re.IGNORECASE
+)
+_CONTEXT_NUMBERS = re.compile(r"[\d.,%+-]+")
+
+
+def _sentiment_cache_key(symbol: str, context: str) -> str:
+    """
+    Build the sentiment cache key from the symbol and the move in context.
+
+    Contexts naming one direction share a key whatever the percentages;
+    anything else keys on its text with the numbers removed.
+    """
+    up = _UP_CONTEXT.search(context) is not None
+    down = _DOWN_CONTEXT.search(context) is not None
+    if up != down:
+        move = 'UP' if up else 'DOWN'
+    else:
+        move = ' '.join(_CONTEXT_NUMBERS.sub(' ', context.lower()).split())
+    return f"{symbol.strip().upper()}|{move}"
+
+
+def clear_sentiment_cache() -> None:
+    """Drop all cached sentiment responses."""
+    _sentiment_cache.clear()
+
+
+def _get_cached_sentiment(key: str, ttl: float) -> Optional[str]:
+    """Return a fresh cached sentiment response, evicting it if expired."""
+    entry = _sentiment_cache.get(key)
+    if entry is None:
+        return None
+
+    stored_at, text = entry
+    if time.monotonic() - stored_at >= ttl:
+        del _sentiment_cache[key]
+        return None
+
+    _sentiment_cache.move_to_end(key)
+    return text
+
+
+def _cache_sentiment(key: str, text: str) -> None:
+    """Store a sentiment response, evicting the least recently used."""
+    _sentiment_cache[key] = (time.monotonic(), text)
+    _sentiment_cache.move_to_end(key)
+    while len(_sentiment_cache) > SENTIMENT_CACHE_SIZE:
+        _sentiment_cache.popitem(last=False)
+
+
+class TradingSignalArgs(BaseModel):
+    """Validated arguments of submit_trading_signal."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    confidence: int = Field(default=0, ge=0, le=100)
+    entry_price: float = 0.0
+    stop_loss: float = 0.0
+    tp1: float = 0.0
+    technical_score: float = Field(default=0.0, ge=0, le=40)
+    sentiment_score: float = Field(default=0.0, ge=0, le=30)
+    liquidity_score: float = Field(default=0.0, ge=0, le=20)
+    correlation_score: float = Field(default=0.0, ge=0, le=10)
+    # Accepts both BTCUSDT and BTC/USDT formats
+    symbol: str = Field(default="UNKNOWN", min_length=1)
+    analysis: str = Field(default="", min_length=1, validate_default=True)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Render a ValidationError as one line per invalid field."""
+    return '; '.join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'args'}: {err['msg']}"
+        for err in error.errors(include_url=False)
+    )
+
+
+# Tool names, descriptions and schemas are sent with every agent turn and
+# form the start of the cached prompt prefix, so they are fixed at import:
+# descriptions are dedented once (fewer tokens) and never built per call.
 @tool(
     name="submit_trading_signal",
     description="Submit analyzed trading signal with confidence breakdown. Call this as FINAL step with all analysis results.",
@@ -70,102 +242,38 @@ def get_web_search_timeout() -> int:
 )
 async def submit_trading_signal(args: Dict[str, Any]) -> Dict[str, Any]:
     """Submit analyzed trading signal with confidence breakdown."""
-    # Extract parameters from args dict
-    confidence = args.get("confidence", 0)
-    entry_price = args.get("entry_price", 0.0)
-    stop_loss = args.get("stop_loss", 0.0)
-    tp1 = args.get("tp1", 0.0)
-    technical_score = args.get("technical_score", 0.0)
-    sentiment_score = args.get("sentiment_score", 0.0)
-    liquidity_score = args.get("liquidity_score", 0.0)
-    correlation_score = args.get("correlation_score", 0.0)
-    symbol = args.get("symbol", "UNKNOWN")
-    analysis = args.get("analysis", "")
-
-    # DEBUG: Print to confirm function is called
-    print(f"[DEBUG] submit_trading_signal called for {symbol} with confidence={confidence}")
-    logger.info(f"[TOOL START] submit_trading_signal called for {symbol}")
-
-    # Validate confidence is in valid range
-    if not (0 <= confidence <= 100):
-        logger.error(f"Invalid confidence score: {confidence} (must be 0-100)")
-        return {
-            'status': 'error',
-            'error': f'Confidence must be 0-100, got {confidence}'
-        }
-
-    # Validate component scores
-    if not (0 <= technical_score <= 40):
-        logger.error(f"Invalid technical_score: {technical_score} (must be 0-40)")
-        return {
-            'status': 'error',
-            'error': f'technical_score must be 0-40, got {technical_score}'
-        }
-
-    if not (0 <= sentiment_score <= 30):
-        logger.error(f"Invalid sentiment_score: {sentiment_score} (must be 0-30)")
+    try:
+        validated = TradingSignalArgs.model_validate(args)
+    except ValidationError as e:
+        error = _format_validation_error(e)
+        logger.error("Invalid trading signal: %s", error)
         return {
             'status': 'error',
-            'error': f'sentiment_score must be 0-30, got {sentiment_score}'
+            'error': error
         }
 
-    if not (0 <= liquidity_score <= 20):
-        logger.error(f"Invalid liquidity_score: {liquidity_score} (must be 0-20)")
-        return {
-            'status': 'error',
-            'error': f'liquidity_score must be 0-20, got {liquidity_score}'
-        }
-
-    if not (0 <= correlation_score <= 10):
-        logger.error(f"Invalid correlation_score: {correlation_score} (must be 0-10)")
-        return {
-            'status': 'error',
-            'error': f'correlation_score must be 0-10, got {correlation_score}'
-        }
+    confidence = validated.confidence
+    entry_price = validated.entry_price
+    stop_loss = validated.stop_loss
+    tp1 = validated.tp1
+    symbol = validated.symbol
 
     # Validate prices - allow 0/missing for low-confidence signals (fallback applied later)
     # Only warn, don't reject - main_loop will fill in current_price as fallback
     if entry_price <= 0:
-        logger.warning(f"Missing entry_price (got {entry_price}) - will use current price as fallback")
+        logger.warning("Missing entry_price (got %s) - will use current price as fallback", entry_price)
     if stop_loss <= 0:
-        logger.warning(f"Missing stop_loss (got {stop_loss}) - will calculate from entry price")
+        logger.warning("Missing stop_loss (got %s) - will calculate from entry price", stop_loss)
     if tp1 <= 0:
-        logger.warning(f"Missing tp1 (got {tp1}) - will calculate from entry price")
-
-    # Validate symbol is not empty (accept both BTCUSDT and BTC/USDT formats)
-    if not symbol or len(symbol.strip()) == 0:
-        logger.error(f"Invalid symbol: empty or whitespace")
-        return {
-            'status': 'error',
-            'error': 'Symbol cannot be empty'
-        }
-
-    # Validate analysis is not empty
-    if not analysis or len(analysis.strip()) == 0:
-        logger.error("Analysis text is empty")
-        return {
-            'status': 'error',
-            'error': 'Analysis text cannot be empty'
-        }
+        logger.warning("Missing tp1 (got %s) - will calculate from entry price", tp1)
 
     # Build validated signal
-    signal = {
-        'confidence': confidence,
-        'entry_price': entry_price,
-        'stop_loss': stop_loss,
-        'tp1': tp1,
-        'technical_score': technical_score,
-        'sentiment_score': sentiment_score,
-        'liquidity_score': liquidity_score,
-        'correlation_score': correlation_score,
-        'symbol': symbol,
-        'analysis': analysis
-    }
+    signal = validated.model_dump()
 
-    # Get the signal queue from module-level storage
-    global _signal_queue
+    # Get the sink installed for this analysis
+    signal_queue = _signal_queue.get()
 
-    if _signal_queue is None:
+    if signal_queue is None:
         logger.error("Signal queue not set - tool called outside wrapper context?")
         return {
             'status': 'error',
@@ -173,10 +281,9 @@ async def submit_trading_signal(args: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     try:
-        logger.info(f"Got signal queue: {_signal_queue}")
-        logger.info(f"Submitting signal for {symbol}: confidence={confidence}")
-        await _signal_queue.put(signal)
-        logger.info(f"Signal successfully queued for {symbol}")
+        signal_queue.put_nowait(signal)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("submit_trading_signal %s conf=%d queued", symbol, confidence)
 
         return {
             'status': 'success',
@@ -192,24 +299,23 @@ async def submit_trading_signal(args: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-async def fetch_market_data_internal(symbol: str, timeframe: str, limit: int = 50) -> Dict[str, Any]:
-    """Internal function to fetch market data."""
-    from src.agent.tools.market_data import fetch_market_data
-    result = await fetch_market_data.handler({
-        "symbol": symbol,
-        "timeframe": timeframe,
-        "limit": limit
-    })
-    # Extract data from the 'data' field (not from content text)
-    if "data" in result and result["data"]:
-        return result["data"]
-    return []
+async def fetch_market_data_internal(symbol: str, timeframe: str, limit: int = 50) -> List[Dict[str, Any]]:
+    """Internal function to fetch market data as OHLCV row dicts."""
+    # Skip the MCP tool wrapper: its text summary is only for the agent
+    return await market_data.fetch_ohlcv_records(symbol, timeframe, limit)
+
+
+async def _with_timeout(coro: Awaitable[T], timeout: float) -> T:
+    """Await coro, raising a descriptive TimeoutError after timeout seconds."""
+    try:
+        return await asyncio.wait_for(coro, timeout=timeout)
+    except asyncio.TimeoutError:
+        raise asyncio.TimeoutError(f"timed out after {timeout:g}s") from None
 
 
 async def get_current_price_internal(symbol: str) -> float:
     """Internal function to get current price."""
-    from src.agent.tools.market_data import get_current_price
-    result = await get_current_price.handler({"symbol": symbol})
+    result = await market_data.get_current_price.handler({"symbol": symbol})
     # Extract price from top-level field (not from content text)
     if "price" in result:
         return result["price"]
@@ -218,7 +324,7 @@ async def get_current_price_internal(symbol: str) -> float:
 
 @tool(
     name="fetch_technical_snapshot",
-    description="""
+    description=inspect.cleandoc("""
     Fetch complete technical analysis snapshot in one call.
 
     Returns ANALYZED technical data for multiple timeframes (15m, 1h, 4h).
@@ -229,13 +335,23 @@ async def get_current_price_internal(symbol: str) -> float:
 
     Args:
         symbol: Trading pair (e.g., "BTCUSDT")
+        timeout: Optional seconds to wait for each data fetch; slower fetches
+            are reported in warnings instead of delaying the snapshot
 
     Returns:
         JSON with analyzed data per timeframe, current price, warnings, and summary.
         Each timeframe includes: trend_score, momentum_score, volatility_score, key signals.
-    """,
+    """),
     input_schema={
-        "symbol": str
+        "type": "object",
+        "properties": {
+            "symbol": {"type": "string"},
+            "timeout": {
+                "type": "number",
+                "description": "Seconds to wait for each data fetch (default 5)"
+            }
+        },
+        "required": ["symbol"]
     }
 )
 async def fetch_technical_snapshot(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -245,16 +361,20 @@ async def fetch_technical_snapshot(args: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     symbol = args.get("symbol", "")
+    timeout = args.get("timeout") or SNAPSHOT_FETCH_TIMEOUT_SECONDS
+    if timeout <= 0:
+        timeout = SNAPSHOT_FETCH_TIMEOUT_SECONDS
     warnings: List[str] = []
     success_count = 0
 
-    # Fetch all data in parallel using asyncio.gather
+    # Fetch all data in parallel using asyncio.gather; each fetch is bounded
+    # so one hanging request cannot stall the whole snapshot
     # Fetch 200+ periods for 1h to support all indicators (EMA 200 needs 200 periods)
     results = await asyncio.gather(
-        fetch_market_data_internal(symbol, "15m", limit=200),
-        fetch_market_data_internal(symbol, "1h", limit=200),
-        fetch_market_data_internal(symbol, "4h", limit=200),
-        get_current_price_internal(symbol),
+        _with_timeout(fetch_market_data_internal(symbol, "15m", limit=200), timeout),
+        _with_timeout(fetch_market_data_internal(symbol, "1h", limit=200), timeout),
+        _with_timeout(fetch_market_data_internal(symbol, "4h", limit=200), timeout),
+        _with_timeout(get_current_price_internal(symbol), timeout),
         return_exceptions=True
     )
 
@@ -375,7 +495,7 @@ async def fetch_technical_snapshot(args: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "content": [{
             "type": "text",
-            "text": json.dumps(response_data, indent=2)
+            "text": dumps(response_data)
         }]
     }
 
@@ -626,7 +746,7 @@ Return ONLY valid JSON, no other text."""
 
 @tool(
     name="fetch_sentiment_data",
-    description="""
+    description=inspect.cleandoc("""
     Fetch and analyze market sentiment for a trading symbol.
 
     Executes web search for recent news and uses LLM to analyze sentiment.
@@ -641,7 +761,7 @@ Return ONLY valid JSON, no other text."""
 
     Returns:
         JSON with web_results, sentiment_summary, sentiment_score (0-30), key_findings
-    """,
+    """),
     input_schema={
         "symbol": str,
         "context": str
@@ -652,6 +772,22 @@ async def fetch_sentiment_data(args: Dict[str, Any]) -> Dict[str, Any]:
     symbol = args.get("symbol", "")
     context = args.get("context", "")
 
+    # Reuse a recent analysis of the same symbol and move unless the caller
+    # wants the latest news
+    cache_ttl = get_sentiment_cache_ttl()
+    cache_key = _sentiment_cache_key(symbol, context or "")
+    use_cache = cache_ttl > 0 and not _TIME_SENSITIVE_CONTEXT.search(context or "")
+    if use_cache:
+        cached_text = _get_cached_sentiment(cache_key, cache_ttl)
+        if cached_text is not None:
+            logger.info(f"Reusing cached sentiment analysis for {symbol}")
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": cached_text
+                }]
+            }
+
     # Step 1: Generate search query
     try:
         sentiment_query = await generate_sentiment_query_internal(symbol, context)
@@ -685,10 +821,13 @@ async def fetch_sentiment_data(args: Dict[str, Any]) -> Dict[str, Any]:
         "key_findings": sentiment_analysis.get("key_findings", []),
         "success": True
     }
+    response_text = dumps(response_data)
+    if use_cache:
+        _cache_sentiment(cache_key, response_text)
 
     return {
         "content": [{
             "type": "text",
-            "text": json.dumps(response_data)
+            "text": response_text
         }]
     }
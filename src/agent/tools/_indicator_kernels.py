@@ -0,0 +1,161 @@
+"""Last-value indicator kernels over raw close arrays.
+
+Each kernel walks the close prices once and returns only the latest value,
+matching pandas_ta's rsi/macd/ema (SMA-seeded EMAs, Wilder-smoothed RSI)
+without building intermediate Series. Compiled with Numba when available.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _ema_last(close, length):
+    """
+    Latest EMA of close, seeded with the SMA of the first length values.
+
+    Returns NaN when there are fewer than length values.
+    """
+    n = close.shape[0]
+    if n < length:
+        return np.nan
+
+    alpha = 2.0 / (length + 1)
+    ema = 0.0
+    for i in range(length):
+        ema += close[i]
+    ema /= length
+    for i in range(length, n):
+        ema = alpha * close[i] + (1.0 - alpha) * ema
+    return ema
+
+
+@njit(cache=True)
+def _macd_last(close, fast, slow, signal):
+    """
+    Latest MACD line and signal line in one pass.
+
+    The fast and slow EMAs run side by side; the signal line is an SMA-seeded
+    EMA of the MACD line from its first valid value.
+
+    Returns:
+        (macd, signal); NaN where there is not enough data
+    """
+    n = close.shape[0]
+    if n < slow:
+        return np.nan, np.nan
+
+    fast_alpha = 2.0 / (fast + 1)
+    slow_alpha = 2.0 / (slow + 1)
+    signal_alpha = 2.0 / (signal + 1)
+
+    fast_ema = 0.0
+    slow_ema = 0.0
+    for i in range(slow):
+        if i < fast:
+            fast_ema += close[i]
+            if i == fast - 1:
+                fast_ema /= fast
+        else:
+            fast_ema = fast_alpha * close[i] + (1.0 - fast_alpha) * fast_ema
+        slow_ema += close[i]
+    slow_ema /= slow
+
+    macd = fast_ema - slow_ema
+    signal_ema = macd
+    count = 1
+    for i in range(slow, n):
+        fast_ema = fast_alpha * close[i] + (1.0 - fast_alpha) * fast_ema
+        slow_ema = slow_alpha * close[i] + (1.0 - slow_alpha) * slow_ema
+        macd = fast_ema - slow_ema
+        if count < signal:
+            signal_ema += macd
+            count += 1
+            if count == signal:
+                signal_ema /= signal
+        else:
+            signal_ema = signal_alpha * macd + (1.0 - signal_alpha) * signal_ema
+
+    if count < signal:
+        return macd, np.nan
+    return macd, signal_ema
+
+
+@njit(cache=True)
+def _rsi_last(close, length):
+    """
+    Latest RSI of close.
+
+    Gains and losses are averaged with an adjusted exponential mean using
+    alpha = 1/length (pandas ewm(adjust=True)), as pandas_ta's rma does.
+
+    Returns NaN when there are fewer than length price changes.
+    """
+    n = close.shape[0]
+    if n - 1 < length:
+        return np.nan
+
+    decay = 1.0 - 1.0 / length
+    gain_sum = 0.0
+    loss_sum = 0.0
+    weight_sum = 0.0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain_sum = gain_sum * decay + (change if change > 0 else 0.0)
+        loss_sum = loss_sum * decay + (-change if change < 0 else 0.0)
+        weight_sum = weight_sum * decay + 1.0
+
+    avg_gain = gain_sum / weight_sum
+    avg_loss = loss_sum / weight_sum
+    total = avg_gain + avg_loss
+    if total == 0.0:
+        return np.nan
+    return 100.0 * avg_gain / total
+
+
+@njit(cache=True)
+def _last_indicators(closes, lengths):
+    """
+    Latest indicators for several close series in one call.
+
+    Args:
+        closes: (n_series, max_len) array, each row left-aligned
+        lengths: Number of valid values in each row
+
+    Returns:
+        (n_series, 5) array of RSI(14), MACD(12, 26), MACD signal(9),
+        EMA(20) and EMA(50) per row
+    """
+    n_series = closes.shape[0]
+    out = np.empty((n_series, 5))
+    for i in range(n_series):
+        close = closes[i, :lengths[i]]
+        out[i, 0] = _rsi_last(close, 14)
+        macd, signal = _macd_last(close, 12, 26, 9)
+        out[i, 1] = macd
+        out[i, 2] = signal
+        out[i, 3] = _ema_last(close, 20)
+        out[i, 4] = _ema_last(close, 50)
+    return out
+
+
+def warm_kernels() -> None:
+    """
+    Compile every kernel ahead of the first real call.
+
+    Numba compiles on first call (or loads its on-disk cache), which can take
+    seconds. Callers run this at startup, ideally off the event loop while
+    waiting on I/O, so the first analysis pass is not stalled.
+    """
+    close = np.zeros(60, dtype=np.float64)
+    _ema_last(close, 20)
+    _macd_last(close, 12, 26, 9)
+    _rsi_last(close, 14)
+    _last_indicators(close.reshape(1, -1), np.array([close.shape[0]]))
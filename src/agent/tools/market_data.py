@@ -24,6 +24,28 @@ def get_exchange():
             _exchange.set_sandbox_mode(True)
     return _exchange
 
+async def fetch_ohlcv_records(symbol: str, timeframe: str, limit: int) -> List[Dict[str, Any]]:
+    """
+    Fetch OHLCV candles from Bybit as row dicts.
+
+    Raises:
+        Exception: Any exchange error, unchanged
+    """
+    exchange = get_exchange()
+
+    # Fetch OHLCV: [[timestamp, open, high, low, close, volume], ...]
+    ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+
+    # Convert to DataFrame
+    df = pd.DataFrame(
+        ohlcv,
+        columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    )
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+
+    return df.to_dict(orient='records')
+
+
 @tool(
     name="fetch_market_data",
     description="Fetch OHLCV candlestick data from Bybit for a symbol and timeframe",
@@ -41,29 +63,20 @@ async def fetch_market_data(args: Dict[str, Any]) -> Dict[str, Any]:
         Dictionary with OHLCV data as pandas DataFrame (serialized)
     """
     try:
-        exchange = get_exchange()
         symbol = args.get("symbol", "BTC/USDT")
         timeframe = args.get("timeframe", "1h")
         limit = args.get("limit", 100)
 
-        # Fetch OHLCV: [[timestamp, open, high, low, close, volume], ...]
-        ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(
-            ohlcv,
-            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        )
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        records = await fetch_ohlcv_records(symbol, timeframe, limit)
 
         return {
             "content": [{
                 "type": "text",
-                "text": f"Fetched {len(df)} candles for {symbol} ({timeframe})\n"
-                        f"Latest price: {df['close'].iloc[-1]:.2f}\n"
-                        f"Data range: {df['timestamp'].iloc[0]} to {df['timestamp'].iloc[-1]}"
+                "text": f"Fetched {len(records)} candles for {symbol} ({timeframe})\n"
+                        f"Latest price: {records[-1]['close']:.2f}\n"
+                        f"Data range: {records[0]['timestamp']} to {records[-1]['timestamp']}"
             }],
-            "data": df.to_dict(orient='records')
+            "data": records
         }
     except Exception as e:
         return {
@@ -71,13 +71,16 @@ async def execute_paper_trade(args: Dict[str, Any]) -> Dict[str, Any]:
         db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
 
         manager = PaperPortfolioManager(db_path, args["portfolio_name"])
-        await manager.initialize()
+        try:
+            await manager.initialize()
 
-        result = await manager.execute_signal(
-            signal=args["signal"],
-            current_price=args["current_price"],
-            market_data=args.get("market_data")
-        )
+            result = await manager.execute_signal(
+                signal=args["signal"],
+                current_price=args["current_price"],
+                market_data=args.get("market_data")
+            )
+        finally:
+            await manager.close()
 
         if result['executed']:
             details = result['execution_details']
@@ -122,9 +125,12 @@ async def get_paper_portfolio_status(args: Dict[str, Any]) -> Dict[str, Any]:
         db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
 
         manager = PaperPortfolioManager(db_path, args["portfolio_name"])
-        await manager.initialize()
+        try:
+            await manager.initialize()
 
-        summary = await manager.get_portfolio_summary()
+            summary = await manager.get_portfolio_summary()
+        finally:
+            await manager.close()
 
         # Format summary
         portfolio = summary['portfolio']
@@ -181,9 +187,12 @@ async def update_paper_positions(args: Dict[str, Any]) -> Dict[str, Any]:
         db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
 
         manager = PaperPortfolioManager(db_path, args["portfolio_name"])
-        await manager.initialize()
+        try:
+            await manager.initialize()
 
-        await manager.update_positions(args["current_prices"])
+            await manager.update_positions(args["current_prices"])
+        finally:
+            await manager.close()
 
         return {
             "content": [{
@@ -210,9 +219,12 @@ async def reset_circuit_breaker(args: Dict[str, Any]) -> Dict[str, Any]:
         db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
 
         manager = PaperPortfolioManager(db_path, args["portfolio_name"])
-        await manager.initialize()
+        try:
+            await manager.initialize()
 
-        await manager.risk_manager.reset_circuit_breaker()
+            await manager.risk_manager.reset_circuit_breaker()
+        finally:
+            await manager.close()
 
         return {
             "content": [{
@@ -1,10 +1,50 @@
 """Portfolio monitoring and P&L tracking."""
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from claude_agent_sdk import tool
 from pathlib import Path
 import aiosqlite
 import os
 
+# Connection shared by the portfolio tools (opened on first use). Reusing it
+# skips the per-call open/journal setup and keeps SQLite's prepared-statement
+# cache warm across calls.
+_db: Optional[aiosqlite.Connection] = None
+_db_path: Optional[Path] = None
+
+
+async def _get_db() -> aiosqlite.Connection:
+    """Return the shared connection for DB_PATH, (re)opening it if needed."""
+    global _db, _db_path
+
+    db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
+    if _db is not None and _db_path == db_path:
+        return _db
+
+    await close_db()  # DB_PATH changed since the connection was opened
+
+    db = await aiosqlite.connect(db_path)
+    db.row_factory = aiosqlite.Row
+    await db.execute("PRAGMA journal_mode=WAL")
+    await db.execute("PRAGMA synchronous=NORMAL")
+    await db.execute("PRAGMA temp_store=MEMORY")
+
+    if _db is not None:
+        # Another call opened one while we were connecting
+        await db.close()
+        return _db
+
+    _db, _db_path = db, db_path
+    return db
+
+
+async def close_db() -> None:
+    """Close the shared portfolio tools connection (call on shutdown)."""
+    global _db, _db_path
+
+    db, _db, _db_path = _db, None, None
+    if db is not None:
+        await db.close()
+
 @tool(
     name="update_portfolio",
     description="Update portfolio position for a symbol",
@@ -20,34 +60,32 @@ import os
 async def update_portfolio(args: Dict[str, Any]) -> Dict[str, Any]:
     """Update or create portfolio position."""
     try:
-        db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
-
-        async with aiosqlite.connect(db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO portfolio_state
-                (symbol, position_type, entry_price, quantity, stop_loss, take_profit, current_price)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(symbol) DO UPDATE SET
-                    position_type=excluded.position_type,
-                    entry_price=excluded.entry_price,
-                    quantity=excluded.quantity,
-                    stop_loss=excluded.stop_loss,
-                    take_profit=excluded.take_profit,
-                    current_price=excluded.current_price,
-                    timestamp=CURRENT_TIMESTAMP
-                """,
-                (
-                    args["symbol"],
-                    args["position_type"],
-                    args["entry_price"],
-                    args["quantity"],
-                    args.get("stop_loss", 0),
-                    args.get("take_profit", 0),
-                    args["entry_price"]  # Initial current_price
-                )
+        db = await _get_db()
+        await db.execute(
+            """
+            INSERT INTO portfolio_state
+            (symbol, position_type, entry_price, quantity, stop_loss, take_profit, current_price)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(symbol) DO UPDATE SET
+                position_type=excluded.position_type,
+                entry_price=excluded.entry_price,
+                quantity=excluded.quantity,
+                stop_loss=excluded.stop_loss,
+                take_profit=excluded.take_profit,
+                current_price=excluded.current_price,
+                timestamp=CURRENT_TIMESTAMP
+            """,
+            (
+                args["symbol"],
+                args["position_type"],
+                args["entry_price"],
+                args["quantity"],
+                args.get("stop_loss", 0),
+                args.get("take_profit", 0),
+                args["entry_price"]  # Initial current_price
             )
-            await db.commit()
+        )
+        await db.commit()
 
         return {
             "content": [{
@@ -72,66 +110,65 @@ async def update_portfolio(args: Dict[str, Any]) -> Dict[str, Any]:
 async def calculate_pnl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate unrealized P&L for a position."""
     try:
-        db_path = Path(os.getenv("DB_PATH", "./trading_data.db"))
         symbol = args["symbol"]
         current_price = args["current_price"]
 
-        async with aiosqlite.connect(db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM portfolio_state WHERE symbol = ?",
-                (symbol,)
-            ) as cursor:
-                row = await cursor.fetchone()
-
-                if not row:
-                    return {
-                        "content": [{
-                            "type": "text",
-                            "text": f"No position found for {symbol}"
-                        }]
-                    }
-
-                position = dict(row)
-                entry_price = position['entry_price']
-                quantity = position['quantity']
-                position_type = position['position_type']
-
-                if position_type == "NONE":
-                    return {
-                        "content": [{
-                            "type": "text",
-                            "text": f"No active position for {symbol}"
-                        }]
-                    }
-
-                # Calculate P&L
-                if position_type == "LONG":
-                    pnl = (current_price - entry_price) * quantity
-                    pnl_pct = ((current_price - entry_price) / entry_price) * 100
-                else:  # SHORT
-                    pnl = (entry_price - current_price) * quantity
-                    pnl_pct = ((entry_price - current_price) / entry_price) * 100
-
-                # Update current price and PNL
-                await db.execute(
-                    """
-                    UPDATE portfolio_state
-                    SET current_price = ?, unrealized_pnl = ?
-                    WHERE symbol = ?
-                    """,
-                    (current_price, pnl, symbol)
-                )
-                await db.commit()
-
-                # Check stop loss / take profit
-                alerts = []
-                if position['stop_loss'] and position_type == "LONG" and current_price <= position['stop_loss']:
-                    alerts.append(f"⚠️  STOP LOSS HIT at ${current_price}")
-                if position['take_profit'] and position_type == "LONG" and current_price >= position['take_profit']:
-                    alerts.append(f"🎯 TAKE PROFIT HIT at ${current_price}")
-
-                pnl_text = f"""
+        # Update current price and P&L and read the position back in one
+        # statement; NONE rows are left untouched
+        db = await _get_db()
+        async with db.execute(
+            """
+            UPDATE portfolio_state
+            SET current_price = CASE position_type
+                    WHEN 'NONE' THEN current_price ELSE :price END,
+                unrealized_pnl = CASE position_type
+                    WHEN 'NONE' THEN unrealized_pnl
+                    WHEN 'LONG' THEN (:price - entry_price) * quantity
+                    ELSE (entry_price - :price) * quantity END
+            WHERE symbol = :symbol
+            RETURNING position_type, entry_price, quantity, stop_loss,
+                take_profit, unrealized_pnl
+            """,
+            {"price": current_price, "symbol": symbol}
+        ) as cursor:
+            row = await cursor.fetchone()
+        await db.commit()
+
+        if not row:
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": f"No position found for {symbol}"
+                }]
+            }
+
+        position = dict(row)
+        entry_price = position['entry_price']
+        quantity = position['quantity']
+        position_type = position['position_type']
+
+        if position_type == "NONE":
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": f"No active position for {symbol}"
+                }]
+            }
+
+        pnl = position['unrealized_pnl']
+        if position_type == "LONG":
+            pnl_pct = ((current_price - entry_price) / entry_price) * 100
+        else:  # SHORT
+            pnl_pct = ((entry_price - current_price) / entry_price) * 100
+
+        # Check stop loss / take profit
+        alerts = []
+        if position['stop_loss'] and position_type == "LONG" and current_price <= position['stop_loss']:
+            alerts.append(f"⚠️  STOP LOSS HIT at ${current_price}")
+        if position['take_profit'] and position_type == "LONG" and current_price >= position['take_profit']:
+            alerts.append(f"🎯 TAKE PROFIT HIT at ${current_price}")
+
+        pnl_text = f"""
 📊 P&L Report for {symbol}
 
 Position: {position_type}
@@ -146,14 +183,14 @@ Take Profit: ${position['take_profit']:.2f}
 {chr(10).join(alerts) if alerts else ''}
 """
 
-                return {
-                    "content": [{"type": "text", "text": pnl_text}],
-                    "pnl": {
-                        "unrealized_pnl": pnl,
-                        "pnl_percentage": pnl_pct,
-                        "alerts": alerts
-                    }
-                }
+        return {
+            "content": [{"type": "text", "text": pnl_text}],
+            "pnl": {
+                "unrealized_pnl": pnl,
+                "pnl_percentage": pnl_pct,
+                "alerts": alerts
+            }
+        }
 
     except Exception as e:
         return {
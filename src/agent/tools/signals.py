@@ -1,8 +1,35 @@
 """Trading signal generation combining technical and sentiment analysis."""
 from typing import Any, Dict
 from claude_agent_sdk import tool
+import bisect
 import json
 
+# |combined_score| above each level moves the signal one step away from HOLD
+_SIGNAL_LEVELS = (0.2, 0.5)
+_SIGNAL_LABELS = ("STRONG_SELL", "SELL", "HOLD", "BUY", "STRONG_BUY")
+
+# Signal report layout, kept out of the tool body; filled per call
+_format_signal_text = """
+🎯 TRADING SIGNAL for {symbol}
+
+Signal: {signal}
+Confidence: {confidence:.1%}
+Current Price: ${price:.2f}
+
+Score Breakdown:
+  Classic (RSI/MACD/BB): {classic_score:.2f}
+  Trend (EMA/Ichimoku): {trend_normalized:.2f}
+  Momentum (Stoch/Elder): {momentum_normalized:.2f}
+  Patterns (Fibonacci): {pattern_normalized:.2f}
+  Technical Score: {tech_score:.2f} (60% weight)
+  Sentiment Score: {sentiment_score:.2f} (40% weight)
+  Combined Score: {combined_score:.2f}
+
+Volatility Adjustment: {confidence_adjustment:.0%}
+
+Reasoning: {reason}
+""".format
+
 
 def calculate_pattern_score(pattern_data: Dict[str, Any]) -> float:
     """
@@ -142,21 +169,13 @@ async def generate_trading_signal(args: Dict[str, Any]) -> Dict[str, Any]:
         combined_score = (tech_score * 0.6) + (sentiment_score * 0.4)
 
         # Generate signal
-        if combined_score > 0.5:
-            signal = "STRONG_BUY"
-            confidence = min(abs(combined_score), 1.0) * confidence_adjustment
-        elif combined_score > 0.2:
-            signal = "BUY"
-            confidence = abs(combined_score) * confidence_adjustment
-        elif combined_score < -0.5:
-            signal = "STRONG_SELL"
-            confidence = min(abs(combined_score), 1.0) * confidence_adjustment
-        elif combined_score < -0.2:
-            signal = "SELL"
-            confidence = abs(combined_score) * confidence_adjustment
+        magnitude = abs(combined_score)
+        strength = bisect.bisect_left(_SIGNAL_LEVELS, magnitude)
+        signal = _SIGNAL_LABELS[2 + strength if combined_score > 0 else 2 - strength]
+        if strength:
+            confidence = min(magnitude, 1.0) * confidence_adjustment
         else:
-            signal = "HOLD"
-            confidence = (1.0 - abs(combined_score)) * confidence_adjustment
+            confidence = (1.0 - magnitude) * confidence_adjustment
 
         # Generate reason
         reasons = []
@@ -200,26 +219,21 @@ async def generate_trading_signal(args: Dict[str, Any]) -> Dict[str, Any]:
 
         reason = " | ".join(reasons) if reasons else "Mixed signals"
 
-        signal_text = f"""
-🎯 TRADING SIGNAL for {symbol}
-
-Signal: {signal}
-Confidence: {confidence:.1%}
-Current Price: ${price:.2f}
-
-Score Breakdown:
-  Classic (RSI/MACD/BB): {classic_score:.2f}
-  Trend (EMA/Ichimoku): {trend_normalized:.2f}
-  Momentum (Stoch/Elder): {momentum_normalized:.2f}
-  Patterns (Fibonacci): {pattern_normalized:.2f}
-  Technical Score: {tech_score:.2f} (60% weight)
-  Sentiment Score: {sentiment_score:.2f} (40% weight)
-  Combined Score: {combined_score:.2f}
-
-Volatility Adjustment: {confidence_adjustment:.0%}
-
-Reasoning: {reason}
-"""
+        signal_text = _format_signal_text(
+            symbol=symbol,
+            signal=signal,
+            confidence=confidence,
+            price=price,
+            classic_score=classic_score,
+            trend_normalized=trend_normalized,
+            momentum_normalized=momentum_normalized,
+            pattern_normalized=pattern_normalized,
+            tech_score=tech_score,
+            sentiment_score=sentiment_score,
+            combined_score=combined_score,
+            confidence_adjustment=confidence_adjustment,
+            reason=reason
+        )
 
         return {
             "content": [{"type": "text", "text": signal_text}],
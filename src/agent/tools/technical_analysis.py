@@ -1,9 +1,36 @@
 """Technical analysis tools using pandas-ta."""
+from collections import OrderedDict
+import copy
 import pandas as pd
 import pandas_ta as ta
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 from claude_agent_sdk import tool
 
+# analyze_technicals results keyed by symbol, timeframe and the candles
+# themselves. Higher timeframes return the same closed candles for many
+# monitoring cycles, so repeated inputs skip the indicator pass.
+TECHNICALS_CACHE_SIZE = 256
+_technicals_cache: OrderedDict[Tuple, Dict[str, Any]] = OrderedDict()
+
+
+def _technicals_cache_key(symbol: str, timeframe: str, ohlcv_data: list) -> Optional[Tuple]:
+    """Content key for an analyze_technicals call, or None if unhashable."""
+    try:
+        candles = tuple(
+            tuple(row.items()) if isinstance(row, dict) else tuple(row)
+            for row in ohlcv_data
+        )
+        hash(candles)
+    except TypeError:
+        return None
+    return (symbol, timeframe, candles)
+
+
+def clear_technicals_cache() -> None:
+    """Drop all memoized analyze_technicals results."""
+    _technicals_cache.clear()
+
+
 @tool(
     name="analyze_technicals",
     description="Perform technical analysis on OHLCV data with RSI, MACD, Bollinger Bands",
@@ -30,6 +57,12 @@ async def analyze_technicals(args: Dict[str, Any]) -> Dict[str, Any]:
                 "is_error": True
             }
 
+        cache_key = _technicals_cache_key(symbol, timeframe, ohlcv_data)
+        if cache_key is not None and cache_key in _technicals_cache:
+            _technicals_cache.move_to_end(cache_key)
+            # Callers may mutate the result, so never hand out the cached object
+            return copy.deepcopy(_technicals_cache[cache_key])
+
         # Convert to DataFrame
         df = pd.DataFrame(ohlcv_data)
 
@@ -91,7 +124,7 @@ Current Price: {latest['close']:.2f}
 Volume: {latest['volume']:.2f} (SMA: {latest['volume_sma']:.2f})
 """
 
-        return {
+        result = {
             "content": [{"type": "text", "text": analysis_text}],
             "indicators": indicators,
             "interpretation": {
@@ -101,6 +134,13 @@ Volume: {latest['volume']:.2f} (SMA: {latest['volume_sma']:.2f})
             }
         }
 
+        if cache_key is not None:
+            _technicals_cache[cache_key] = copy.deepcopy(result)
+            if len(_technicals_cache) > TECHNICALS_CACHE_SIZE:
+                _technicals_cache.popitem(last=False)
+
+        return result
+
     except Exception as e:
         return {
             "content": [{"type": "text", "text": f"Error in technical analysis: {str(e)}"}],
@@ -1,16 +1,49 @@
 """Fetch current Claude Code rate limits using MCP."""
+import json
+import time
+from pathlib import Path
 from typing import Dict, Optional
 
+import aiosqlite
 
-async def fetch_current_limits_from_docs() -> Optional[Dict[str, int]]:
+# Limits change on the scale of weeks; a fetched result is reused for a day
+LIMITS_CACHE_KEY = 'claude_code_limits'
+LIMITS_CACHE_TTL_SECONDS = 86400
+
+
+async def fetch_current_limits_from_docs(
+    db_path: Optional[Path] = None,
+    force_refresh: bool = False
+) -> Optional[Dict[str, int]]:
     """
     Fetch current Claude Code rate limits from Anthropic documentation.
 
-    Uses Perplexity or Context7 MCP to search for current limits.
+    Uses Perplexity or Context7 MCP to search for current limits. When a
+    database is given, results are cached in its limits_cache table for
+    LIMITS_CACHE_TTL_SECONDS.
+
+    Args:
+        db_path: Database holding the limits cache (None disables caching)
+        force_refresh: Skip the cache and fetch from the documentation
 
     Returns:
         Dictionary with hourly_limit and daily_limit, or None if not found
     """
+    if db_path is not None and not force_refresh:
+        cached = await _read_cached_limits(db_path)
+        if cached is not None:
+            return cached
+
+    limits = await _fetch_limits_live()
+
+    if limits and db_path is not None:
+        await _store_limits(db_path, limits)
+
+    return limits
+
+
+async def _fetch_limits_live() -> Optional[Dict[str, int]]:
+    """Query the documentation for the current limits."""
     # This is a placeholder - actual implementation would use MCP
     # In real implementation, you would:
     # 1. Query Perplexity/Context7 via MCP
@@ -28,6 +61,47 @@ async def fetch_current_limits_from_docs() -> Optional[Dict[str, int]]:
     }
 
 
+async def _ensure_cache_table(db: aiosqlite.Connection) -> None:
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS limits_cache (
+            key TEXT PRIMARY KEY,
+            json TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        )
+    """)
+
+
+async def _read_cached_limits(db_path: Path) -> Optional[Dict[str, int]]:
+    """Return the cached limits if they were fetched within the TTL."""
+    async with aiosqlite.connect(db_path) as db:
+        await _ensure_cache_table(db)
+        async with db.execute(
+            "SELECT json, fetched_at FROM limits_cache WHERE key = ?",
+            (LIMITS_CACHE_KEY,)
+        ) as cursor:
+            row = await cursor.fetchone()
+
+    if row is None or time.time() - row[1] >= LIMITS_CACHE_TTL_SECONDS:
+        return None
+    return json.loads(row[0])
+
+
+async def _store_limits(db_path: Path, limits: Dict[str, int]) -> None:
+    """Upsert freshly fetched limits into the cache."""
+    async with aiosqlite.connect(db_path) as db:
+        await _ensure_cache_table(db)
+        await db.execute(
+            """
+            INSERT INTO limits_cache (key, json, fetched_at) VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                json = excluded.json,
+                fetched_at = excluded.fetched_at
+            """,
+            (LIMITS_CACHE_KEY, json.dumps(limits), time.time())
+        )
+        await db.commit()
+
+
 def compare_with_current_config(
     fetched_limits: Dict[str, int],
     current_hourly: int,
@@ -27,7 +27,7 @@ from .tools.technical_analysis import (
 )
 from .tools.sentiment import analyze_market_sentiment, detect_market_events
 from .tools.signals import generate_trading_signal
-from .tools.portfolio import update_portfolio, calculate_pnl
+from .tools.portfolio import update_portfolio, calculate_pnl, close_db as close_portfolio_db
 from .tools.paper_trading_tools import (
     create_paper_portfolio,
     execute_paper_trade,
@@ -43,6 +43,43 @@ from .config import config
 
 load_dotenv()
 
+# Invariant system prompt instructions; the target symbol, timeframes and
+# paper trading details are appended after them (see _build_system_prompt)
+_SYSTEM_PROMPT_PREFIX = """You are an expert cryptocurrency trading analysis agent monitoring a symbol on Bybit.
+
+Your responsibilities:
+1. Fetch market data across multiple timeframes (listed below)
+2. Perform comprehensive technical analysis (RSI, MACD, Bollinger Bands)
+3. Analyze market sentiment using web search for news and events
+4. Generate trading signals (BUY/SELL/HOLD) with confidence scores
+5. Monitor portfolio positions and calculate P&L
+6. Store all analysis and signals in the database
+
+Always:
+- Use multi-timeframe analysis for comprehensive view
+- Combine technical indicators with sentiment analysis
+- Provide clear reasoning for all signals
+- Track historical signals for pattern analysis
+- Alert on stop-loss and take-profit levels
+
+When analyzing:
+1. First fetch current price and recent OHLCV data
+2. Run technical analysis on each timeframe
+3. Query web search for market sentiment and news
+4. Combine all data to generate trading signal
+5. Save signal to database
+6. If position exists, calculate and report P&L
+"""
+
+_PAPER_TRADING_INSTRUCTIONS = """
+Paper Trading Specific:
+- Execute all signals via execute_paper_trade tool
+- Monitor portfolio status with get_paper_portfolio_status
+- Update positions regularly with update_paper_positions
+- Respect circuit breaker status
+- Provide audit reports on request
+"""
+
 class TradingAgent:
     def __init__(self, symbol: str = "BTC/USDT", timeframes: list = None, paper_trading: bool = False, paper_portfolio: str = "default"):
         self.symbol = symbol
@@ -55,6 +92,10 @@ class TradingAgent:
         self.paper_manager = None  # Will be initialized in initialize()
         self.token_tracker: Optional[TokenTracker] = None
 
+        # Agent options (incl. the MCP tools server) built for _options_key
+        self._options: Optional[ClaudeAgentOptions] = None
+        self._options_key: Optional[tuple] = None
+
     async def initialize(self):
         """Initialize database and agent."""
         await init_database(self.db_path)
@@ -86,8 +127,34 @@ class TradingAgent:
             await self.token_tracker.start_session()
             print(f"✅ Token tracking enabled - Session: {self.token_tracker.session_id}")
 
+    def _build_system_prompt(self) -> str:
+        """Static instructions followed by this agent's target details."""
+        prompt = _SYSTEM_PROMPT_PREFIX
+        if self.paper_trading:
+            prompt += _PAPER_TRADING_INSTRUCTIONS
+
+        prompt += f"""
+Target symbol: {self.symbol}
+Timeframes: {', '.join(self.timeframes)}
+"""
+        if self.paper_trading:
+            prompt += f"""
+[PAPER TRADING MODE] All trades are simulated.
+Portfolio: {self.paper_portfolio}
+"""
+        return prompt
+
     def create_agent_options(self) -> ClaudeAgentOptions:
-        """Create Claude Agent SDK configuration."""
+        """
+        Create Claude Agent SDK configuration.
+
+        The options are built once and reused by every analysis; they are
+        rebuilt only when the symbol, timeframes or paper trading settings
+        change.
+        """
+        options_key = (self.symbol, tuple(self.timeframes), self.paper_trading, self.paper_portfolio)
+        if self._options is not None and self._options_key == options_key:
+            return self._options
 
         # Create SDK MCP server with all trading tools
         tools_list = [
@@ -156,42 +223,9 @@ class TradingAgent:
                 ] if self.paper_trading else []
             ),
 
-            # System prompt
-            system_prompt=f"""You are an expert cryptocurrency trading analysis agent monitoring {self.symbol} on Bybit.
-
-{'[PAPER TRADING MODE] All trades are simulated.' if self.paper_trading else ''}
-{f'Portfolio: {self.paper_portfolio}' if self.paper_trading else ''}
-
-Your responsibilities:
-1. Fetch market data across multiple timeframes: {', '.join(self.timeframes)}
-2. Perform comprehensive technical analysis (RSI, MACD, Bollinger Bands)
-3. Analyze market sentiment using web search for news and events
-4. Generate trading signals (BUY/SELL/HOLD) with confidence scores
-5. Monitor portfolio positions and calculate P&L
-6. Store all analysis and signals in the database
-
-Always:
-- Use multi-timeframe analysis for comprehensive view
-- Combine technical indicators with sentiment analysis
-- Provide clear reasoning for all signals
-- Track historical signals for pattern analysis
-- Alert on stop-loss and take-profit levels
-
-When analyzing:
-1. First fetch current price and recent OHLCV data
-2. Run technical analysis on each timeframe
-3. Query web search for market sentiment and news
-4. Combine all data to generate trading signal
-5. Save signal to database
-6. If position exists, calculate and report P&L
-
-{'''Paper Trading Specific:
-- Execute all signals via execute_paper_trade tool
-- Monitor portfolio status with get_paper_portfolio_status
-- Update positions regularly with update_paper_positions
-- Respect circuit breaker status
-- Provide audit reports on request
-''' if self.paper_trading else ''}""",
+            # System prompt: static instructions first so the prompt prefix is
+            # identical across symbols, then the per-agent target details
+            system_prompt=self._build_system_prompt(),
 
             # Model
             model="claude-sonnet-4-5",
@@ -204,6 +238,7 @@ When analyzing:
             include_partial_messages=True,
         )
 
+        self._options, self._options_key = options, options_key
         return options
 
     async def analyze_market(self, query: str = None):
@@ -280,6 +315,10 @@ Provide a comprehensive analysis report."""
 
     async def cleanup(self):
         """Cleanup resources including ending token tracking session."""
+        await close_portfolio_db()
+        await self.db.close()
+        if self.paper_manager:
+            await self.paper_manager.close()
         if self.token_tracker:
             await self.token_tracker.end_session()
             print(f"✅ Token tracking session ended")
@@ -1,4 +1,6 @@
 """Tests for agent output database operations."""
+import asyncio
+import aiosqlite
 import pytest
 import pytest_asyncio
 import tempfile
@@ -37,6 +39,37 @@ async def test_save_agent_output(db_ops):
     assert output_id > 0
 
 
+@pytest.mark.asyncio
+async def test_queued_agent_outputs_written_in_batches(db_ops):
+    """Test queued outputs are written once the batch fills or on flush."""
+    db_ops.OUTPUT_BATCH_SIZE = 2
+
+    def queue(i):
+        db_ops.queue_agent_output(
+            session_id="batch-session",
+            symbol="BTCUSDT",
+            agent_type="analysis",
+            input_json="{}",
+            output_json=f'{{"i": {i}}}',
+            tokens_used=0,
+            duration_ms=i
+        )
+
+    queue(1)
+    queue(2)  # Fills the batch; written without waiting for the timer
+    await asyncio.sleep(0)
+    queue(3)  # Waits for the timer or a flush
+    await asyncio.sleep(0.05)
+    async with aiosqlite.connect(db_ops.db_path) as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM agent_outputs")
+        assert (await cursor.fetchone())[0] == 2
+
+    # Reading a session flushes the queue first
+    outputs = await db_ops.get_agent_outputs_by_session("batch-session")
+    assert sorted(o["duration_ms"] for o in outputs) == [1, 2, 3]
+    assert db_ops._output_timer is None
+
+
 @pytest.mark.asyncio
 async def test_save_risk_decision(db_ops):
     """Test saving risk decision."""
@@ -2,8 +2,12 @@
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from claude_agent_sdk import ClaudeAgentOptions
 from src.agent.scanner.agent_wrapper import AgentWrapper
 
+# Agent options for an agent allowed to call the sentiment tool
+SENTIMENT_OPTIONS = ClaudeAgentOptions(allowed_tools=["mcp__trading__fetch_sentiment_data"])
+
 
 @pytest.mark.asyncio
 async def test_persistent_client_multiple_analyses():
@@ -18,7 +22,7 @@ async def test_persistent_client_multiple_analyses():
 
     # Mock the client and submit_trading_signal
     with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient') as MockClient, \
-         patch('src.agent.scanner.agent_wrapper.set_signal_queue'), \
+         patch('src.agent.scanner.agent_wrapper.set_signal_queue') as mock_set_queue, \
          patch('src.agent.scanner.agent_wrapper.clear_signal_queue'):
 
         # Create mock client
@@ -32,27 +36,24 @@ async def test_persistent_client_multiple_analyses():
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock()
 
-        # Mock signal queue to return test signal
-        with patch('src.agent.scanner.agent_wrapper.asyncio.Queue') as MockQueue:
-            mock_queue = AsyncMock()
-            mock_signal = {
-                'confidence': 80,
-                'symbol': 'TEST/USDT',
-                'entry_price': 100.0,
-                'stop_loss': 95.0,
-                'tp1': 110.0,
-                'technical_score': 0.8,
-                'sentiment_score': 0.7,
-                'liquidity_score': 0.9,
-                'correlation_score': 0.6,
-                'analysis': 'Test analysis'
-            }
-            mock_queue.get = AsyncMock(return_value=mock_signal)
-            MockQueue.return_value = mock_queue
-
-            # Run multiple analyses
-            await wrapper.run("Analysis 1")
-            await wrapper.run("Analysis 2")
+        # Deliver the test signal as soon as the wrapper installs its sink
+        mock_signal = {
+            'confidence': 80,
+            'symbol': 'TEST/USDT',
+            'entry_price': 100.0,
+            'stop_loss': 95.0,
+            'tp1': 110.0,
+            'technical_score': 0.8,
+            'sentiment_score': 0.7,
+            'liquidity_score': 0.9,
+            'correlation_score': 0.6,
+            'analysis': 'Test analysis'
+        }
+        mock_set_queue.side_effect = lambda sink: sink.put_nowait(mock_signal)
+
+        # Run multiple analyses
+        await wrapper.run("Analysis 1")
+        await wrapper.run("Analysis 2")
 
         # Client should be created only once in persistent mode
         assert MockClient.call_count == 1
@@ -70,7 +71,7 @@ async def test_non_persistent_client_creates_new_each_time():
     )
 
     with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient') as MockClient, \
-         patch('src.agent.scanner.agent_wrapper.set_signal_queue'), \
+         patch('src.agent.scanner.agent_wrapper.set_signal_queue') as mock_set_queue, \
          patch('src.agent.scanner.agent_wrapper.clear_signal_queue'):
 
         # Create mock client
@@ -84,26 +85,374 @@ async def test_non_persistent_client_creates_new_each_time():
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock()
 
-        # Mock signal queue to return test signal
-        with patch('src.agent.scanner.agent_wrapper.asyncio.Queue') as MockQueue:
-            mock_queue = AsyncMock()
-            mock_signal = {
-                'confidence': 80,
-                'symbol': 'TEST/USDT',
-                'entry_price': 100.0,
-                'stop_loss': 95.0,
-                'tp1': 110.0,
-                'technical_score': 0.8,
-                'sentiment_score': 0.7,
-                'liquidity_score': 0.9,
-                'correlation_score': 0.6,
-                'analysis': 'Test analysis'
-            }
-            mock_queue.get = AsyncMock(return_value=mock_signal)
-            MockQueue.return_value = mock_queue
-
-            await wrapper.run("Analysis 1")
-            await wrapper.run("Analysis 2")
+        # Deliver the test signal as soon as the wrapper installs its sink
+        mock_signal = {
+            'confidence': 80,
+            'symbol': 'TEST/USDT',
+            'entry_price': 100.0,
+            'stop_loss': 95.0,
+            'tp1': 110.0,
+            'technical_score': 0.8,
+            'sentiment_score': 0.7,
+            'liquidity_score': 0.9,
+            'correlation_score': 0.6,
+            'analysis': 'Test analysis'
+        }
+        mock_set_queue.side_effect = lambda sink: sink.put_nowait(mock_signal)
+
+        await wrapper.run("Analysis 1")
+        await wrapper.run("Analysis 2")
 
         # Client should be created twice in non-persistent mode
         assert MockClient.call_count == 2
+
+
+
+@pytest.mark.asyncio
+async def test_process_messages_dispatches_blocks_by_type(caplog):
+    """Test message blocks are routed to their per-type handlers."""
+    import logging
+    from claude_agent_sdk import AssistantMessage, TextBlock, ToolUseBlock
+
+    wrapper = AgentWrapper(agent_options=MagicMock())
+
+    message = AssistantMessage(
+        content=[
+            TextBlock(text="thinking"),
+            ToolUseBlock(id="t1", name="fetch_technical_snapshot", input={"symbol": "BTCUSDT"}),
+            ToolUseBlock(id="t2", name="fetch_technical_snapshot", input={"symbol": "BTCUSDT"}),
+        ],
+        model="test-model"
+    )
+
+    async def receive_response():
+        yield message
+
+    mock_client = MagicMock()
+    mock_client.receive_response = receive_response
+
+    with caplog.at_level(logging.INFO, logger="src.agent.scanner.agent_wrapper"):
+        await wrapper._process_messages(mock_client)
+
+    assert "Agent reasoning:\nthinking" in caplog.text
+    assert "DUPLICATE #2" in caplog.text
+    assert "fetch_technical_snapshot: 2 calls" in caplog.text
+
+
+def test_message_stream_skipped_without_consumers():
+    """Test the message task is only needed when logging, tracking, sentiment or persistent."""
+    import logging
+
+    quiet_wrapper = AgentWrapper(agent_options=MagicMock())
+    tracked_wrapper = AgentWrapper(agent_options=MagicMock(), token_tracker=MagicMock())
+    sentiment_wrapper = AgentWrapper(agent_options=SENTIMENT_OPTIONS)
+    wrapper_logger = logging.getLogger("src.agent.scanner.agent_wrapper")
+
+    original_level = wrapper_logger.level
+    wrapper_logger.setLevel(logging.WARNING)
+    try:
+        assert quiet_wrapper._needs_message_stream() is False
+        assert tracked_wrapper._needs_message_stream() is True
+        assert sentiment_wrapper._needs_message_stream() is True
+    finally:
+        wrapper_logger.setLevel(original_level)
+
+
+@pytest.mark.asyncio
+async def test_future_sink_keeps_first_signal():
+    """Test the single-shot signal sink resolves once and ignores later signals."""
+    from src.agent.scanner.tools import FutureSink
+
+    future = asyncio.get_running_loop().create_future()
+    sink = FutureSink(future)
+
+    sink.put_nowait({'symbol': 'FIRST'})
+    sink.put_nowait({'symbol': 'SECOND'})
+
+    assert (await future) == {'symbol': 'FIRST'}
+
+
+def test_pretty_dump_matches_indented_json():
+    """Test tool parameters are logged as 2-space indented JSON."""
+    import json
+    from src.agent._json import dumps
+
+    params = {'symbol': 'BTC/USDT', 'timeframes': ['1m', '1h'], 'limit': {'n': 50}}
+
+    assert dumps(params, pretty=True) == json.dumps(params, indent=2)
+
+
+def test_fallback_responses_are_independent_copies():
+    """Test timeout/error responses are fresh dicts built from shared templates."""
+    wrapper = AgentWrapper(agent_options=MagicMock())
+
+    timeout = wrapper._timeout_response()
+    timeout['confidence'] = 99
+
+    assert wrapper._timeout_response()['confidence'] == 0
+    assert wrapper._error_response("boom") == {
+        **wrapper._timeout_response(),
+        'analysis': 'Analysis error: boom'
+    }
+
+
+@pytest.mark.asyncio
+async def test_identical_prompt_reuses_cached_signal():
+    """Test a repeated prompt within the TTL skips the agent and returns a copy."""
+    wrapper = AgentWrapper(agent_options=MagicMock())
+
+    with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient') as MockClient, \
+         patch('src.agent.scanner.agent_wrapper.set_signal_queue') as mock_set_queue, \
+         patch('src.agent.scanner.agent_wrapper.clear_signal_queue'):
+
+        mock_client = AsyncMock()
+        mock_client.session_id = None
+        MockClient.return_value = mock_client
+
+        mock_signal = {'confidence': 80, 'symbol': 'TEST/USDT', 'analysis': 'Test analysis'}
+        mock_set_queue.side_effect = lambda sink: sink.put_nowait(dict(mock_signal))
+
+        first = await wrapper.run("Analyze TEST/USDT")
+        first['confidence'] = 0
+        second = await wrapper.run("Analyze TEST/USDT")
+
+        assert MockClient.call_count == 1
+        assert second == {**mock_signal, 'sentiment_findings': []}
+
+        wrapper.clear_cache()
+        await wrapper.run("Analyze TEST/USDT")
+
+        assert MockClient.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_process_messages_stops_after_signal():
+    """Test the message stream is abandoned once the signal has arrived."""
+    from claude_agent_sdk import AssistantMessage, TextBlock
+
+    wrapper = AgentWrapper(agent_options=MagicMock())
+    signal_future = asyncio.get_running_loop().create_future()
+    seen = []
+
+    async def receive_response():
+        yield AssistantMessage(content=[TextBlock(text="before")], model="test-model")
+        signal_future.set_result({'confidence': 80})
+        yield AssistantMessage(content=[TextBlock(text="after")], model="test-model")
+
+    mock_client = MagicMock()
+    mock_client.receive_response = receive_response
+
+    record_text = lambda self, block, *args: seen.append(block.text)
+    with patch.dict(AgentWrapper._BLOCK_HANDLERS, {TextBlock: record_text}):
+        await wrapper._process_messages(mock_client, signal_future)
+
+    assert seen == ["before"]
+
+
+@pytest.mark.asyncio
+async def test_run_returns_signal_before_response_finishes():
+    """Test the signal is returned as soon as the tool fires, mid-stream."""
+    from claude_agent_sdk import AssistantMessage, TextBlock
+
+    wrapper = AgentWrapper(agent_options=MagicMock(), persistent_client=False)
+    sinks = []
+
+    async def receive_response():
+        yield AssistantMessage(content=[TextBlock(text="analyzing")], model="test-model")
+        # submit_trading_signal runs while the model is still writing its summary
+        sinks[0].put_nowait({'confidence': 70, 'symbol': 'TEST/USDT'})
+        await asyncio.sleep(10)
+        yield AssistantMessage(content=[TextBlock(text="summary")], model="test-model")
+
+    with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient') as MockClient, \
+         patch('src.agent.scanner.agent_wrapper.set_signal_queue', side_effect=sinks.append), \
+         patch('src.agent.scanner.agent_wrapper.clear_signal_queue'), \
+         patch.object(AgentWrapper, '_needs_message_stream', return_value=True):
+
+        mock_client = AsyncMock()
+        mock_client.session_id = None
+        mock_client.receive_response = receive_response
+        MockClient.return_value = mock_client
+
+        signal = await asyncio.wait_for(wrapper.run("Analyze TEST/USDT"), timeout=2)
+
+    assert signal['confidence'] == 70
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_keep_their_own_signal_and_findings():
+    """Test overlapping runs each receive their own signal and sentiment findings."""
+    import json
+    from claude_agent_sdk import AssistantMessage, ToolResultBlock
+    from src.agent.scanner import tools
+
+    wrapper = AgentWrapper(agent_options=SENTIMENT_OPTIONS, result_cache_ttl_seconds=0)
+
+    def make_client(*args, **kwargs):
+        client = AsyncMock()
+        client.session_id = None
+        sink = symbol = None
+
+        async def query(prompt, **kwargs):
+            nonlocal sink, symbol
+            # submit_trading_signal resolves the sink from the run's context
+            sink = tools._signal_queue.get()
+            symbol = prompt.split()[-1]
+
+        async def receive_response():
+            payload = {'success': True, 'sentiment_summary': symbol, 'web_results': []}
+            yield AssistantMessage(
+                content=[ToolResultBlock(tool_use_id="t1", content=json.dumps(payload))],
+                model="test-model"
+            )
+            await asyncio.sleep(0.01)
+            sink.put_nowait({'confidence': 70, 'symbol': symbol})
+
+        client.query = query
+        client.receive_response = receive_response
+        return client
+
+    with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient', side_effect=make_client):
+        first, second = await asyncio.gather(
+            wrapper.run("Analyze A/USDT"), wrapper.run("Analyze B/USDT")
+        )
+
+    assert first['symbol'] == "A/USDT"
+    assert [f['summary'] for f in first['sentiment_findings']] == ["A/USDT"]
+    assert second['symbol'] == "B/USDT"
+    assert [f['summary'] for f in second['sentiment_findings']] == ["B/USDT"]
+
+
+@pytest.mark.asyncio
+async def test_persistent_client_signals_reach_the_current_run():
+    """Test tool calls on the shared client land in the sink of the active run."""
+    import contextvars
+    from src.agent.scanner import tools
+
+    wrapper = AgentWrapper(agent_options=MagicMock(), persistent_client=True)
+    connect_context = None
+
+    async def connect():
+        nonlocal connect_context
+        # The SDK spawns its tool-handling tasks here, in this context
+        connect_context = contextvars.copy_context()
+        return mock_client
+
+    async def no_messages():
+        return
+        yield
+
+    async def query(prompt, **kwargs):
+        submit = lambda: tools._signal_queue.get().put_nowait(
+            {'confidence': 70, 'symbol': prompt}
+        )
+        connect_context.run(submit)
+
+    with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient') as MockClient:
+        mock_client = AsyncMock()
+        mock_client.session_id = None
+        mock_client.__aenter__ = AsyncMock(side_effect=connect)
+        mock_client.query = query
+        mock_client.receive_response = no_messages
+        MockClient.return_value = mock_client
+
+        first = await wrapper.run("A/USDT")
+        second = await wrapper.run("B/USDT")
+
+    assert MockClient.call_count == 1
+    assert first['symbol'] == "A/USDT"
+    assert second['symbol'] == "B/USDT"
+
+
+@pytest.mark.asyncio
+async def test_cached_signal_restores_its_sentiment_findings():
+    """Test a cache hit returns the findings of the run that produced the signal."""
+    import json
+    from claude_agent_sdk import AssistantMessage, ToolResultBlock
+
+    wrapper = AgentWrapper(agent_options=SENTIMENT_OPTIONS)
+    sinks = []
+
+    def make_client(*args, **kwargs):
+        client = AsyncMock()
+        client.session_id = None
+
+        async def receive_response():
+            payload = {'success': True, 'sentiment_summary': 'Bullish', 'web_results': []}
+            yield AssistantMessage(
+                content=[ToolResultBlock(tool_use_id="t1", content=json.dumps(payload))],
+                model="test-model"
+            )
+            sinks[-1].put_nowait({'confidence': 70, 'symbol': 'TEST/USDT'})
+
+        client.receive_response = receive_response
+        return client
+
+    with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient', side_effect=make_client) as MockClient, \
+         patch('src.agent.scanner.agent_wrapper.set_signal_queue', side_effect=sinks.append), \
+         patch('src.agent.scanner.agent_wrapper.clear_signal_queue'):
+        first = await wrapper.run("Analyze TEST/USDT")
+        first['sentiment_findings'].clear()
+        second = await wrapper.run("Analyze TEST/USDT")
+
+    assert MockClient.call_count == 1
+    assert [f['summary'] for f in second['sentiment_findings']] == ['Bullish']
+
+
+@pytest.mark.asyncio
+async def test_run_timeout_stops_stream_reader_and_agent():
+    """Test a caller timeout cancels the message task and interrupts the shared client."""
+    wrapper = AgentWrapper(agent_options=MagicMock(), persistent_client=True)
+
+    async def endless_stream():
+        while True:
+            await asyncio.sleep(0.01)
+            yield MagicMock()
+
+    with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient') as MockClient:
+        mock_client = AsyncMock()
+        mock_client.session_id = None
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.receive_response = endless_stream
+        MockClient.return_value = mock_client
+
+        with pytest.raises(asyncio.TimeoutError):
+            await wrapper.run("Analyze TEST/USDT", timeout=0.05)
+
+    readers = [
+        task for task in asyncio.all_tasks()
+        if task.get_coro().__qualname__ == 'AgentWrapper._process_messages'
+    ]
+    assert readers == []
+    mock_client.interrupt.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_timeout_excludes_time_queued_for_persistent_client():
+    """Test runs waiting for the shared client do not spend their timeout queuing."""
+    wrapper = AgentWrapper(
+        agent_options=MagicMock(), persistent_client=True, result_cache_ttl_seconds=0
+    )
+
+    async def query(prompt, **kwargs):
+        await asyncio.sleep(0.06)
+        wrapper._signal_relay.put_nowait({'confidence': 70, 'symbol': prompt})
+
+    async def no_messages():
+        return
+        yield
+
+    with patch('src.agent.scanner.agent_wrapper.ClaudeSDKClient') as MockClient:
+        mock_client = AsyncMock()
+        mock_client.session_id = None
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.query = query
+        mock_client.receive_response = no_messages
+        MockClient.return_value = mock_client
+
+        # Three runs take ~0.18s in turn; each one alone fits its 0.1s budget
+        results = await asyncio.gather(
+            *(wrapper.run(symbol, timeout=0.1) for symbol in ("A", "B", "C"))
+        )
+
+    assert [r['symbol'] for r in results] == ["A", "B", "C"]
@@ -1,4 +1,7 @@
 """Tests for base agent class."""
+import asyncio
+import json
+import numpy as np
 import pytest
 import pytest_asyncio
 import tempfile
@@ -43,6 +46,7 @@ async def test_base_agent_save_output(db_ops):
         tokens_used=100,
         duration_ms=500
     )
+    await agent.flush()
 
     outputs = await db_ops.get_agent_outputs_by_session("test-session")
     assert len(outputs) == 1
@@ -64,6 +68,7 @@ async def test_base_agent_run_with_tracking(db_ops):
     assert result["result"] == "test"
 
     # Verify output was saved
+    await agent.flush()
     outputs = await db_ops.get_agent_outputs_by_session("test-session-2")
     assert len(outputs) == 1
 
@@ -78,3 +83,55 @@ async def test_base_agent_requires_agent_type():
 
     with pytest.raises(NotImplementedError):
         BadAgent(db_ops=MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_base_agent_save_output_serializes_numpy_values(db_ops):
+    """Test numpy scalars and int keys from upstream agents are saved as JSON."""
+    agent = ConcreteAgent(db_ops=db_ops)
+
+    await agent._save_output(
+        session_id="test-session-3",
+        symbol="BTCUSDT",
+        input_data={"rsi": np.float64(71.5)},
+        output_data={1: {"confidence": np.int64(80)}},
+        tokens_used=0,
+        duration_ms=1
+    )
+    await agent.flush()
+
+    outputs = await db_ops.get_agent_outputs_by_session("test-session-3")
+    assert json.loads(outputs[0]["input_json"]) == {"rsi": 71.5}
+    assert json.loads(outputs[0]["output_json"]) == {"1": {"confidence": 80}}
+
+
+@pytest.mark.asyncio
+async def test_base_agent_run_many_bounds_concurrency(db_ops):
+    """Test run_many keeps order, caps runs in flight and returns failures."""
+    in_flight = 0
+    peak = 0
+
+    class SlowAgent(BaseAgent):
+        agent_type = "slow_agent"
+
+        async def run(self, input_data: dict) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if input_data["i"] == 3:
+                raise ValueError("bad input")
+            return {"i": input_data["i"]}
+
+    agent = SlowAgent(db_ops=db_ops)
+    results = await agent.run_many(
+        [("many-session", "BTCUSDT", {"i": i}) for i in range(6)],
+        max_concurrent=2
+    )
+    await agent.flush()
+
+    assert peak == 2
+    assert [r["i"] for r in results if isinstance(r, dict)] == [0, 1, 2, 4, 5]
+    assert isinstance(results[3], ValueError)
+    assert len(await db_ops.get_agent_outputs_by_session("many-session")) == 5
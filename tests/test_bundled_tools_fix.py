@@ -7,27 +7,20 @@ from src.agent.scanner.tools import fetch_market_data_internal, get_current_pric
 
 @pytest.mark.asyncio
 async def test_fetch_market_data_internal_parses_response_correctly():
-    """Test that fetch_market_data_internal extracts data from correct field."""
-    # Mock response matching actual fetch_market_data format
-    mock_response = {
-        "content": [{
-            "type": "text",
-            "text": "Fetched 10 candles for BTC/USDT (15m)\nLatest price: 89336.80"
-        }],
-        "data": [
-            {
-                "timestamp": "2025-11-19T18:15:00",
-                "open": 89300.0,
-                "high": 89400.0,
-                "low": 89200.0,
-                "close": 89336.80,
-                "volume": 1234.5
-            }
-        ]
-    }
-
-    with patch('src.agent.tools.market_data.fetch_market_data') as mock_tool:
-        mock_tool.handler = AsyncMock(return_value=mock_response)
+    """Test that fetch_market_data_internal returns the raw OHLCV rows."""
+    mock_records = [
+        {
+            "timestamp": "2025-11-19T18:15:00",
+            "open": 89300.0,
+            "high": 89400.0,
+            "low": 89200.0,
+            "close": 89336.80,
+            "volume": 1234.5
+        }
+    ]
+
+    with patch('src.agent.tools.market_data.fetch_ohlcv_records',
+               AsyncMock(return_value=mock_records)) as mock_fetch:
 
         result = await fetch_market_data_internal("BTC/USDT", "15m", 10)
 
@@ -36,6 +29,7 @@ async def test_fetch_market_data_internal_parses_response_correctly():
         assert len(result) > 0
         assert "timestamp" in result[0]
         assert result[0]["close"] == 89336.80
+        mock_fetch.assert_awaited_once_with("BTC/USDT", "15m", 10)
 
 
 @pytest.mark.asyncio
@@ -1,5 +1,10 @@
 import pytest
-from src.agent.scanner.confidence import ConfidenceCalculator
+from src.agent.scanner.confidence import (
+    BBPosition,
+    ConfidenceCalculator,
+    MacdSignal,
+    SentimentClass,
+)
 
 def test_calculate_technical_score():
     """Test technical analysis score calculation."""
@@ -86,3 +91,79 @@ def test_calculate_final_confidence():
 
     assert score == 89
     assert 0 <= score <= 100
+
+    # Out-of-range component sums are clamped
+    assert calculator.calculate_final_confidence(60, 30, 20, 10) == 100
+    assert calculator.calculate_final_confidence(-5, 0, 0, 0) == 0
+
+def test_calculate_technical_score_missing_timeframes():
+    """Test missing timeframes contribute nothing to the technical score."""
+    calculator = ConfidenceCalculator()
+
+    technical_data = {
+        '4h': {'rsi': 50, 'macd_signal': 'bullish_cross', 'bb_position': 'lower', 'volume_ratio': 1.5},
+    }
+
+    assert calculator.calculate_technical_score(technical_data) == pytest.approx(12.0)
+    assert calculator.calculate_technical_score({}) == 0.0
+
+def test_calculate_confidence_matches_component_methods():
+    """Test the fused confidence kernel agrees with the per-component methods."""
+    calculator = ConfidenceCalculator()
+
+    technical_data = {
+        '4h': {'rsi': 55, 'macd_signal': 'bullish_cross', 'bb_position': 'upper', 'volume_ratio': 2.1},
+        '1h': {'rsi': 75, 'macd_signal': 'bearish_cross', 'bb_position': 'middle', 'volume_ratio': 0.8},
+        '5m': {'rsi': 25, 'macd_signal': 'histogram_positive', 'bb_position': 'lower', 'volume_ratio': 1.2},
+    }
+    sentiment_data = {'classification': 'MILD_NEGATIVE'}
+    liquidity_data = {'volume_ratio': 1.6, 'bid_ask_spread_pct': 0.03, 'order_book_depth_usd': 100_000}
+    correlation_data = {'btc_change_1h': -1.0, 'symbol_change_1h': 4.0}
+
+    for direction in ('LONG', 'SHORT'):
+        result = calculator.calculate_confidence(
+            technical_data, sentiment_data, liquidity_data, correlation_data, direction
+        )
+
+        technical = calculator.calculate_technical_score(technical_data)
+        sentiment = calculator.calculate_sentiment_score(sentiment_data, direction)
+        liquidity = calculator.calculate_liquidity_score(liquidity_data)
+        correlation = calculator.calculate_correlation_score(correlation_data)
+
+        assert result['technical'] == pytest.approx(technical)
+        assert result['sentiment'] == sentiment
+        assert result['liquidity'] == liquidity
+        assert result['correlation'] == correlation
+        assert result['confidence'] == calculator.calculate_final_confidence(
+            technical, sentiment, liquidity, correlation
+        )
+
+def test_categorical_enum_codes_match_strings():
+    """Test enum-coded categorical fields score the same as their string forms."""
+    calculator = ConfidenceCalculator()
+
+    as_strings = {'4h': {'rsi': 55, 'macd_signal': 'bearish_cross', 'bb_position': 'lower', 'volume_ratio': 2.0}}
+    as_codes = {'4h': {'rsi': 55, 'macd_signal': MacdSignal.BEARISH_CROSS, 'bb_position': BBPosition.LOWER, 'volume_ratio': 2.0}}
+
+    assert calculator.calculate_technical_score(as_codes) == calculator.calculate_technical_score(as_strings)
+    assert calculator.calculate_sentiment_score(
+        {'classification': SentimentClass.MILD_POSITIVE}, direction='SHORT'
+    ) == calculator.calculate_sentiment_score({'classification': 'MILD_POSITIVE'}, direction='SHORT')
+
+def test_liquidity_and_correlation_bucket_boundaries():
+    """Test bucket lookups at the threshold edges and bonus caps."""
+    calculator = ConfidenceCalculator()
+
+    assert calculator.calculate_liquidity_score({'volume_ratio': 0.99}) == 5
+    assert calculator.calculate_liquidity_score({'volume_ratio': 1.0}) == 10
+    assert calculator.calculate_liquidity_score({'volume_ratio': 1.5}) == 15
+    assert calculator.calculate_liquidity_score({'volume_ratio': 2.0}) == 20
+    assert calculator.calculate_liquidity_score({
+        'volume_ratio': 1.5, 'bid_ask_spread_pct': 0.01, 'order_book_depth_usd': 1_000_000
+    }) == 20
+
+    assert calculator.calculate_correlation_score({'btc_change_1h': -1.0, 'symbol_change_1h': -2.0}) == 3
+    assert calculator.calculate_correlation_score({'btc_change_1h': 0.0, 'symbol_change_1h': 1.0}) == 7
+    assert calculator.calculate_correlation_score({'btc_change_1h': 1.0, 'symbol_change_1h': -1.0}) == 5
+    assert calculator.calculate_correlation_score({'btc_change_1h': 1.0, 'symbol_change_1h': 6.0}) == 10
+    assert calculator.calculate_correlation_score({'btc_change_1h': -2.0, 'symbol_change_1h': 2.0}) == 10
@@ -0,0 +1,83 @@
+"""Tests for the last-value indicator kernels."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.agent.tools._indicator_kernels import (
+    _ema_last,
+    _last_indicators,
+    _macd_last,
+    _rsi_last,
+    warm_kernels,
+)
+
+
+def _ema(close: pd.Series, length: int) -> pd.Series:
+    """pandas_ta's EMA: SMA seed, then ewm(adjust=False)."""
+    close = close.copy()
+    seed = close.iloc[:length].mean()
+    close.iloc[:length - 1] = np.nan
+    close.iloc[length - 1] = seed
+    return close.ewm(span=length, adjust=False).mean()
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(7)
+    return 100 + np.cumsum(rng.normal(0, 1, 200))
+
+
+def test_ema_last_matches_series(closes):
+    """Test the EMA kernel returns the last value of the SMA-seeded EMA."""
+    series = pd.Series(closes)
+
+    for length in (20, 50):
+        assert _ema_last(closes, length) == pytest.approx(_ema(series, length).iloc[-1])
+    assert np.isnan(_ema_last(closes[:10], 20))
+
+
+def test_macd_last_matches_series(closes):
+    """Test MACD and its signal line come out of the single pass."""
+    series = pd.Series(closes)
+    macd = _ema(series, 12) - _ema(series, 26)
+    signal = _ema(macd.iloc[25:], 9)
+
+    macd_val, macd_sig = _macd_last(closes, 12, 26, 9)
+
+    assert macd_val == pytest.approx(macd.iloc[-1])
+    assert macd_sig == pytest.approx(signal.iloc[-1])
+    assert np.isnan(_macd_last(closes[:30], 12, 26, 9)[1])
+
+
+def test_rsi_last_matches_series(closes):
+    """Test the RSI kernel matches Wilder-smoothed gains and losses."""
+    change = pd.Series(closes).diff()
+    gain = change.clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    loss = (-change.clip(upper=0)).ewm(alpha=1 / 14, min_periods=14).mean()
+    expected = (100 * gain / (gain + loss)).iloc[-1]
+
+    assert _rsi_last(closes, 14) == pytest.approx(expected)
+    assert np.isnan(_rsi_last(closes[:14], 14))
+
+
+def test_warm_kernels_leaves_results_unchanged(closes):
+    """Test warming up the kernels does not affect later calls."""
+    before = _rsi_last(closes, 14)
+    warm_kernels()
+    assert _rsi_last(closes, 14) == before
+
+
+def test_last_indicators_matches_single_series_kernels(closes):
+    """Test the batch kernel matches the per-series kernels on padded rows."""
+    lengths = np.array([200, 120, 30], dtype=np.int64)
+    stacked = np.full((3, 200), np.nan)
+    for row, length in zip(stacked, lengths):
+        row[:length] = closes[:length]
+
+    out = _last_indicators(stacked, lengths)
+
+    for row, length in zip(out, lengths):
+        close = closes[:length]
+        expected = [_rsi_last(close, 14), *_macd_last(close, 12, 26, 9),
+                    _ema_last(close, 20), _ema_last(close, 50)]
+        np.testing.assert_allclose(row, expected)
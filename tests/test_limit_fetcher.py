@@ -0,0 +1,50 @@
+"""Tests for the rate limit fetcher cache."""
+import time
+from unittest.mock import AsyncMock, patch
+
+import aiosqlite
+import pytest
+
+from src.agent.tracking import limit_fetcher
+from src.agent.tracking.limit_fetcher import (
+    LIMITS_CACHE_KEY,
+    LIMITS_CACHE_TTL_SECONDS,
+    fetch_current_limits_from_docs,
+)
+
+LIMITS = {'hourly_limit': 500, 'daily_limit': 5000}
+
+
+@pytest.mark.asyncio
+async def test_limits_cached_within_ttl(tmp_path):
+    """Test a second fetch is served from the cache, unless forced."""
+    db_path = tmp_path / 'limits.db'
+    live = AsyncMock(return_value=LIMITS)
+
+    with patch.object(limit_fetcher, '_fetch_limits_live', live):
+        assert await fetch_current_limits_from_docs(db_path) == LIMITS
+        assert await fetch_current_limits_from_docs(db_path) == LIMITS
+        assert live.await_count == 1
+
+        await fetch_current_limits_from_docs(db_path, force_refresh=True)
+        assert live.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_limits_refetched(tmp_path):
+    """Test cached limits older than the TTL are fetched again."""
+    db_path = tmp_path / 'limits.db'
+    live = AsyncMock(return_value=LIMITS)
+
+    with patch.object(limit_fetcher, '_fetch_limits_live', live):
+        await fetch_current_limits_from_docs(db_path)
+
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute(
+                "UPDATE limits_cache SET fetched_at = ? WHERE key = ?",
+                (time.time() - LIMITS_CACHE_TTL_SECONDS - 1, LIMITS_CACHE_KEY)
+            )
+            await db.commit()
+
+        await fetch_current_limits_from_docs(db_path)
+        assert live.await_count == 2
@@ -1,9 +1,22 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.agent.scanner.main_loop import MarketMoversScanner
+from src.agent.scanner.momentum_scanner import Mover
 from src.agent.scanner.config import ScannerConfig
 from src.agent.scanner.risk_config import RiskConfig
 
+
+def _mover(symbol, max_change):
+    return Mover(
+        symbol=symbol,
+        direction='LONG',
+        change_1h=max_change,
+        change_4h=max_change,
+        max_change=max_change,
+        current_price=100.0,
+    )
+
+
 @pytest.mark.asyncio
 async def test_scanner_initialization():
     """Test scanner initializes with dependencies."""
@@ -30,10 +43,11 @@ async def test_scanner_initialization():
 async def test_pre_filter_movers_by_volume():
     """Test pre-filtering movers by volume threshold."""
     mock_exchange = AsyncMock()
-    mock_exchange.fetch_ticker = AsyncMock(side_effect=[
-        {'quoteVolume': 10_000_000},  # BTC - high volume
-        {'quoteVolume': 1_000_000},    # ETH - low volume (below 5M)
-    ])
+    mock_exchange.has = {'fetchTickers': True}
+    mock_exchange.fetch_tickers = AsyncMock(return_value={
+        'BTC/USDT': {'quoteVolume': 10_000_000},  # BTC - high volume
+        'ETH/USDT': {'quoteVolume': 1_000_000},    # ETH - low volume (below 5M)
+    })
 
     scanner = MarketMoversScanner(
         exchange=mock_exchange,
@@ -44,8 +58,8 @@ async def test_pre_filter_movers_by_volume():
 
     movers = {
         'gainers': [
-            {'symbol': 'BTC/USDT', 'max_change': 8.0},
-            {'symbol': 'ETH/USDT', 'max_change': 6.0},
+            _mover('BTC/USDT', 8.0),
+            _mover('ETH/USDT', 6.0),
         ],
         'losers': []
     }
@@ -53,13 +67,44 @@ async def test_pre_filter_movers_by_volume():
     filtered = await scanner.pre_filter_movers(movers)
 
     assert len(filtered) == 1
-    assert filtered[0]['symbol'] == 'BTC/USDT'
+    assert filtered[0].symbol == 'BTC/USDT'
+    mock_exchange.fetch_tickers.assert_awaited_once_with(['BTC/USDT', 'ETH/USDT'])
+    mock_exchange.fetch_ticker.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_pre_filter_movers_without_bulk_tickers():
+    """Test pre-filtering falls back to per-symbol tickers when bulk fetch is unsupported."""
+    mock_exchange = AsyncMock()
+    mock_exchange.has = {'fetchTickers': False}
+    mock_exchange.fetch_ticker = AsyncMock(side_effect=[
+        {'quoteVolume': 1_000_000},
+        {'quoteVolume': 10_000_000},
+    ])
+
+    scanner = MarketMoversScanner(
+        exchange=mock_exchange,
+        agent=AsyncMock(),
+        portfolio=AsyncMock(),
+        db=AsyncMock()
+    )
+
+    movers = {
+        'gainers': [_mover('BTC/USDT', 8.0)],
+        'losers': [_mover('ETH/USDT', 6.0)],
+    }
+
+    filtered = await scanner.pre_filter_movers(movers)
+
+    assert [m.symbol for m in filtered] == ['ETH/USDT']
 
 @pytest.mark.asyncio
 async def test_scanner_respects_max_movers_limit():
     """Test scanner limits to max_movers_per_scan."""
     mock_exchange = AsyncMock()
-    mock_exchange.fetch_ticker = AsyncMock(return_value={'quoteVolume': 10_000_000})
+    mock_exchange.has = {'fetchTickers': True}
+    mock_exchange.fetch_tickers = AsyncMock(return_value={
+        f'SYM{i}/USDT': {'quoteVolume': 10_000_000} for i in range(5)
+    })
 
     scanner = MarketMoversScanner(
         exchange=mock_exchange,
@@ -72,7 +117,7 @@ async def test_scanner_respects_max_movers_limit():
     # Create 5 movers
     movers = {
         'gainers': [
-            {'symbol': f'SYM{i}/USDT', 'max_change': 10 - i}
+            _mover(f'SYM{i}/USDT', 10 - i)
             for i in range(5)
         ],
         'losers': []
@@ -82,8 +127,8 @@ async def test_scanner_respects_max_movers_limit():
 
     assert len(filtered) == 2
     # Should take highest % change
-    assert filtered[0]['max_change'] == 10
-    assert filtered[1]['max_change'] == 9
+    assert filtered[0].max_change == 10
+    assert filtered[1].max_change == 9
 
 @pytest.mark.asyncio
 async def test_scan_cycle_with_no_movers():
@@ -120,7 +165,8 @@ async def test_scan_cycle_with_no_movers():
 async def test_scan_cycle_with_low_confidence_signal():
     """Test scan cycle rejects signals with confidence < 60."""
     mock_exchange = AsyncMock()
-    mock_exchange.fetch_ticker = AsyncMock(return_value={'quoteVolume': 10_000_000})
+    mock_exchange.has = {'fetchTickers': True}
+    mock_exchange.fetch_tickers = AsyncMock(return_value={'BTC/USDT': {'quoteVolume': 10_000_000}})
 
     # Agent returns low confidence signal
     mock_agent = AsyncMock()
@@ -129,7 +175,6 @@ async def test_scan_cycle_with_low_confidence_signal():
         'symbol': 'BTC/USDT',
         'direction': 'LONG',
     })
-    mock_agent.get_sentiment_findings = MagicMock(return_value=[])
 
     mock_portfolio = AsyncMock()
     mock_portfolio.count_open_positions = MagicMock(return_value=0)
@@ -147,14 +192,14 @@ async def test_scan_cycle_with_low_confidence_signal():
     # Mock momentum scanner to return one mover
     scanner.momentum_scanner.scan_all_symbols = AsyncMock(return_value={
         'gainers': [
-            {
-                'symbol': 'BTC/USDT',
-                'change_1h': 6.5,
-                'change_4h': 5.2,
-                'max_change': 6.5,
-                'direction': 'LONG',
-                'current_price': 50000.0,
-            }
+            Mover(
+                symbol='BTC/USDT',
+                direction='LONG',
+                change_1h=6.5,
+                change_4h=5.2,
+                max_change=6.5,
+                current_price=50000.0,
+            )
         ],
         'losers': []
     })
@@ -164,7 +209,7 @@ async def test_scan_cycle_with_low_confidence_signal():
     # Should call agent
     assert mock_agent.run.called
     # Should save rejection (low confidence)
-    mock_db.save_mover_rejection.assert_called_once()
+    mock_db.save_mover_rejections_many.assert_awaited_once()
     # Should not execute trade
     mock_portfolio.execute_paper_trade.assert_not_called()
 
@@ -172,7 +217,8 @@ async def test_scan_cycle_with_low_confidence_signal():
 async def test_scan_cycle_executes_high_confidence_signal():
     """Test scan cycle executes signal with confidence >= 60."""
     mock_exchange = AsyncMock()
-    mock_exchange.fetch_ticker = AsyncMock(return_value={'quoteVolume': 10_000_000})
+    mock_exchange.has = {'fetchTickers': True}
+    mock_exchange.fetch_tickers = AsyncMock(return_value={'BTC/USDT': {'quoteVolume': 10_000_000}})
 
     # Agent returns high confidence signal
     mock_agent = AsyncMock()
@@ -189,7 +235,6 @@ async def test_scan_cycle_executes_high_confidence_signal():
         'correlation_score': 7.0,
         'analysis': 'Strong bullish setup',
     })
-    mock_agent.get_sentiment_findings = MagicMock(return_value=[])
 
     mock_portfolio = AsyncMock()
     mock_portfolio.count_open_positions = MagicMock(return_value=0)
@@ -197,7 +242,7 @@ async def test_scan_cycle_executes_high_confidence_signal():
     mock_portfolio.calculate_exposure_pct = MagicMock(return_value=0.0)
 
     mock_db = AsyncMock()
-    mock_db.save_mover_signal = AsyncMock(return_value=123)  # signal_id
+    mock_db.save_mover_signals_many = AsyncMock(return_value=[123])  # signal_ids
 
     scanner = MarketMoversScanner(
         exchange=mock_exchange,
@@ -209,14 +254,14 @@ async def test_scan_cycle_executes_high_confidence_signal():
     # Mock momentum scanner to return one mover
     scanner.momentum_scanner.scan_all_symbols = AsyncMock(return_value={
         'gainers': [
-            {
-                'symbol': 'BTC/USDT',
-                'change_1h': 6.5,
-                'change_4h': 5.2,
-                'max_change': 6.5,
-                'direction': 'LONG',
-                'current_price': 50000.0,
-            }
+            Mover(
+                symbol='BTC/USDT',
+                direction='LONG',
+                change_1h=6.5,
+                change_4h=5.2,
+                max_change=6.5,
+                current_price=50000.0,
+            )
         ],
         'losers': []
     })
@@ -238,8 +283,10 @@ async def test_scan_cycle_executes_high_confidence_signal():
 
     # Should call agent
     assert mock_agent.run.called
-    # Should save signal
-    assert mock_db.save_mover_signal.called
+    # Should save signal in the end-of-cycle batch
+    mock_db.save_mover_signals_many.assert_awaited_once()
+    assert mock_db.save_mover_signals_many.await_args.args[0][0]['symbol'] == 'BTC/USDT'
+    assert scanner._pending_signals == []
     # Should execute trade
     assert mock_portfolio.execute_signal.called
     # Should save metrics
@@ -249,7 +296,8 @@ async def test_scan_cycle_executes_high_confidence_signal():
 async def test_scan_cycle_rejects_signal_failing_risk_check():
     """Test scan cycle rejects signal that fails risk validation."""
     mock_exchange = AsyncMock()
-    mock_exchange.fetch_ticker = AsyncMock(return_value={'quoteVolume': 10_000_000})
+    mock_exchange.has = {'fetchTickers': True}
+    mock_exchange.fetch_tickers = AsyncMock(return_value={'BTC/USDT': {'quoteVolume': 10_000_000}})
 
     # Agent returns high confidence signal
     mock_agent = AsyncMock()
@@ -261,10 +309,9 @@ async def test_scan_cycle_rejects_signal_failing_risk_check():
         'stop_loss': 48000.0,
         'tp1': 54000.0,
     })
-    mock_agent.get_sentiment_findings = MagicMock(return_value=[])
 
     mock_portfolio = AsyncMock()
-    mock_portfolio.count_open_positions = MagicMock(return_value=5)  # At max
+    mock_portfolio.count_open_positions = MagicMock(return_value=4)  # One slot left
     mock_portfolio.get_total_value = MagicMock(return_value=10000.0)
     mock_portfolio.calculate_exposure_pct = MagicMock(return_value=0.0)
     mock_db = AsyncMock()
@@ -279,14 +326,14 @@ async def test_scan_cycle_rejects_signal_failing_risk_check():
     # Mock momentum scanner
     scanner.momentum_scanner.scan_all_symbols = AsyncMock(return_value={
         'gainers': [
-            {
-                'symbol': 'BTC/USDT',
-                'change_1h': 6.5,
-                'change_4h': 5.2,
-                'max_change': 6.5,
-                'direction': 'LONG',
-                'current_price': 50000.0,
-            }
+            Mover(
+                symbol='BTC/USDT',
+                direction='LONG',
+                change_1h=6.5,
+                change_4h=5.2,
+                max_change=6.5,
+                current_price=50000.0,
+            )
         ],
         'losers': []
     })
@@ -302,6 +349,149 @@ async def test_scan_cycle_rejects_signal_failing_risk_check():
     # Should call agent
     assert mock_agent.run.called
     # Should save rejection
-    mock_db.save_mover_rejection.assert_called_once()
+    mock_db.save_mover_rejections_many.assert_awaited_once()
     # Should not execute trade
     mock_portfolio.execute_paper_trade.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_scan_cycle_analyzes_movers_concurrently():
+    """Test agent analyses overlap up to max_concurrent_analyses."""
+    import asyncio
+
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def slow_run(prompt, symbol=None, timeout=None):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {'confidence': 10}
+
+    mock_exchange = AsyncMock()
+    mock_exchange.has = {'fetchTickers': True}
+    mock_exchange.fetch_tickers = AsyncMock(return_value={
+        f'SYM{i}/USDT': {'quoteVolume': 10_000_000} for i in range(3)
+    })
+
+    mock_agent = AsyncMock()
+    mock_agent.run = AsyncMock(side_effect=slow_run)
+
+    mock_portfolio = AsyncMock()
+    mock_portfolio.count_open_positions = MagicMock(return_value=0)
+    mock_portfolio.get_total_value = MagicMock(return_value=10000.0)
+    mock_portfolio.calculate_exposure_pct = MagicMock(return_value=0.0)
+
+    scanner = MarketMoversScanner(
+        exchange=mock_exchange,
+        agent=mock_agent,
+        portfolio=mock_portfolio,
+        db=AsyncMock(),
+        config=ScannerConfig(max_concurrent_analyses=2)
+    )
+    scanner.momentum_scanner.scan_all_symbols = AsyncMock(return_value={
+        'gainers': [
+            Mover(
+                symbol=f'SYM{i}/USDT',
+                direction='LONG',
+                change_1h=6.0,
+                change_4h=5.0,
+                max_change=6.0,
+                current_price=100.0,
+            )
+            for i in range(3)
+        ],
+        'losers': []
+    })
+
+    await scanner.scan_cycle()
+
+    assert mock_agent.run.await_count == 3
+    assert peak_in_flight == 2
+    # Portfolio context is fetched once per cycle, not per mover
+    assert mock_portfolio.count_open_positions.call_count == 1
+
+@pytest.mark.asyncio
+async def test_scan_cycle_skips_agent_when_portfolio_saturated():
+    """Test no agent analysis runs once the position limit is reached."""
+    mock_exchange = AsyncMock()
+    mock_exchange.has = {'fetchTickers': True}
+    mock_exchange.fetch_tickers = AsyncMock(return_value={'BTC/USDT': {'quoteVolume': 10_000_000}})
+
+    mock_agent = AsyncMock()
+    mock_portfolio = AsyncMock()
+    mock_portfolio.count_open_positions = MagicMock(return_value=5)  # At max
+    mock_portfolio.get_total_value = MagicMock(return_value=10000.0)
+    mock_portfolio.calculate_exposure_pct = MagicMock(return_value=10.0)
+    mock_db = AsyncMock()
+
+    scanner = MarketMoversScanner(
+        exchange=mock_exchange,
+        agent=mock_agent,
+        portfolio=mock_portfolio,
+        db=mock_db
+    )
+    scanner.momentum_scanner.scan_all_symbols = AsyncMock(return_value={
+        'gainers': [_mover('BTC/USDT', 6.5)],
+        'losers': []
+    })
+
+    await scanner.scan_cycle()
+
+    mock_agent.run.assert_not_called()
+    assert mock_db.save_movers_metrics.called
+
+@pytest.mark.asyncio
+async def test_symbol_refresher_swaps_symbol_list():
+    """Test the background refresher rebuilds the scanned symbol list."""
+    import asyncio
+
+    scanner = MarketMoversScanner(
+        exchange=AsyncMock(),
+        agent=AsyncMock(),
+        portfolio=AsyncMock(),
+        db=AsyncMock(),
+        config=ScannerConfig(symbol_refresh_interval_seconds=0)
+    )
+
+    async def refresh_symbols():
+        scanner.symbol_manager.symbols = {'BTC/USDT': {}, 'ETH/USDT': {}}
+
+    scanner.symbol_manager.refresh_symbols = AsyncMock(side_effect=refresh_symbols)
+
+    task = asyncio.create_task(scanner._symbol_refresher())
+    for _ in range(5):
+        await asyncio.sleep(0)
+    task.cancel()
+
+    assert scanner._symbols_list == ['BTC/USDT', 'ETH/USDT']
+    assert scanner.symbol_manager.refresh_symbols.await_count >= 1
+
+@pytest.mark.asyncio
+async def test_agent_call_times_out():
+    """Test a hung agent call is abandoned after agent_timeout_seconds."""
+    import asyncio
+
+    async def hung_run(prompt, symbol=None, timeout=None):
+        await asyncio.wait_for(asyncio.sleep(10), timeout)
+
+    mock_agent = AsyncMock()
+    mock_agent.run = AsyncMock(side_effect=hung_run)
+
+    scanner = MarketMoversScanner(
+        exchange=AsyncMock(),
+        agent=mock_agent,
+        portfolio=AsyncMock(),
+        db=AsyncMock(),
+        config=ScannerConfig(agent_timeout_seconds=0.01)
+    )
+
+    signal, findings, analysis = await scanner._analyze_mover_with_agent(
+        _mover('BTC/USDT', 6.5),
+        {'total_value': 10000.0, 'open_positions': 0, 'exposure_pct': 0.0}
+    )
+
+    assert signal is None
+    assert scanner.agent_timeouts == 1
+    assert mock_agent.run.await_args.kwargs['timeout'] == 0.01
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock
-from src.agent.scanner.momentum_scanner import MomentumScanner
+from src.agent.scanner.momentum_scanner import MomentumScanner, Mover
 
 @pytest.mark.asyncio
 async def test_scan_for_movers_identifies_gainers():
@@ -19,10 +19,10 @@ async def test_scan_for_movers_identifies_gainers():
     movers = await scanner.scan_symbol('BTC/USDT')
 
     assert movers is not None
-    assert movers['symbol'] == 'BTC/USDT'
-    assert movers['direction'] == 'LONG'
-    assert movers['max_change'] >= 5.0
-    assert movers['change_1h'] == pytest.approx(6.0, abs=0.1)
+    assert movers.symbol == 'BTC/USDT'
+    assert movers.direction == 'LONG'
+    assert movers.max_change >= 5.0
+    assert movers.change_1h == pytest.approx(6.0, abs=0.1)
 
 @pytest.mark.asyncio
 async def test_scan_for_movers_identifies_losers():
@@ -41,8 +41,8 @@ async def test_scan_for_movers_identifies_losers():
     movers = await scanner.scan_symbol('ETH/USDT')
 
     assert movers is not None
-    assert movers['direction'] == 'SHORT'
-    assert movers['max_change'] >= 5.0
+    assert movers.direction == 'SHORT'
+    assert movers.max_change >= 5.0
 
 @pytest.mark.asyncio
 async def test_scan_for_movers_filters_below_threshold():
@@ -81,12 +81,8 @@ async def test_scan_all_symbols():
         ],
     }
 
-    call_count = 0
     async def fetch_ohlcv_side_effect(symbol, timeframe, limit):
-        nonlocal call_count
-        result = responses[symbol][call_count % 2]
-        call_count += 1
-        return result
+        return responses[symbol][0 if timeframe == '1h' else 1]
 
     mock_exchange.fetch_ohlcv = AsyncMock(side_effect=fetch_ohlcv_side_effect)
 
@@ -94,5 +90,137 @@ async def test_scan_all_symbols():
     movers = await scanner.scan_all_symbols(['BTC/USDT', 'ETH/USDT'])
 
     assert len(movers['gainers']) == 1
-    assert movers['gainers'][0]['symbol'] == 'BTC/USDT'
+    assert movers['gainers'][0].symbol == 'BTC/USDT'
     assert len(movers['losers']) == 0
+
+@pytest.mark.asyncio
+async def test_scan_all_symbols_vectorized_changes():
+    """Test batch scan computes changes per symbol and skips failed fetches."""
+    mock_exchange = AsyncMock()
+
+    closes = {
+        ('BTC/USDT', '1h'): (100, 106),  # +6% -> gainer
+        ('BTC/USDT', '4h'): (100, 104),
+        ('ETH/USDT', '1h'): (100, 99),   # -1% 1h, -8% 4h -> loser
+        ('ETH/USDT', '4h'): (100, 92),
+        ('SOL/USDT', '1h'): (100, 101),  # below threshold
+        ('SOL/USDT', '4h'): (100, 102),
+    }
+
+    async def fetch_ohlcv_side_effect(symbol, timeframe, limit):
+        if symbol == 'BAD/USDT':
+            raise RuntimeError("exchange error")
+        prev, last = closes[(symbol, timeframe)]
+        return [[0, 0, 0, 0, prev, 0], [0, 0, 0, 0, last, 0]]
+
+    mock_exchange.fetch_ohlcv = AsyncMock(side_effect=fetch_ohlcv_side_effect)
+
+    scanner = MomentumScanner(mock_exchange, threshold_pct=5.0, batch_size=2)
+    movers = await scanner.scan_all_symbols(['BTC/USDT', 'BAD/USDT', 'ETH/USDT', 'SOL/USDT'])
+
+    assert [m.symbol for m in movers['gainers']] == ['BTC/USDT']
+    assert [m.symbol for m in movers['losers']] == ['ETH/USDT']
+
+    loser = movers['losers'][0]
+    assert loser.direction == 'SHORT'
+    assert loser.change_4h == pytest.approx(-8.0)
+    assert loser.max_change == pytest.approx(8.0)
+    assert loser.current_price == 99
+
+def test_mover_to_dict():
+    """Test Mover converts to a plain dict for prompts and persistence."""
+    mover = Mover(
+        symbol='BTC/USDT',
+        direction='LONG',
+        change_1h=6.0,
+        change_4h=4.0,
+        max_change=6.0,
+        current_price=106.0,
+    )
+
+    assert not hasattr(mover, '__dict__')
+    assert mover.to_dict() == {
+        'symbol': 'BTC/USDT',
+        'direction': 'LONG',
+        'change_1h': 6.0,
+        'change_4h': 4.0,
+        'max_change': 6.0,
+        'current_price': 106.0,
+        'volume_24h': 0.0,
+    }
+
+@pytest.mark.asyncio
+async def test_streamed_candles_replace_rest_fetches():
+    """Test scans read WebSocket-fed candles and streams reconnect after errors."""
+    import asyncio
+
+    mock_exchange = AsyncMock()
+    mock_exchange.has = {'watchOHLCV': True}
+    mock_exchange.fetch_ohlcv = AsyncMock(
+        return_value=[[1, 0, 0, 0, 100, 0], [2, 0, 0, 0, 101, 0]]
+    )
+
+    pushes = {'1h': [RuntimeError("socket closed"), [[2, 0, 0, 0, 103, 0]], [[3, 0, 0, 0, 107, 0]]]}
+    idle = asyncio.Event()
+
+    async def watch_ohlcv(symbol, timeframe, limit):
+        queue = pushes.get(timeframe)
+        if not queue:
+            await idle.wait()  # No more updates
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    mock_exchange.watch_ohlcv = AsyncMock(side_effect=watch_ohlcv)
+
+    scanner = MomentumScanner(mock_exchange, threshold_pct=5.0)
+    scanner.STREAM_RECONNECT_BASE_SECONDS = 0
+    assert scanner.supports_streaming
+
+    scanner.start_streams(['BTC/USDT'])
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    rest_calls = mock_exchange.fetch_ohlcv.await_count
+    mover = await scanner.scan_symbol('BTC/USDT')
+
+    # 1h buffer: candle 2 updated to 103, then candle 3 at 107 -> +3.9%
+    assert mover is None
+    assert list(scanner._streamed_ohlcv[('BTC/USDT', '1h')]) == [
+        [2, 0, 0, 0, 103, 0], [3, 0, 0, 0, 107, 0]
+    ]
+    assert mock_exchange.fetch_ohlcv.await_count == rest_calls
+
+    await scanner.stop_streams()
+    assert scanner._stream_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_prune_streams_stops_dropped_symbols():
+    """Test streams and buffers for symbols removed from the list are dropped."""
+    import asyncio
+
+    mock_exchange = AsyncMock()
+    mock_exchange.has = {'watchOHLCV': True}
+    mock_exchange.fetch_ohlcv = AsyncMock(return_value=[[1, 0, 0, 0, 100, 0]])
+    idle = asyncio.Event()
+
+    async def watch_ohlcv(symbol, timeframe, limit):
+        await idle.wait()
+
+    mock_exchange.watch_ohlcv = AsyncMock(side_effect=watch_ohlcv)
+
+    scanner = MomentumScanner(mock_exchange, threshold_pct=5.0)
+    scanner.start_streams(['BTC/USDT', 'ETH/USDT'])
+    for _ in range(5):
+        await asyncio.sleep(0)
+    dropped_tasks = [t for (s, _), t in scanner._stream_tasks.items() if s == 'ETH/USDT']
+
+    await scanner.prune_streams(['BTC/USDT'])
+
+    assert {s for s, _ in scanner._stream_tasks} == {'BTC/USDT'}
+    assert {s for s, _ in scanner._streamed_ohlcv} == {'BTC/USDT'}
+    assert all(t.cancelled() for t in dropped_tasks)
+
+    await scanner.stop_streams()
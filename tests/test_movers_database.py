@@ -83,3 +83,45 @@ async def test_save_mover_rejection(tmp_path):
     assert len(rejections) == 1
     assert rejections[0]['symbol'] == 'ETHUSDT'
     assert 'threshold' in rejections[0]['reason']
+
+@pytest.mark.asyncio
+async def test_save_mover_signals_and_rejections_many(tmp_path):
+    """Test bulk saving of mover signals and rejections."""
+    db_path = tmp_path / "test.db"
+
+    async with aiosqlite.connect(db_path) as db:
+        await create_movers_tables(db)
+        await db.commit()
+
+    db_ops = PaperTradingDatabase(db_path)
+
+    signals = [
+        {
+            'symbol': symbol,
+            'direction': 'LONG',
+            'confidence': 70 + i,
+            'entry_price': 100.0,
+            'stop_loss': 98.0,
+            'tp1': 103.0,
+            'position_size_usd': 200,
+            'risk_amount_usd': 4,
+            'analysis': 'Momentum breakout',
+        }
+        for i, symbol in enumerate(['BTCUSDT', 'ETHUSDT'])
+    ]
+    signal_ids = await db_ops.save_mover_signals_many(signals)
+
+    assert len(signal_ids) == 2
+    second = await db_ops.get_mover_signal(signal_ids[1])
+    assert second['symbol'] == 'ETHUSDT'
+    assert second['confidence'] == 71
+
+    await db_ops.save_mover_rejections_many([
+        {'symbol': 'SOLUSDT', 'direction': 'SHORT', 'confidence': 50, 'reason': 'LOW_CONFIDENCE'},
+        {'symbol': 'XRPUSDT', 'direction': 'LONG', 'confidence': 65, 'reason': 'MAX_POSITIONS',
+         'details': {'open_positions': 5}},
+    ])
+
+    rejections = await db_ops.get_recent_rejections(limit=10)
+    assert {r['symbol'] for r in rejections} == {'SOLUSDT', 'XRPUSDT'}
+    assert await db_ops.save_mover_signals_many([]) == []
@@ -7,9 +7,9 @@ import os
 import tempfile
 
 from src.agent.database.paper_schema import init_paper_trading_db
-from src.agent.database.paper_operations import PaperTradingDatabase
+from src.agent.database.paper_operations import PaperTradingDatabase, PositionRiskView
 from src.agent.paper_trading.portfolio_manager import PaperPortfolioManager
-from src.agent.paper_trading.risk_manager import TradeProposal
+from src.agent.paper_trading.risk_manager import RiskLimits, RiskManager, TradeProposal, _total_exposure
 
 @pytest_asyncio.fixture
 async def test_db():
@@ -182,6 +182,319 @@ async def test_execution_modes(test_db):
     # In instant mode, slippage should be 0
     assert result['execution_details']['slippage_pct'] == 0.0
 
+@pytest.mark.asyncio
+async def test_iter_execution_quality(test_db):
+    """Test execution quality rows are streamed with LIMIT and a narrow projection."""
+    db = PaperTradingDatabase(test_db)
+    portfolio_id = await db.create_portfolio(name="test_exec_quality")
+
+    for i in range(5):
+        await db.record_trade(
+            portfolio_id=portfolio_id,
+            symbol=f"SYM{i}/USDT",
+            trade_type="OPEN_LONG",
+            price=100.0 + i,
+            quantity=1.0,
+            execution_mode="realistic",
+            slippage_pct=0.05,
+            actual_fill_price=100.0 + i,
+            notes="not projected"
+        )
+
+    rows = [row async for row in db.iter_execution_quality(portfolio_id, limit=3)]
+
+    assert len(rows) == 3
+    assert set(rows[0]) == {
+        'executed_at', 'symbol', 'trade_type', 'signal_price',
+        'actual_fill_price', 'slippage_pct', 'execution_mode'
+    }
+
+@pytest.mark.asyncio
+async def test_risk_violation_counts(test_db):
+    """Test total and critical violation counts come from one aggregate query."""
+    db = PaperTradingDatabase(test_db)
+    portfolio_id = await db.create_portfolio(name="test_violation_counts")
+
+    for severity in ("CRITICAL", "WARNING", "CRITICAL"):
+        await db.log_risk_event(
+            portfolio_id=portfolio_id,
+            event_type="PRE_TRADE_BLOCK",
+            severity=severity,
+            rule_type="EXPOSURE",
+            rule_limit=80.0,
+            current_value=90.0
+        )
+
+    counts = await db.get_risk_violation_counts(portfolio_id, hours=24)
+    assert counts == {'total': 3, 'critical': 2}
+
+    assert await db.count_risk_violations(portfolio_id, hours=24, severity="CRITICAL") == 2
+    assert await db.count_risk_violations(portfolio_id, hours=24) == 3
+
+    limited = await db.get_risk_violations(portfolio_id, hours=24, limit=2)
+    assert len(limited) == 2
+
+@pytest.mark.asyncio
+async def test_validate_trade_fetches_portfolio_once(test_db):
+    """Test validate_trade reuses one portfolio fetch across all limit checks."""
+    manager = PaperPortfolioManager(test_db, "test_portfolio_cache")
+    await manager.initialize()
+    risk_manager = manager.risk_manager
+
+    calls = 0
+    original_get_portfolio = risk_manager.db.get_portfolio
+
+    async def counting_get_portfolio(portfolio_id):
+        nonlocal calls
+        calls += 1
+        return await original_get_portfolio(portfolio_id)
+
+    risk_manager.db.get_portfolio = counting_get_portfolio
+    risk_manager.invalidate_portfolio_cache()
+
+    trade = TradeProposal(
+        symbol="BTC/USDT",
+        side="BUY",
+        quantity=0.01,
+        price=90000.0,
+        position_type="LONG"
+    )
+    is_valid, violations = await risk_manager.validate_trade(trade)
+
+    assert is_valid == True
+    assert calls == 1
+
+def test_evaluate_all_limits_single_pass():
+    """Test fused limit evaluation reports every violated rule in order."""
+    risk_manager = RiskManager(db=None, portfolio_id=1)
+    risk_manager.limits = RiskLimits(max_position_size_pct=5.0, max_drawdown_pct=10.0)
+    assert risk_manager.limits.max_position_size_frac == 0.05
+    assert risk_manager.limits.drawdown_warning_frac == pytest.approx(0.08)
+    with pytest.raises(AttributeError):
+        risk_manager.limits.max_drawdown_pct = 50.0
+
+    portfolio = {
+        'current_equity': 80000.0,
+        'starting_capital': 100000.0,
+        'peak_equity': 100000.0,
+    }
+    positions = [PositionRiskView("ETH/USDT", 1.0, 60000.0, None, None, "LONG")]
+    trade = TradeProposal(
+        symbol="BTC/USDT",
+        side="BUY",
+        quantity=1.0,
+        price=10000.0,
+        position_type="LONG"
+    )
+
+    violations = risk_manager._evaluate_all_limits(trade, portfolio, positions)
+
+    assert len(violations) == 4
+    assert violations[0].startswith("Position size")
+    assert violations[1].startswith("Total exposure")
+    assert violations[2].startswith("Daily loss")
+    assert violations[3].startswith("Drawdown")
+
+@pytest.mark.asyncio
+async def test_monitor_positions_stop_loss_and_take_profit(test_db):
+    """Test vectorized monitoring flags only positions whose levels were hit."""
+    manager = PaperPortfolioManager(test_db, "test_monitor")
+    await manager.initialize()
+    db = manager.db
+
+    sl_id = await db.open_position(manager.portfolio_id, "SL/USDT", "LONG", 100.0, 1.0, stop_loss=95.0, take_profit=110.0)
+    tp_id = await db.open_position(manager.portfolio_id, "TP/USDT", "LONG", 100.0, 1.0, stop_loss=95.0, take_profit=110.0)
+    await db.open_position(manager.portfolio_id, "NONE/USDT", "LONG", 100.0, 1.0)
+    await db.update_position_price(sl_id, 94.0, -6.0)
+    await db.update_position_price(tp_id, 111.0, 11.0)
+
+    alerts = await manager.risk_manager.monitor_positions()
+
+    hits = {(a['type'], a['symbol']) for a in alerts if 'symbol' in a}
+    assert hits == {("STOP_LOSS_HIT", "SL/USDT"), ("TAKE_PROFIT_HIT", "TP/USDT")}
+
+@pytest.mark.asyncio
+async def test_risk_event_batch_and_atomic_circuit_breaker(test_db):
+    """Test batched risk logging and the single-transaction circuit breaker."""
+    db = PaperTradingDatabase(test_db)
+    portfolio_id = await db.create_portfolio(name="test_batch_log")
+
+    await db.log_risk_events_batch(portfolio_id, [
+        ("PRE_TRADE_BLOCK", "CRITICAL", "MULTIPLE", 0, 0, "BTC/USDT", None, "first"),
+        ("PRE_TRADE_BLOCK", "CRITICAL", "MULTIPLE", 0, 0, "BTC/USDT", None, "second"),
+    ])
+    await db.trigger_circuit_breaker_atomic(portfolio_id, "test reason")
+
+    portfolio = await db.get_portfolio(portfolio_id)
+    assert portfolio['circuit_breaker_active'] == 1
+
+    violations = await db.get_risk_violations(portfolio_id, hours=24)
+    messages = {v['message'] for v in violations}
+    assert messages == {"first", "second", "Circuit breaker triggered: test reason"}
+
+@pytest.mark.asyncio
+async def test_blocked_trade_events_logged_in_background(test_db):
+    """Test pre-trade blocks are queued and persisted by the log consumer."""
+    manager = PaperPortfolioManager(test_db, "test_background_log")
+    await manager.initialize()
+
+    trade = TradeProposal(
+        symbol="BTC/USDT",
+        side="BUY",
+        quantity=10.0,
+        price=90000.0,
+        position_type="LONG"
+    )
+    is_valid, violations = await manager.risk_manager.validate_trade(trade)
+    assert is_valid == False
+
+    await manager.close()
+
+    logged = await manager.db.get_risk_violations(manager.portfolio_id, hours=24)
+    assert sorted(v['message'] for v in logged) == sorted(violations)
+
+@pytest.mark.asyncio
+async def test_risk_snapshot_shared_across_hooks(test_db):
+    """Test risk hooks reuse a snapshot instead of re-reading positions."""
+    manager = PaperPortfolioManager(test_db, "test_snapshot")
+    await manager.initialize()
+    risk_manager = manager.risk_manager
+
+    snap = await risk_manager.snapshot()
+    assert snap.portfolio['name'] == "test_snapshot"
+    assert snap.positions == []
+
+    async def fail_get_open_positions(portfolio_id):
+        raise AssertionError("positions should come from the snapshot")
+
+    risk_manager.db.get_open_positions_risk_view = fail_get_open_positions
+
+    trade = TradeProposal(
+        symbol="BTC/USDT",
+        side="BUY",
+        quantity=0.01,
+        price=90000.0,
+        position_type="LONG"
+    )
+    is_valid, _ = await risk_manager.validate_trade(trade, snap)
+    alerts = await risk_manager.monitor_positions(snap)
+    should_trigger, _ = await risk_manager.check_circuit_breakers(snap)
+
+    assert is_valid == True
+    assert alerts == []
+    assert should_trigger == False
+
+@pytest.mark.asyncio
+async def test_flat_portfolio_skips_positions_query(test_db):
+    """Test risk checks skip the positions query while no positions are open."""
+    manager = PaperPortfolioManager(test_db, "test_flat")
+    await manager.initialize()
+    risk_manager = manager.risk_manager
+
+    await risk_manager.snapshot()
+    assert await manager.count_open_positions() == 0
+
+    calls = 0
+    original_risk_view = risk_manager.db.get_open_positions_risk_view
+
+    async def counting_risk_view(portfolio_id):
+        nonlocal calls
+        calls += 1
+        return await original_risk_view(portfolio_id)
+
+    risk_manager.db.get_open_positions_risk_view = counting_risk_view
+
+    await risk_manager.monitor_positions()
+    assert calls == 0
+
+    result = await manager.execute_signal(
+        signal={"type": "BUY", "confidence": 0.8, "symbol": "BTC/USDT"},
+        current_price=90000.0
+    )
+    assert result['executed'] == True
+
+    snap = await risk_manager.snapshot()
+    assert calls == 1
+    assert [p.symbol for p in snap.positions] == ["BTC/USDT"]
+    assert await manager.count_open_positions() == 1
+
+@pytest.mark.asyncio
+async def test_stale_empty_book_rechecked_against_database(test_db):
+    """Test a cached zero count picks up positions opened by another manager."""
+    scanner_manager = PaperPortfolioManager(test_db, "test_shared")
+    await scanner_manager.initialize()
+    risk_manager = scanner_manager.risk_manager
+
+    snap = await risk_manager.snapshot()
+    assert snap.positions == []
+
+    other_manager = PaperPortfolioManager(test_db, "test_shared")
+    await other_manager.initialize()
+    result = await other_manager.execute_signal(
+        signal={"type": "BUY", "confidence": 0.8, "symbol": "BTC/USDT"},
+        current_price=90000.0
+    )
+    assert result['executed'] == True
+
+    # Within the TTL the zero shortcut still applies
+    snap = await risk_manager.snapshot()
+    assert snap.positions == []
+
+    # Once stale, the count is re-checked and the new position is seen
+    risk_manager._open_position_count_at -= risk_manager.EMPTY_BOOK_TTL_SECONDS
+    snap = await risk_manager.snapshot()
+    assert [p.symbol for p in snap.positions] == ["BTC/USDT"]
+
+    await other_manager.close()
+    await scanner_manager.close()
+
+def test_total_exposure_small_and_vectorized_paths_agree():
+    """Test the Python and NumPy exposure paths give the same total."""
+    positions = [
+        PositionRiskView(f"S{i}/USDT", 0.5 + i, 100.0 + i, None, None, "LONG")
+        for i in range(40)
+    ]
+    expected = sum(p.quantity * p.current_price for p in positions)
+
+    assert _total_exposure(positions) == pytest.approx(expected)
+    assert _total_exposure(positions[:3]) == pytest.approx(
+        sum(p.quantity * p.current_price for p in positions[:3])
+    )
+    assert _total_exposure([]) == 0
+
+@pytest.mark.asyncio
+async def test_paper_trade_tool_closes_manager_on_error(test_db, monkeypatch):
+    """Test the paper trade tool closes its manager when execution fails."""
+    from src.agent.tools import paper_trading_tools
+
+    managers = []
+
+    class FailingManager(PaperPortfolioManager):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.closed = False
+            managers.append(self)
+
+        async def execute_signal(self, *args, **kwargs):
+            raise RuntimeError("exchange unavailable")
+
+        async def close(self):
+            self.closed = True
+            await super().close()
+
+    monkeypatch.setenv("DB_PATH", str(test_db))
+    monkeypatch.setattr(paper_trading_tools, "PaperPortfolioManager", FailingManager)
+
+    result = await paper_trading_tools.execute_paper_trade.handler({
+        "portfolio_name": "test_tool",
+        "symbol": "BTC/USDT",
+        "signal": {"type": "BUY", "confidence": 0.8, "symbol": "BTC/USDT"},
+        "current_price": 90000.0,
+    })
+
+    assert result["is_error"] is True
+    assert [m.closed for m in managers] == [True]
+
 # Run tests if executed directly
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -257,3 +257,43 @@ async def test_pipeline_no_callback(db_ops, mock_agents):
     )
 
     assert result.status == "NO_TRADE"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_flushes_queued_outputs(db_ops, mock_agents):
+    """Test outputs queued by an agent's own db_ops are saved once the run returns."""
+    analysis, risk, execution, pnl = mock_agents
+    # The agent writes through a separate instance on the same database
+    analysis.db_ops = AgentOperations(db_ops.db_path)
+
+    async def queue_output(session_id, symbol, input_data):
+        analysis.db_ops.queue_agent_output(
+            session_id=session_id,
+            symbol=symbol,
+            agent_type="analysis",
+            input_json="{}",
+            output_json="{}",
+            tokens_used=0,
+            duration_ms=1
+        )
+        return {"analysis_report": {"symbol": symbol}, "proposed_signal": None}
+
+    analysis.run_with_tracking.side_effect = queue_output
+
+    orchestrator = PipelineOrchestrator(
+        analysis_agent=analysis,
+        risk_auditor=risk,
+        execution_agent=execution,
+        pnl_auditor=pnl,
+        db_ops=db_ops
+    )
+
+    await orchestrator.run_pipeline(
+        session_id="test-123",
+        symbol="BTCUSDT",
+        momentum_data={"1h": 5.0, "4h": 10.0}
+    )
+
+    assert not analysis.db_ops._pending_outputs
+    assert analysis.db_ops._output_timer is None
+    assert len(await db_ops.get_agent_outputs_by_session("test-123")) == 1
@@ -0,0 +1,82 @@
+import pytest
+import aiosqlite
+from src.agent.database.schema import init_database
+from src.agent.tools import portfolio
+from src.agent.tools.portfolio import update_portfolio, calculate_pnl, close_db
+
+@pytest.mark.asyncio
+async def test_portfolio_tools_share_one_connection(tmp_path, monkeypatch):
+    """Test update_portfolio and calculate_pnl reuse the shared connection."""
+    db_path = tmp_path / "trading.db"
+    await init_database(db_path)
+    monkeypatch.setenv("DB_PATH", str(db_path))
+
+    try:
+        await update_portfolio.handler({
+            'symbol': 'BTC/USDT',
+            'position_type': 'LONG',
+            'entry_price': 100.0,
+            'quantity': 2.0,
+            'stop_loss': 90.0,
+            'take_profit': 120.0,
+        })
+        db = portfolio._db
+
+        result = await calculate_pnl.handler({'symbol': 'BTC/USDT', 'current_price': 110.0})
+
+        assert result['pnl']['unrealized_pnl'] == 20.0
+        assert portfolio._db is db
+    finally:
+        await close_db()
+
+    assert portfolio._db is None
+
+@pytest.mark.asyncio
+async def test_calculate_pnl_updates_position_in_place(tmp_path, monkeypatch):
+    """Test calculate_pnl stores the new price and P&L and skips NONE rows."""
+    db_path = tmp_path / "trading.db"
+    await init_database(db_path)
+    monkeypatch.setenv("DB_PATH", str(db_path))
+
+    try:
+        for symbol, position_type in (('ETH/USDT', 'SHORT'), ('SOL/USDT', 'NONE')):
+            await update_portfolio.handler({
+                'symbol': symbol,
+                'position_type': position_type,
+                'entry_price': 200.0,
+                'quantity': 3.0,
+            })
+
+        result = await calculate_pnl.handler({'symbol': 'ETH/USDT', 'current_price': 190.0})
+        assert result['pnl']['unrealized_pnl'] == 30.0
+        assert result['pnl']['pnl_percentage'] == 5.0
+
+        result = await calculate_pnl.handler({'symbol': 'SOL/USDT', 'current_price': 190.0})
+        assert 'No active position' in result['content'][0]['text']
+
+        result = await calculate_pnl.handler({'symbol': 'XRP/USDT', 'current_price': 1.0})
+        assert 'No position found' in result['content'][0]['text']
+
+        db = await portfolio._get_db()
+        async with db.execute(
+            "SELECT symbol, current_price, unrealized_pnl FROM portfolio_state ORDER BY symbol"
+        ) as cursor:
+            rows = [tuple(row) for row in await cursor.fetchall()]
+        assert rows == [('ETH/USDT', 190.0, 30.0), ('SOL/USDT', 200.0, None)]
+    finally:
+        await close_db()
+
+@pytest.mark.asyncio
+async def test_portfolio_symbol_lookup_uses_unique_index(tmp_path):
+    """Test symbol lookups hit the UNIQUE(symbol) index rather than scanning."""
+    db_path = tmp_path / "trading.db"
+    await init_database(db_path)
+
+    async with aiosqlite.connect(db_path) as db:
+        async with db.execute(
+            "EXPLAIN QUERY PLAN UPDATE portfolio_state SET current_price = 1 WHERE symbol = ?",
+            ('BTC/USDT',)
+        ) as cursor:
+            plan = ' '.join(row[-1] for row in await cursor.fetchall())
+
+    assert 'USING INDEX sqlite_autoindex_portfolio_state_1' in plan
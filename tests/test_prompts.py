@@ -1,5 +1,9 @@
 import pytest
-from src.agent.scanner.prompts import PromptBuilder
+from src.agent.scanner.prompts import (
+    ANALYSIS_TASK_INSTRUCTIONS,
+    PromptBuilder,
+    build_scanner_system_prompt,
+)
 
 def test_build_analysis_prompt():
     """Test building agent analysis prompt."""
@@ -25,10 +29,20 @@ def test_build_analysis_prompt():
     assert 'SOLUSDT' in prompt
     assert 'LONG' in prompt
     assert '+7.2' in prompt  # Check for the value (works with both 7.2% and 7.20%)
-    assert 'multi-timeframe' in prompt.lower()
-    assert 'web search' in prompt.lower()  # Updated from 'perplexity' after OpenWebSearch MCP migration
-    assert 'confidence' in prompt.lower()
-    assert '60' in prompt  # Min confidence threshold
+    assert 'submit_trading_signal' in prompt
+    # Static task instructions are sent once via the system prompt
+    assert ANALYSIS_TASK_INSTRUCTIONS not in prompt
+
+def test_system_prompt_carries_analysis_instructions():
+    """Test the cached system prompt holds the static per-mover instructions."""
+    for use_sentiment in (True, False):
+        system_prompt = build_scanner_system_prompt(use_sentiment)
+
+        assert system_prompt.endswith(ANALYSIS_TASK_INSTRUCTIONS)
+        assert 'multi-timeframe' in system_prompt.lower()
+        assert 'web search' in system_prompt.lower()  # Updated from 'perplexity' after OpenWebSearch MCP migration
+        assert 'confidence' in system_prompt.lower()
+        assert '60' in system_prompt  # Min confidence threshold
 
 def test_build_reanalysis_prompt():
     """Test building position re-analysis prompt."""
@@ -51,3 +65,10 @@ def test_build_reanalysis_prompt():
     assert '90000' in prompt or '90,000' in prompt
     assert 'confidence' in prompt.lower()
     assert 'sentiment changed' in prompt.lower()
+
+
+def test_system_prompts_are_built_once():
+    """Test both system prompt variants are precomputed constants."""
+    assert build_scanner_system_prompt(True) is build_scanner_system_prompt(True)
+    assert build_scanner_system_prompt(False) is build_scanner_system_prompt(False)
+    assert build_scanner_system_prompt(True) != build_scanner_system_prompt(False)
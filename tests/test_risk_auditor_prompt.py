@@ -3,6 +3,7 @@
 import pytest
 
 from src.agent.agents.prompts.risk_auditor_prompt import (
+    _portfolio_json,
     build_risk_auditor_prompt,
     RISK_AUDITOR_SYSTEM_PROMPT
 )
@@ -52,3 +53,17 @@ def test_risk_auditor_mentions_actions():
     assert "APPROVE" in RISK_AUDITOR_SYSTEM_PROMPT
     assert "REJECT" in RISK_AUDITOR_SYSTEM_PROMPT
     assert "MODIFY" in RISK_AUDITOR_SYSTEM_PROMPT
+
+
+def test_risk_auditor_prompt_reuses_portfolio_json_for_same_snapshot():
+    """Test identical flat snapshots share one serialization, typed by value."""
+    _portfolio_json.cache_clear()
+    analysis = {"analysis_report": {"symbol": "BTCUSDT"}, "proposed_signal": {}}
+
+    build_risk_auditor_prompt(analysis, {"equity": 10000, "open_positions": 1})
+    build_risk_auditor_prompt(analysis, {"equity": 10000, "open_positions": 1})
+    prompt = build_risk_auditor_prompt(analysis, {"equity": 10000.0, "open_positions": 1})
+
+    info = _portfolio_json.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+    assert '"equity": 10000.0' in prompt
@@ -35,3 +35,24 @@ def test_correlation_groups():
     assert 'BTC' in config.correlation_groups['BTC_CORRELATED']
     assert 'ETH' in config.correlation_groups['BTC_CORRELATED']
     assert 'DEFI' in config.correlation_groups
+
+def test_correlation_group_reverse_index():
+    """Test symbols resolve to their correlation groups by base asset."""
+    config = RiskConfig()
+
+    assert config.get_correlation_groups('BTC/USDT:USDT') == {'BTC_CORRELATED'}
+    assert config.get_correlation_groups('ETHUSDT') == {'BTC_CORRELATED'}
+    assert config.get_correlation_groups('MATIC/USDT') == {'BTC_CORRELATED', 'LAYER2'}
+    assert config.get_correlation_groups('1000PEPEUSDT') == {'MEME'}
+    assert config.get_correlation_groups('XYZUSDT') == frozenset()
+
+def test_risk_pct_lookup_matches_tiers():
+    """Test the precomputed risk table agrees with the tier boundaries."""
+    config = RiskConfig()
+
+    assert config.get_risk_pct_for_confidence(80) == 2.5
+    assert config.get_risk_pct_for_confidence(79) == 1.5
+    assert config.get_risk_pct_for_confidence(60) == 1.5
+    assert config.get_risk_pct_for_confidence(59) == 0.0
+    assert config.get_risk_pct_for_confidence(101) == 0.0
+    assert config.get_risk_pct_for_confidence(85.0) == 2.5
@@ -126,3 +126,11 @@ async def test_reject_correlation_limit():
 
     assert result['valid'] is False
     assert 'group' in result['reason'].lower() or 'correlated' in result['reason'].lower()
+
+def test_can_accept_new_position():
+    """Test the pre-analysis check against position and exposure limits."""
+    validator = RiskValidator(RiskConfig(), AsyncMock())
+
+    assert validator.can_accept_new_position({'open_positions': 4, 'exposure_pct': 20.0})
+    assert not validator.can_accept_new_position({'open_positions': 5, 'exposure_pct': 0.0})
+    assert not validator.can_accept_new_position({'open_positions': 0, 'exposure_pct': 25.0})
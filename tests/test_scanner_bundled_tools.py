@@ -218,3 +218,99 @@ async def test_fetch_sentiment_data_web_search_failure():
         # Verify error message contains symbol and original error
         assert "BTCUSDT" in str(exc_info.value)
         assert "Web search" in str(exc_info.value)
+
+
+def test_tool_descriptions_are_dedented():
+    """Test tool descriptions carry no source indentation into the tool definitions."""
+    import inspect
+
+    for scanner_tool in (fetch_technical_snapshot, fetch_sentiment_data):
+        assert scanner_tool.description == inspect.cleandoc(scanner_tool.description)
+        assert not scanner_tool.description.startswith((' ', '\n'))
+
+
+@pytest.mark.asyncio
+async def test_submit_trading_signal_validates_args():
+    """Test out-of-range scores and empty text are rejected before queueing."""
+    from src.agent.scanner.tools import (
+        submit_trading_signal, set_signal_queue, clear_signal_queue
+    )
+
+    queue = MagicMock()
+    set_signal_queue(queue)
+    args = {
+        "confidence": 72, "entry_price": 100.0, "stop_loss": 95.0, "tp1": 110.0,
+        "technical_score": 30.0, "sentiment_score": 20.0, "liquidity_score": 15.0,
+        "correlation_score": 7.0, "symbol": "BTC/USDT", "analysis": "Breakout",
+    }
+    try:
+        result = await submit_trading_signal.handler({**args, "confidence": 101, "analysis": " "})
+        assert result["status"] == "error"
+        assert "confidence" in result["error"]
+        assert "analysis" in result["error"]
+        queue.put_nowait.assert_not_called()
+
+        result = await submit_trading_signal.handler(args)
+        assert result["status"] == "success"
+        queue.put_nowait.assert_called_once_with(args)
+    finally:
+        clear_signal_queue()
+
+
+@pytest.mark.asyncio
+async def test_fetch_technical_snapshot_times_out_slow_fetches():
+    """Test a hanging fetch becomes a warning instead of stalling the snapshot."""
+    import asyncio
+    import json
+
+    async def fetch(symbol, timeframe, limit=50):
+        if timeframe == "4h":
+            await asyncio.sleep(10)
+        return []
+
+    with patch('src.agent.scanner.tools.fetch_market_data_internal', side_effect=fetch), \
+         patch('src.agent.scanner.tools.get_current_price_internal', AsyncMock(return_value=100.0)):
+
+        result = await asyncio.wait_for(
+            fetch_technical_snapshot.handler({"symbol": "BTCUSDT", "timeout": 0.05}),
+            timeout=2
+        )
+
+    data = json.loads(result["content"][0]["text"])
+    assert data["current_price"] == 100.0
+    assert data["timeframes"]["4h"]["status"] == "failed"
+    assert any("4h data fetch failed: timed out" in w for w in data["warnings"])
+
+
+@pytest.mark.asyncio
+async def test_fetch_sentiment_data_reuses_recent_analysis():
+    """Test sentiment is reused within the TTL for the same symbol and move direction."""
+    from src.agent.scanner.config import ScannerConfig
+    from src.agent.scanner.tools import set_scanner_config, clear_sentiment_cache
+
+    set_scanner_config(ScannerConfig(sentiment_cache_ttl_seconds=900))
+    clear_sentiment_cache()
+    try:
+        with patch('src.agent.scanner.tools.generate_sentiment_query_internal',
+                   AsyncMock(return_value="SOL news")), \
+             patch('src.agent.scanner.tools.execute_web_search_internal',
+                   AsyncMock(return_value=[{"title": "t", "snippet": "s", "url": "u"}])), \
+             patch('src.agent.scanner.tools.analyze_sentiment_with_llm',
+                   AsyncMock(return_value={
+                       "sentiment_summary": "Neutral", "sentiment_score": 15, "key_findings": []
+                   })) as mock_llm:
+
+            first = await fetch_sentiment_data.handler({"symbol": "SOLUSDT", "context": "6% up in 1h"})
+            second = await fetch_sentiment_data.handler({"symbol": "SOLUSDT", "context": "7% up in 1h"})
+            assert second == first
+            assert mock_llm.await_count == 1
+
+            # A move in the other direction is analyzed afresh
+            await fetch_sentiment_data.handler({"symbol": "SOLUSDT", "context": "6% down in 1h"})
+            assert mock_llm.await_count == 2
+
+            await fetch_sentiment_data.handler({"symbol": "SOLUSDT", "context": "latest listing news"})
+            assert mock_llm.await_count == 3
+    finally:
+        clear_sentiment_cache()
+        set_scanner_config(None)
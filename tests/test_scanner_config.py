@@ -17,7 +17,23 @@ def test_scanner_config_from_env(monkeypatch):
     monkeypatch.setenv('SCAN_INTERVAL', '600')
     monkeypatch.setenv('MOVER_THRESHOLD', '7.0')
 
-    config = ScannerConfig()
+    config = ScannerConfig.from_env(use_sentiment=False)
 
     assert config.scan_interval_seconds == 600
     assert config.mover_threshold_pct == 7.0
+    assert config.use_sentiment is False
+
+    # Plain construction keeps the values resolved at import
+    assert ScannerConfig().scan_interval_seconds == 300
+
+def test_scanner_package_exports_resolve_lazily():
+    """Test package-level scanner exports resolve to their submodule classes."""
+    import src.agent.scanner as scanner
+    from src.agent.scanner.main_loop import MarketMoversScanner
+
+    assert scanner.ScannerConfig is ScannerConfig
+    assert scanner.MarketMoversScanner is MarketMoversScanner
+    assert set(scanner.__all__) <= set(dir(scanner))
+
+    with pytest.raises(AttributeError):
+        scanner.NotAScannerExport
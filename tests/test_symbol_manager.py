@@ -92,3 +92,59 @@ def test_should_refresh_logic():
     # Test 3: Returns True after interval expires
     manager.last_refresh = datetime.now() - timedelta(minutes=61)
     assert manager.should_refresh(refresh_interval_minutes=60) is True
+
+@pytest.mark.asyncio
+async def test_refresh_symbols_fetches_tickers_in_chunks():
+    """Test tickers are fetched per chunk and fall back to one request on error."""
+    markets = {
+        f'C{i}/USDT': {'type': 'swap', 'quote': 'USDT', 'info': {'quoteCoin': 'USDT'}}
+        for i in range(5)
+    }
+    all_tickers = {symbol: {'quoteVolume': 10_000_000} for symbol in markets}
+
+    async def fetch_tickers(symbols):
+        return {symbol: all_tickers[symbol] for symbol in symbols}
+
+    mock_exchange = AsyncMock()
+    mock_exchange.load_markets = AsyncMock(return_value=markets)
+    mock_exchange.fetch_tickers = AsyncMock(side_effect=fetch_tickers)
+
+    manager = FuturesSymbolManager(mock_exchange, ticker_chunk_size=2)
+    symbols = await manager.refresh_symbols()
+
+    assert set(symbols) == set(markets)
+    assert mock_exchange.fetch_tickers.await_count == 3
+
+    # A rejected chunk falls back to a single full request
+    mock_exchange.fetch_tickers = AsyncMock(
+        side_effect=[Exception("not supported")] + [all_tickers] * 3
+    )
+    symbols = await manager.refresh_symbols()
+
+    assert set(symbols) == set(markets)
+    mock_exchange.fetch_tickers.assert_awaited_with(list(markets))
+
+@pytest.mark.asyncio
+async def test_symbols_cache_round_trip(tmp_path):
+    """Test refreshed symbols are persisted and reloaded within the TTL."""
+    cache_path = tmp_path / 'symbols.json'
+    mock_exchange = AsyncMock()
+    mock_exchange.load_markets = AsyncMock(return_value={
+        'BTC/USDT': {'type': 'swap', 'quote': 'USDT', 'info': {'quoteCoin': 'USDT'}},
+    })
+    mock_exchange.fetch_tickers = AsyncMock(return_value={
+        'BTC/USDT': {'quoteVolume': 10_000_000},
+    })
+
+    manager = FuturesSymbolManager(mock_exchange, cache_path=cache_path)
+    await manager.refresh_symbols()
+    assert cache_path.exists()
+
+    # A new process within the TTL loads the cache without touching the network
+    reloaded = FuturesSymbolManager(AsyncMock(), cache_path=cache_path)
+    assert set(reloaded.get_symbols()) == {'BTC/USDT'}
+    assert reloaded.should_refresh() is False
+
+    # A different volume threshold or an expired file is ignored
+    assert FuturesSymbolManager(AsyncMock(), min_volume_usd=1, cache_path=cache_path).get_symbols() == {}
+    assert FuturesSymbolManager(AsyncMock(), cache_path=cache_path, cache_ttl_minutes=0).get_symbols() == {}
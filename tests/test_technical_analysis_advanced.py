@@ -2,6 +2,9 @@
 import pytest
 import asyncio
 from src.agent.tools.technical_analysis import (
+    analyze_technicals,
+    clear_technicals_cache,
+    _technicals_cache,
     analyze_trend,
     analyze_momentum,
     analyze_volatility,
@@ -39,6 +42,41 @@ def generate_ohlcv_data(periods=200, start_price=40000):
     return data
 
 
+# ============================================================================
+# TEST analyze_technicals() memoization
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_analyze_technicals_reuses_result_for_same_candles():
+    """Test identical candles are served from the cache, changed ones are not."""
+    ohlcv = generate_ohlcv_data(100)
+    args = {'ohlcv_data': ohlcv, 'symbol': 'BTCUSDT', 'timeframe': '4h'}
+
+    clear_technicals_cache()
+    try:
+        first = await analyze_technicals.handler(args)
+        second = await analyze_technicals.handler(dict(args, ohlcv_data=[dict(row) for row in ohlcv]))
+        assert 'is_error' not in first
+        assert second == first
+        assert second is not first
+        assert len(_technicals_cache) == 1
+
+        # Mutating a returned result must not leak into later cache hits
+        second['indicators']['price'] = -1
+        third = await analyze_technicals.handler(args)
+        assert third == first
+
+        ohlcv[-1] = dict(ohlcv[-1], close=ohlcv[-1]['close'] + 500)
+        changed = await analyze_technicals.handler(dict(args, ohlcv_data=ohlcv))
+        assert changed['indicators']['price'] == ohlcv[-1]['close']
+        assert len(_technicals_cache) == 2
+
+        await analyze_technicals.handler(dict(args, timeframe='1d'))
+        assert len(_technicals_cache) == 3
+    finally:
+        clear_technicals_cache()
+
+
 # ============================================================================
 # TEST analyze_trend()
 # ============================================================================
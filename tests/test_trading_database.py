@@ -0,0 +1,29 @@
+"""Tests for TradingDatabase operations."""
+import pytest
+
+from src.agent.database.operations import TradingDatabase
+from src.agent.database.schema import init_database
+
+
+@pytest.mark.asyncio
+async def test_operations_share_one_wal_connection(tmp_path):
+    """Test writes and reads reuse a single WAL-mode connection."""
+    db_path = tmp_path / 'trading.db'
+    await init_database(db_path)
+    db = TradingDatabase(db_path)
+
+    try:
+        await db.save_signal(
+            'BTC/USDT', 'BUY', 0.8, 50000.0, '1h', 'test', {'rsi': 30}, {}
+        )
+        conn = db._conn
+        signals = await db.get_recent_signals('BTC/USDT')
+
+        assert db._conn is conn
+        assert signals[0]['signal_type'] == 'BUY'
+        async with conn.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == 'wal'
+    finally:
+        await db.close()
+
+    assert db._conn is None